@@ -148,6 +148,10 @@ _DEFAULT = ModelCapabilities(
 )
 
 
+# Bumped by register_model so callers can cache derived views of the registry
+_version = 0
+
+
 # ── Public API ───────────────────────────────────────────────────────────
 
 
@@ -163,7 +167,14 @@ def get_capabilities_or_none(model: str) -> ModelCapabilities | None:
 
 def register_model(model: str, capabilities: ModelCapabilities) -> None:
     """Register or update capabilities for a model."""
+    global _version
     _REGISTRY[model] = capabilities
+    _version += 1
+
+
+def registry_version() -> int:
+    """Return a counter that changes whenever the registry is modified."""
+    return _version
 
 
 def list_known_models() -> list[str]:
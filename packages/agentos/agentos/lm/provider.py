@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -14,6 +15,13 @@ class LMMessage(BaseModel):
 
     role: str = Field(description="Message role: system, user, or assistant")
     content: str = Field(description="Message content")
+    cacheable: bool = Field(
+        default=False,
+        description=(
+            "Hint that this message is a stable prompt prefix. Providers with "
+            "explicit prompt caching mark it cacheable; others ignore it"
+        ),
+    )
 
 
 class LMResponse(BaseModel):
@@ -81,6 +89,14 @@ class BaseLMProvider(ABC):
         """
         return self.complete(messages)
 
+    async def acomplete(self, messages: list[LMMessage]) -> LMResponse:
+        """Async variant of ``complete`` that does not block the event loop.
+
+        The default runs ``complete`` on a worker thread. Providers with a
+        native async client may override this.
+        """
+        return await asyncio.to_thread(self.complete, messages)
+
     def get_model_name(self) -> str:
         """Return the underlying model identifier (e.g., 'gpt-4o')."""
         return self.name
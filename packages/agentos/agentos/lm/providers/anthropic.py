@@ -63,17 +63,50 @@ class AnthropicProvider(BaseLMProvider):
 
     def _split_system(
         self, messages: list[LMMessage]
-    ) -> tuple[str, list[dict[str, str]]]:
-        """Separate system message from conversation (Anthropic API requirement)."""
-        system = ""
+    ) -> tuple[str | list[dict[str, Any]], list[dict[str, str]]]:
+        """Separate system message from conversation (Anthropic API requirement).
+
+        A system message flagged ``cacheable`` is sent as a text block with
+        ``cache_control`` so Anthropic caches the prompt prefix up to it.
+        """
+        system: str | list[dict[str, Any]] = ""
         api_messages: list[dict[str, str]] = []
         for m in messages:
             if m.role == "system":
-                system = m.content
+                if m.cacheable:
+                    system = [
+                        {
+                            "type": "text",
+                            "text": m.content,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ]
+                else:
+                    system = m.content
             else:
                 api_messages.append({"role": m.role, "content": m.content})
         return system, api_messages
 
+    @staticmethod
+    def _to_response(response: Any, content: str) -> LMResponse:
+        """Build an LMResponse, counting cache reads and writes as prompt tokens.
+
+        Anthropic reports cached prompt tokens separately from
+        ``input_tokens``, so they are added back for budget accounting.
+        """
+        usage = response.usage
+        prompt_tokens = (
+            usage.input_tokens
+            + (getattr(usage, "cache_read_input_tokens", None) or 0)
+            + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+        )
+        return LMResponse(
+            content=content,
+            tokens_used=prompt_tokens + usage.output_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=usage.output_tokens,
+        )
+
     def complete(self, messages: list[LMMessage]) -> LMResponse:
         """Generate a completion using the Anthropic messages API."""
         system, api_messages = self._split_system(messages)
@@ -94,12 +127,7 @@ class AnthropicProvider(BaseLMProvider):
             if block.type == "text":
                 content += block.text
 
-        return LMResponse(
-            content=content,
-            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
-            prompt_tokens=response.usage.input_tokens,
-            completion_tokens=response.usage.output_tokens,
-        )
+        return self._to_response(response, content)
 
     def generate_structured(
         self,
@@ -154,12 +182,7 @@ class AnthropicProvider(BaseLMProvider):
             elif block.type == "text":
                 content += block.text
 
-        return LMResponse(
-            content=content,
-            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
-            prompt_tokens=response.usage.input_tokens,
-            completion_tokens=response.usage.output_tokens,
-        )
+        return self._to_response(response, content)
 
     @staticmethod
     def _convert_tool_schemas(
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import logging
 import threading
-import time
 from collections import deque
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from agentos.core.errors import TaskExecutionError
 from agentos.core.identifiers import RunId, generate_run_id
@@ -23,6 +25,8 @@ class DAGWorkflow:
     def __init__(self, name: str, tasks: list[TaskNode] | None = None) -> None:
         self.name = name
         self.tasks: list[TaskNode] = tasks or []
+        # (graph fingerprint, validated order); see ``_fingerprint``
+        self._order: tuple[tuple[tuple[int, ...], ...], list[TaskNode]] | None = None
 
     def add_task(self, task: TaskNode) -> None:
         """Add a task to the DAG."""
@@ -33,37 +37,51 @@ class DAGWorkflow:
 
         Raises TaskExecutionError on invalid graph.
         """
-        task_set = set(id(t) for t in self.tasks)
-        for task in self.tasks:
-            for dep in task.depends_on:
-                if id(dep) not in task_set:
-                    raise TaskExecutionError(
-                        f"Task '{task.name}' depends on '{dep.name}' which is not in the workflow"
-                    )
+        self.validated_order()
 
-        # Cycle detection via Kahn's algorithm
-        in_degree: dict[int, int] = {id(t): 0 for t in self.tasks}
-        adjacency: dict[int, list[int]] = {id(t): [] for t in self.tasks}
-        for task in self.tasks:
-            for dep in task.depends_on:
-                adjacency[id(dep)].append(id(task))
-                in_degree[id(task)] += 1
+    def validated_order(self) -> list[TaskNode]:
+        """Validate the DAG and return a topological order in one Kahn pass.
 
-        queue = deque(tid for tid, deg in in_degree.items() if deg == 0)
-        visited = 0
-        while queue:
-            current = queue.popleft()
-            visited += 1
-            for neighbor in adjacency[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        The order is cached against a fingerprint of the task and dependency
+        identities, so ``validate``, ``topological_order`` and
+        ``max_parallelism`` share a single pass, and any change to ``tasks``
+        or a task's ``depends_on`` (via ``add_task`` or direct mutation)
+        triggers revalidation.
+        Raises TaskExecutionError on invalid graph.
+        """
+        fingerprint = self._fingerprint()
+        if self._order is None or self._order[0] != fingerprint:
+            task_set = set(id(t) for t in self.tasks)
+            for task in self.tasks:
+                for dep in task.depends_on:
+                    if id(dep) not in task_set:
+                        raise TaskExecutionError(
+                            f"Task '{task.name}' depends on '{dep.name}' "
+                            "which is not in the workflow"
+                        )
 
-        if visited != len(self.tasks):
-            raise TaskExecutionError(f"DAG '{self.name}' contains a cycle")
+            order = self._kahn()
+            if len(order) != len(self.tasks):
+                raise TaskExecutionError(f"DAG '{self.name}' contains a cycle")
+            self._order = (fingerprint, order)
+        return list(self._order[1])
 
     def topological_order(self) -> list[TaskNode]:
         """Return tasks in a valid topological order (Kahn's algorithm)."""
+        if self._order is not None and self._order[0] == self._fingerprint():
+            return list(self._order[1])
+        return self._kahn()
+
+    def _fingerprint(self) -> tuple[tuple[int, ...], ...]:
+        """Identity of every task followed by its dependencies, in order.
+
+        Linear in tasks plus edges, which is cheaper than the sorting Kahn
+        pass it guards.
+        """
+        return tuple((id(t), *map(id, t.depends_on)) for t in self.tasks)
+
+    def _kahn(self) -> list[TaskNode]:
+        """Run Kahn's algorithm; tasks on a cycle are left out of the result."""
         in_degree: dict[int, int] = {id(t): 0 for t in self.tasks}
         adjacency: dict[int, list[int]] = {id(t): [] for t in self.tasks}
         id_to_task: dict[int, TaskNode] = {id(t): t for t in self.tasks}
@@ -89,75 +107,116 @@ class DAGWorkflow:
 
         return result
 
+    def max_parallelism(self) -> int:
+        """Return the widest level of the DAG's longest-path layering.
+
+        Each task's level is the length of the longest dependency chain
+        leading to it; tasks on the same level never depend on each other,
+        so the widest level is a useful worker count for ``DAGExecutor``.
+        Returns 1 for an empty DAG. Raises TaskExecutionError on invalid graph.
+        """
+        level: dict[int, int] = {}
+        for task in self.validated_order():
+            level[id(task)] = max(
+                (level[id(dep)] + 1 for dep in task.depends_on), default=0
+            )
+        widths: dict[int, int] = {}
+        for lvl in level.values():
+            widths[lvl] = widths.get(lvl, 0) + 1
+        return max(widths.values(), default=1)
+
 
 class DAGExecutor:
     """Executes a DAGWorkflow respecting dependencies with controlled parallelism."""
 
-    def __init__(self, event_log: EventLog, *, max_parallel: int = 1) -> None:
+    def __init__(
+        self,
+        event_log: EventLog,
+        *,
+        max_parallel: int = 1,
+        batch_events: bool = False,
+    ) -> None:
         self._event_log = event_log
         self._max_parallel = max_parallel
-
-    def _next_seq(self, seq_counter: list[int], lock: threading.Lock) -> int:
-        with lock:
-            val = seq_counter[0]
-            seq_counter[0] += 1
-            return val
+        self._batch_events = batch_events
 
     def _execute_task(
         self,
         task: TaskNode,
         run_id: RunId,
-        seq_counter: list[int],
-        lock: threading.Lock,
+        next_seq: Callable[[], int],
     ) -> None:
-        """Execute a single task, emitting events."""
-        seq = self._next_seq(seq_counter, lock)
-        task.state = TaskState.RUNNING
-        self._event_log.append(
-            TaskStarted(
-                run_id=run_id,
-                seq=seq,
-                payload={"task_id": task.id, "task_name": task.name},
-            )
+        """Execute a single task, emitting events.
+
+        With ``batch_events`` the task's events (including any emitted by
+        the callable itself) are committed together when it finishes.
+        """
+        guard = (
+            self._event_log.batch()
+            if self._batch_events
+            else contextlib.nullcontext()
         )
+        with guard:
+            task.state = TaskState.RUNNING
+            self._event_log.append(
+                TaskStarted(
+                    run_id=run_id,
+                    seq=next_seq(),
+                    payload={"task_id": task.id, "task_name": task.name},
+                )
+            )
 
-        try:
-            task.result = task.callable()
-            task.state = TaskState.SUCCEEDED
-        except Exception as exc:
-            task.state = TaskState.FAILED
-            task.error = exc
-
-        seq = self._next_seq(seq_counter, lock)
-        payload: dict[str, str] = {
-            "task_id": task.id,
-            "task_name": task.name,
-            "state": task.state.value,
-        }
-        if task.error is not None:
-            payload["error"] = str(task.error)
+            try:
+                task.result = task.callable()
+                task.state = TaskState.SUCCEEDED
+            except Exception as exc:
+                task.state = TaskState.FAILED
+                task.error = exc
+
+            payload: dict[str, str] = {
+                "task_id": task.id,
+                "task_name": task.name,
+                "state": task.state.value,
+            }
+            if task.error is not None:
+                payload["error"] = str(task.error)
 
-        self._event_log.append(
-            TaskFinished(run_id=run_id, seq=seq, payload=payload)
-        )
+            self._event_log.append(
+                TaskFinished(run_id=run_id, seq=next_seq(), payload=payload)
+            )
 
-    def run(self, dag: DAGWorkflow, *, run_id: RunId | None = None) -> RunId:
+    def run(
+        self,
+        dag: DAGWorkflow,
+        *,
+        run_id: RunId | None = None,
+        seq_counter: Callable[[], int] | None = None,
+    ) -> RunId:
         """Execute the DAG respecting dependencies.
 
-        Tasks with no unmet dependencies can run in parallel up to max_parallel.
-        On any task failure, no new tasks are started; already running tasks
-        are allowed to finish. Then TaskExecutionError is raised.
+        A task is submitted as soon as its last dependency succeeds, up to
+        max_parallel at a time. On any task failure, no new tasks are
+        started; already running tasks are allowed to finish. Then
+        TaskExecutionError is raised, chained to the task's exception.
+
+        ``seq_counter`` lets callers share one sequence with events emitted
+        from inside task callables (e.g. tool calls); it is serialized
+        behind a lock. By default a fresh counter starting at 0 is used.
         """
         dag.validate()
 
         rid = run_id or generate_run_id()
-        seq_counter = [0]
+        counter = seq_counter or itertools.count(0).__next__
         lock = threading.Lock()
 
+        def next_seq() -> int:
+            with lock:
+                return counter()
+
         self._event_log.append(
             RunStarted(
                 run_id=rid,
-                seq=self._next_seq(seq_counter, lock),
+                seq=next_seq(),
                 payload={"workflow": dag.name},
             )
         )
@@ -166,53 +225,50 @@ class DAGExecutor:
             self._event_log.append(
                 RunFinished(
                     run_id=rid,
-                    seq=self._next_seq(seq_counter, lock),
+                    seq=next_seq(),
                     payload={"workflow": dag.name, "outcome": "SUCCEEDED"},
                 )
             )
             return rid
 
-        pending = set(id(t) for t in dag.tasks)
-        id_to_task = {id(t): t for t in dag.tasks}
+        # Kahn's ready-queue: a task becomes ready when its in-degree hits 0.
+        in_degree: dict[int, int] = {id(t): len(t.depends_on) for t in dag.tasks}
+        successors: dict[int, list[TaskNode]] = {id(t): [] for t in dag.tasks}
+        for task in dag.tasks:
+            for dep in task.depends_on:
+                successors[id(dep)].append(task)
+        ready = deque(t for t in dag.tasks if in_degree[id(t)] == 0)
         failed_tasks: list[TaskNode] = []
 
         with ThreadPoolExecutor(max_workers=self._max_parallel) as pool:
             futures: dict[Future[None], TaskNode] = {}
 
-            while pending or futures:
+            while ready or futures:
                 # Submit ready tasks (only if no failures yet)
-                if not failed_tasks:
-                    ready = [
-                        id_to_task[tid]
-                        for tid in list(pending)
-                        if id_to_task[tid].is_ready
-                    ]
-                    for task in ready:
-                        pending.discard(id(task))
-                        fut = pool.submit(
-                            self._execute_task, task, rid, seq_counter, lock
-                        )
-                        futures[fut] = task
+                while ready and not failed_tasks:
+                    task = ready.popleft()
+                    fut = pool.submit(self._execute_task, task, rid, next_seq)
+                    futures[fut] = task
 
                 if not futures:
                     break
 
-                # Wait for at least one future to complete
-                done_futures = [f for f in list(futures) if f.done()]
-                if not done_futures:
-                    time.sleep(0.001)
-                    continue
-
-                for fut in done_futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
                     task = futures.pop(fut)
                     if task.state == TaskState.FAILED:
                         failed_tasks.append(task)
+                        continue
+                    for succ in successors[id(task)]:
+                        in_degree[id(succ)] -= 1
+                        if in_degree[id(succ)] == 0:
+                            ready.append(succ)
 
         if failed_tasks:
             self._event_log.append(
                 RunFinished(
                     run_id=rid,
-                    seq=self._next_seq(seq_counter, lock),
+                    seq=next_seq(),
                     payload={
                         "workflow": dag.name,
                         "outcome": "FAILED",
@@ -223,12 +279,12 @@ class DAGExecutor:
             first_fail = failed_tasks[0]
             raise TaskExecutionError(
                 f"Task '{first_fail.name}' failed: {first_fail.error}"
-            )
+            ) from first_fail.error
 
         self._event_log.append(
             RunFinished(
                 run_id=rid,
-                seq=self._next_seq(seq_counter, lock),
+                seq=next_seq(),
                 payload={"workflow": dag.name, "outcome": "SUCCEEDED"},
             )
         )
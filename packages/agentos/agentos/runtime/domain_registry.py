@@ -39,6 +39,14 @@ class WorkflowManifestEntry(BaseModel):
         default_factory=list,
         description="Role template names used by this workflow",
     )
+    role_dependencies: dict[str, list[str]] | None = Field(
+        default=None,
+        description=(
+            "Role name -> roles whose agents must finish first. Agents of "
+            "independent roles may run in parallel. None chains agent slots "
+            "in the order they are configured"
+        ),
+    )
 
 
 class DomainPackManifest(BaseModel):
@@ -90,6 +98,10 @@ class DomainRegistry:
             raise KeyError(f"Domain pack '{name}' is not registered")
         return self._packs[name]
 
+    def find_pack(self, name: str) -> DomainPackManifest | None:
+        """Look up a domain pack by name, returning None if not found."""
+        return self._packs.get(name)
+
     def has_pack(self, name: str) -> bool:
         """Check if a domain pack is registered."""
         return name in self._packs
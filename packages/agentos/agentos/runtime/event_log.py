@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
 from agentos.core.identifiers import RunId
@@ -18,6 +20,24 @@ class EventLog(ABC):
     def append(self, event: BaseEvent) -> None:
         """Append an event to the log. Must preserve ordering."""
 
+    def append_many(self, events: Sequence[BaseEvent]) -> None:
+        """Append several events in order.
+
+        Backends may override this to persist the events in one write.
+        """
+        for event in events:
+            self.append(event)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the appends made inside the block into one durable write.
+
+        Events appended inside the block become durable together when it
+        exits, including when it exits with an exception. The default
+        implementation is a no-op for backends without transactions.
+        """
+        yield
+
     @abstractmethod
     def query_by_run(self, run_id: RunId) -> list[BaseEvent]:
         """Return all events for a run, ordered by sequence number."""
@@ -26,6 +46,18 @@ class EventLog(ABC):
     def query_by_type(self, run_id: RunId, event_type: EventType) -> list[BaseEvent]:
         """Return events of a specific type for a run."""
 
+    def query_from_seq(
+        self, run_id: RunId, from_seq: int, limit: int | None = None
+    ) -> list[BaseEvent]:
+        """Return events for a run with ``seq >= from_seq``, ordered by seq.
+
+        At most ``limit`` events are returned when it is given, so callers can
+        page through a long run. Backends may override this to avoid reading
+        the events before ``from_seq``.
+        """
+        events = [e for e in self.query_by_run(run_id) if e.seq >= from_seq]
+        return events if limit is None else events[:limit]
+
     @abstractmethod
     def replay(self, run_id: RunId) -> list[BaseEvent]:
         """Return full ordered event stream for deterministic replay."""
@@ -38,7 +70,11 @@ class SQLiteEventLog(EventLog):
         self._db_path = str(db_path)
         self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
         self._lock = threading.Lock()
+        self._batch_depth = 0
+        # WAL + synchronous=NORMAL: one fsync per checkpoint instead of two per
+        # commit; a crash can lose the last commits but never corrupts the log.
         self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._create_table()
 
     def _create_table(self) -> None:
@@ -56,22 +92,53 @@ class SQLiteEventLog(EventLog):
         )
         self._conn.commit()
 
+    _INSERT_SQL = (
+        "INSERT INTO events (run_id, seq, timestamp, event_type, payload_json) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+
+    @staticmethod
+    def _to_row(event: BaseEvent) -> tuple[str, int, str, str, str]:
+        return (
+            event.run_id,
+            event.seq,
+            event.timestamp.isoformat(),
+            event.event_type.value,
+            event.model_dump_json(),
+        )
+
     def append(self, event: BaseEvent) -> None:
         """Append an event to the log. Thread-safe."""
-        payload_json = event.model_dump_json()
+        row = self._to_row(event)
         with self._lock:
-            self._conn.execute(
-                "INSERT INTO events (run_id, seq, timestamp, event_type, payload_json) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (
-                    event.run_id,
-                    event.seq,
-                    event.timestamp.isoformat(),
-                    event.event_type.value,
-                    payload_json,
-                ),
-            )
-            self._conn.commit()
+            self._conn.execute(self._INSERT_SQL, row)
+            if not self._batch_depth:
+                self._conn.commit()
+
+    def append_many(self, events: Sequence[BaseEvent]) -> None:
+        """Append several events with a single ``executemany``. Thread-safe."""
+        rows = [self._to_row(event) for event in events]
+        with self._lock:
+            self._conn.executemany(self._INSERT_SQL, rows)
+            if not self._batch_depth:
+                self._conn.commit()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer commits until the outermost ``batch()`` block exits.
+
+        Batching applies to the whole log, so appends from other threads
+        made during the block are committed with it.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._conn.commit()
 
     def _rows_to_events(self, rows: list[tuple[str, ...]]) -> list[BaseEvent]:
         return [BaseEvent.model_validate_json(row[4]) for row in rows]
@@ -96,6 +163,22 @@ class SQLiteEventLog(EventLog):
             )
             return self._rows_to_events(cursor.fetchall())
 
+    def query_from_seq(
+        self, run_id: RunId, from_seq: int, limit: int | None = None
+    ) -> list[BaseEvent]:
+        """Return events for a run with ``seq >= from_seq``, ordered by seq.
+
+        Served by the ``(run_id, seq)`` primary key, so the cost scales with
+        the number of events returned rather than the length of the run.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT run_id, seq, timestamp, event_type, payload_json "
+                "FROM events WHERE run_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (run_id, from_seq, -1 if limit is None else limit),
+            )
+            return self._rows_to_events(cursor.fetchall())
+
     def replay(self, run_id: RunId) -> list[BaseEvent]:
         """Return full ordered event stream for deterministic replay."""
         return self.query_by_run(run_id)
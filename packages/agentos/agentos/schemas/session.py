@@ -49,3 +49,8 @@ class SessionConfig(BaseModel):
         default="",
         description="Top-level task description / objective for the session",
     )
+
+    @property
+    def total_agent_count(self) -> int:
+        """Number of agent instances across all slots."""
+        return sum(s.count for s in self.agents)
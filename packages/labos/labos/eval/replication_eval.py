@@ -42,6 +42,7 @@ class DatasetDeterminismEval(EvalCase):
             tool = DatasetTool()
 
             out1 = tool.execute(DatasetInput(config=config))
+            DatasetTool.clear_cache()  # force a genuine second load
             out2 = tool.execute(DatasetInput(config=config))
 
             match = out1.record.checksum == out2.record.checksum
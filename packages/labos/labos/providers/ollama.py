@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import urllib.error
 import urllib.request
+from typing import Any
 
 from agentos.lm.provider import BaseLMProvider, LMMessage, LMResponse
 
@@ -13,7 +15,8 @@ class OllamaProvider(BaseLMProvider):
     """LM provider backed by a local Ollama instance.
 
     Uses ``urllib.request`` (no extra dependencies) to call the Ollama
-    ``/api/chat`` endpoint.
+    ``/api/chat`` endpoint. ``acomplete``/``acomplete_batch`` run the same
+    request on worker threads so many completions can be awaited concurrently.
     """
 
     def __init__(
@@ -46,6 +49,22 @@ class OllamaProvider(BaseLMProvider):
         with urllib.request.urlopen(req, timeout=self._timeout) as resp:
             data = json.loads(resp.read())
 
+        return self._parse_response(data)
+
+    async def acomplete_batch(
+        self, batch: list[list[LMMessage]]
+    ) -> list[LMResponse]:
+        """Run several completions concurrently, preserving input order.
+
+        Uses a ``TaskGroup`` so the first failure cancels the remaining
+        requests and propagates to the caller.
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.acomplete(messages)) for messages in batch]
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    def _parse_response(data: dict[str, Any]) -> LMResponse:
         content = data["message"]["content"]
         prompt_tokens = data.get("prompt_eval_count", 0)
         completion_tokens = data.get("eval_count", 0)
@@ -1,6 +1,6 @@
 """LabOS ML replication tools."""
 
-from labos.tools._base import execute_with_events
+from labos.tools._base import execute_batch_with_events, execute_with_events
 from labos.tools.dataset import DatasetTool
 from labos.tools.plot import PlotTool
 from labos.tools.python_runner import PythonRunnerTool
@@ -13,5 +13,6 @@ __all__ = [
     "PythonRunnerTool",
     "ReportTool",
     "ReviewerTool",
+    "execute_batch_with_events",
     "execute_with_events",
 ]
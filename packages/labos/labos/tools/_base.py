@@ -2,27 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
 from pydantic import BaseModel
 
 from agentos.core.identifiers import RunId
-from agentos.integrity.hashing import hash_dict
+from agentos.integrity.hashing import hash_model
 from agentos.runtime.event_log import EventLog
-from agentos.schemas.events import ToolCallFinished, ToolCallStarted
+from agentos.schemas.events import BaseEvent, ToolCallFinished, ToolCallStarted
 from agentos.tools.base import BaseTool
 
+_M = TypeVar("_M", bound=BaseModel)
 
-class _SeqCounter:
-    """Mutable sequence counter for event ordering."""
-
-    __slots__ = ("value",)
 
-    def __init__(self, start: int = 0) -> None:
-        self.value = start
+def _coerce(model_cls: type[_M], data: BaseModel) -> _M:
+    """Return *data* as a ``model_cls`` instance.
 
-    def next(self) -> int:
-        v = self.value
-        self.value += 1
-        return v
+    Instances already of the right type pass through untouched; any other
+    model is validated straight from its attributes, avoiding a
+    ``model_dump()`` → dict → ``model_validate`` round-trip.
+    """
+    if isinstance(data, model_cls):
+        return data
+    return model_cls.model_validate(data, from_attributes=True)
 
 
 def execute_with_events(
@@ -30,50 +36,89 @@ def execute_with_events(
     input_data: BaseModel,
     event_log: EventLog,
     run_id: RunId,
-    seq_counter: _SeqCounter,
+    seq_counter: Callable[[], int],
+    *,
+    hash_inputs: bool = True,
+    hash_outputs: bool = True,
+    lock: threading.Lock | None = None,
 ) -> BaseModel:
-    """Execute a tool and emit ToolCallStarted/Finished events around it."""
-    input_hash = hash_dict(input_data.model_dump())
-
-    event_log.append(
-        ToolCallStarted(
-            run_id=run_id,
-            seq=seq_counter.next(),
-            payload={
-                "tool_name": tool.name,
-                "tool_version": tool.version,
-                "input_hash": input_hash,
-                "side_effect": tool.side_effect.value,
-            },
-        )
-    )
+    """Execute a tool and emit ToolCallStarted/Finished events around it.
+
+    ``seq_counter`` hands out event sequence numbers, typically the bound
+    ``itertools.count(start).__next__`` shared by the whole run.
+
+    ``hash_inputs``/``hash_outputs`` may be turned off for throughput-oriented
+    runs that do not need replay verification; the corresponding
+    ``input_hash``/``output_hash`` key is then omitted from the payload.
+
+    When several tools run concurrently, pass a shared ``lock`` so that
+    taking a sequence number and appending the event happen atomically and
+    events reach the log in ``seq`` order.
+    """
+    guard = lock if lock is not None else contextlib.nullcontext()
+
+    def emit(event_cls: type[BaseEvent], payload: dict[str, Any]) -> None:
+        with guard:
+            event_log.append(event_cls(run_id=run_id, seq=seq_counter(), payload=payload))
+
+    started_payload: dict[str, Any] = {
+        "tool_name": tool.name,
+        "tool_version": tool.version,
+    }
+    if hash_inputs:
+        started_payload["input_hash"] = hash_model(input_data)
+    started_payload["side_effect"] = tool.side_effect.value
+    emit(ToolCallStarted, started_payload)
 
     try:
         output = tool.execute(input_data)
-        output_hash = hash_dict(output.model_dump())
-
-        event_log.append(
-            ToolCallFinished(
-                run_id=run_id,
-                seq=seq_counter.next(),
-                payload={
-                    "tool_name": tool.name,
-                    "success": True,
-                    "output_hash": output_hash,
-                },
-            )
-        )
+
+        finished_payload: dict[str, Any] = {
+            "tool_name": tool.name,
+            "success": True,
+        }
+        if hash_outputs:
+            finished_payload["output_hash"] = hash_model(output)
+        emit(ToolCallFinished, finished_payload)
         return output
     except Exception as exc:
-        event_log.append(
-            ToolCallFinished(
-                run_id=run_id,
-                seq=seq_counter.next(),
-                payload={
-                    "tool_name": tool.name,
-                    "success": False,
-                    "error": str(exc),
-                },
-            )
-        )
+        emit(ToolCallFinished, {
+            "tool_name": tool.name,
+            "success": False,
+            "error": str(exc),
+        })
         raise
+
+
+def execute_batch_with_events(
+    calls: Sequence[tuple[BaseTool, BaseModel]],
+    event_log: EventLog,
+    run_id: RunId,
+    seq_counter: Callable[[], int],
+    *,
+    max_workers: int = 4,
+    hash_inputs: bool = True,
+    hash_outputs: bool = True,
+) -> list[BaseModel]:
+    """Execute mutually independent tool calls concurrently.
+
+    Each call is wrapped by ``execute_with_events`` on a thread pool, so
+    I/O- and GIL-releasing work (PNG encoding, file writes, sklearn) can
+    overlap. Outputs are returned in call order. Every call runs to
+    completion; the first failure in call order is then re-raised.
+
+    Only batch tools that do not consume each other's outputs.
+    """
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                execute_with_events,
+                tool, input_data, event_log, run_id, seq_counter,
+                hash_inputs=hash_inputs,
+                hash_outputs=hash_outputs,
+                lock=lock,
+            )
+            for tool, input_data in calls
+        ]
+    return [future.result() for future in futures]
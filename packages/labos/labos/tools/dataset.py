@@ -2,26 +2,49 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 from pydantic import BaseModel
-from sklearn.datasets import load_iris, make_classification
+from sklearn.datasets import load_iris
 
+from agentos.integrity.hashing import hash_dict
 from agentos.tools.base import BaseTool, SideEffect
 
 from labos.domain.schemas import DatasetInput, DatasetOutput, DatasetRecord
+from labos.tools._base import _coerce
+
+# Checksums are tagged "<algo>:<hex>" so they stay distinguishable from
+# older untagged SHA-256 digests.
+CHECKSUM_ALGORITHM = "blake2b"
 
 
 class DatasetTool(BaseTool):
     """Load a dataset and compute a reproducibility checksum.
 
-    Supports 'iris' (sklearn load_iris) and 'synthetic' (make_classification).
-    Caches loaded arrays at the class level for downstream tools.
+    Supports 'iris' (sklearn load_iris) and 'synthetic' (seeded Gaussian blobs).
+    Caches loaded arrays at the class level for downstream tools, and keeps
+    an LRU of full outputs keyed by config hash and ``mmap_dir`` so
+    re-running an identical config skips both loading and checksumming.
+
+    If ``mmap_dir`` is given, loaded arrays are persisted there as ``.npy``
+    files and the cache holds read-only memory maps instead of heap copies,
+    so large datasets are backed by the OS page cache and handed to
+    downstream tools (and the checksum) without copying.
     """
 
+    _MAX_OUTPUTS = 16
+
     _cache: dict[str, tuple[Any, Any]] = {}
+    _outputs: OrderedDict[str, tuple[DatasetOutput, Any, Any]] = OrderedDict()
+
+    def __init__(self, mmap_dir: str | Path | None = None) -> None:
+        self._mmap_dir = Path(mmap_dir) if mmap_dir is not None else None
 
     @property
     def name(self) -> str:
@@ -44,33 +67,43 @@ class DatasetTool(BaseTool):
         return SideEffect.READ
 
     def execute(self, input_data: BaseModel) -> BaseModel:
-        data = input_data if isinstance(input_data, DatasetInput) else DatasetInput.model_validate(input_data.model_dump())
+        data = _coerce(DatasetInput, input_data)
         config = data.config
         dataset_name = config.dataset_name
 
+        config_hash = hash_dict(config.model_dump())
+        # Heap and memory-mapped outputs for the same config are kept apart
+        key = f"{dataset_name}:{config_hash}:{self._mmap_dir}"
+        cached = DatasetTool._outputs.get(key)
+        if cached is not None:
+            DatasetTool._outputs.move_to_end(key)
+            output, X, y = cached
+            DatasetTool._cache[dataset_name] = (X, y)
+            return output
+
+        checksum: str | None = None
         if dataset_name == "iris":
-            ds = load_iris()
-            X, y = ds.data, ds.target
-            feature_names = list(ds.feature_names)
-            target_names = list(ds.target_names)
+            X, y, iris_features, iris_targets, checksum = _iris()
+            feature_names = list(iris_features)
+            target_names = list(iris_targets)
         elif dataset_name == "synthetic":
             n_samples = config.model_params.get("n_samples", 200)
             n_features = config.model_params.get("n_features", 10)
             n_classes = config.model_params.get("n_classes", 3)
-            X, y = make_classification(
-                n_samples=n_samples,
-                n_features=n_features,
-                n_informative=max(2, n_features // 2),
-                n_classes=n_classes,
-                random_state=config.random_seed,
+            X, y = _make_classification(
+                n_samples, n_features, n_classes, config.random_seed,
             )
             feature_names = [f"feature_{i}" for i in range(n_features)]
             target_names = [f"class_{i}" for i in range(n_classes)]
         else:
             raise ValueError(f"Unknown dataset: {dataset_name}")
 
-        # Compute deterministic checksum
-        checksum = self._compute_checksum(X, y)
+        if self._mmap_dir is not None:
+            X, y = self._to_mmap(self._mmap_dir, f"{dataset_name}-{config_hash}", X, y)
+
+        # Compute deterministic checksum (precomputed for iris)
+        if checksum is None:
+            checksum = self._compute_checksum(X, y)
 
         # Cache for downstream tools
         DatasetTool._cache[dataset_name] = (X, y)
@@ -85,14 +118,47 @@ class DatasetTool(BaseTool):
             target_names=target_names,
             checksum=checksum,
         )
-        return DatasetOutput(record=record)
+        output = DatasetOutput(record=record)
+
+        DatasetTool._outputs[key] = (output, X, y)
+        if len(DatasetTool._outputs) > DatasetTool._MAX_OUTPUTS:
+            DatasetTool._outputs.popitem(last=False)
+        return output
 
     @staticmethod
     def _compute_checksum(X: Any, y: Any) -> str:
-        h = hashlib.sha256()
-        h.update(np.asarray(X).tobytes())
-        h.update(np.asarray(y).tobytes())
-        return h.hexdigest()
+        h = hashlib.blake2b(digest_size=32)
+        h.update(DatasetTool._as_hash_buffer(X))
+        h.update(DatasetTool._as_hash_buffer(y))
+        return f"{CHECKSUM_ALGORITHM}:{h.hexdigest()}"
+
+    @staticmethod
+    def _to_mmap(mmap_dir: Path, stem: str, X: Any, y: Any) -> tuple[Any, Any]:
+        """Save ``X``/``y`` under ``mmap_dir`` and reopen them memory-mapped.
+
+        Files are written to a temporary name and atomically renamed, so a
+        memory map already held by another cache entry is never truncated.
+        """
+        mmap_dir.mkdir(parents=True, exist_ok=True)
+        arrays: list[Any] = []
+        for suffix, arr in (("X", X), ("y", y)):
+            path = mmap_dir / f"{stem}.{suffix}.npy"
+            tmp = path.with_suffix(".tmp.npy")
+            np.save(tmp, np.asarray(arr))
+            os.replace(tmp, path)
+            arrays.append(np.load(path, mmap_mode="r"))
+        return arrays[0], arrays[1]
+
+    @staticmethod
+    def _as_hash_buffer(arr: Any) -> memoryview:
+        """Expose an array's bytes to the hasher without a ``tobytes()`` copy.
+
+        Byte order is canonicalised to little-endian so the checksum is
+        reproducible across architectures; this is a no-op on x86/ARM.
+        """
+        a = np.ascontiguousarray(arr)
+        a = a.astype(a.dtype.newbyteorder("<"), copy=False)
+        return memoryview(a).cast("B")
 
     @classmethod
     def get_cached_data(cls, dataset_name: str) -> tuple[Any, Any]:
@@ -105,3 +171,43 @@ class DatasetTool(BaseTool):
     def clear_cache(cls) -> None:
         """Clear all cached data."""
         cls._cache.clear()
+        cls._outputs.clear()
+
+
+def _make_classification(
+    n_samples: int, n_features: int, n_classes: int, seed: int,
+) -> tuple[Any, Any]:
+    """Generate a reproducible Gaussian-blob classification dataset.
+
+    A vectorized stand-in for sklearn's ``make_classification``: one class
+    centroid per class, unit-variance noise around it, drawn from a seeded
+    PCG64DXSM generator. Labels are balanced (then shuffled) so every class
+    has enough members for a stratified train/test split.
+    """
+    if not 1 <= n_classes <= n_samples:
+        raise ValueError(
+            f"n_classes must be between 1 and n_samples ({n_samples}), got {n_classes}"
+        )
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    centroids = rng.standard_normal((n_classes, n_features)) * 2.0
+    y = rng.permutation(np.arange(n_samples) % n_classes)
+    X = centroids[y] + rng.standard_normal((n_samples, n_features))
+    return X, y
+
+
+@functools.cache
+def _iris() -> tuple[Any, Any, tuple[str, ...], tuple[str, ...], str]:
+    """Load iris once per process, with read-only arrays and its checksum.
+
+    Iris is a fixed 150x4 dataset, so every request after the first skips
+    sklearn's CSV parsing and the checksum pass entirely.
+    """
+    ds = load_iris()
+    X, y = ds.data, ds.target
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return (
+        X, y,
+        tuple(ds.feature_names), tuple(ds.target_names),
+        DatasetTool._compute_checksum(X, y),
+    )
@@ -2,24 +2,57 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
+import queue
+from collections.abc import Iterator
 from pathlib import Path
 
 import matplotlib
 import numpy as np
+from matplotlib.figure import Figure
 from pydantic import BaseModel
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import confusion_matrix
-from sklearn.model_selection import train_test_split
 
-from agentos.integrity.hashing import hash_file
+from agentos.integrity.hashing import sha256_hash
 from agentos.tools.base import BaseTool, SideEffect
 
 from labos.domain.schemas import PlotInput, PlotOutput, PlotRecord
-from labos.tools.dataset import DatasetTool
-from labos.tools.python_runner import MODEL_REGISTRY
+from labos.tools._base import _coerce
+from labos.tools.python_runner import PythonRunnerTool
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
+_FIGSIZE = (8, 6)
+
+# Idle figures kept for reuse. Standalone ``Figure`` objects never touch
+# pyplot's global state, so each one can be used by one thread at a time
+# without a lock; concurrent plots simply check out separate figures.
+_figure_pool: queue.SimpleQueue[Figure] = queue.SimpleQueue()
+
+
+@contextlib.contextmanager
+def _pooled_figure() -> Iterator[Figure]:
+    """Check out a blank figure, returning it to the pool cleared afterwards."""
+    try:
+        fig = _figure_pool.get_nowait()
+    except queue.Empty:
+        fig = Figure(figsize=_FIGSIZE)
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        _figure_pool.put(fig)
+
+
+def _confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Count (true, predicted) label pairs in one ``np.bincount`` pass.
+
+    Matches ``sklearn.metrics.confusion_matrix`` without sample weights:
+    rows/columns follow the sorted union of labels seen in either array.
+    """
+    labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    k = len(labels)
+    n = len(y_true)
+    flat = codes[:n] * k + codes[n:]
+    return np.bincount(flat, minlength=k * k).reshape(k, k)
 
 
 class PlotTool(BaseTool):
@@ -46,69 +79,63 @@ class PlotTool(BaseTool):
         return SideEffect.WRITE
 
     def execute(self, input_data: BaseModel) -> BaseModel:
-        data = input_data if isinstance(input_data, PlotInput) else PlotInput.model_validate(input_data.model_dump())
+        data = _coerce(PlotInput, input_data)
         config = data.config
         dataset_record = data.dataset_record
         output_dir = Path(data.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Re-train model deterministically to get predictions
-        X, y = DatasetTool.get_cached_data(config.dataset_name)
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y,
-            test_size=config.test_size,
-            random_state=config.random_seed,
-            stratify=y,
+        # Reuse PythonRunnerTool's predictions (re-trains deterministically on a miss)
+        y_test, y_pred = PythonRunnerTool.get_predictions(
+            config, dataset_record.checksum
         )
 
-        model_cls = MODEL_REGISTRY[config.model_type]
-        model_params = dict(config.model_params)
-        model_params.setdefault("random_state", config.random_seed)
-        model_params.setdefault("max_iter", 200)
-        model = model_cls(**model_params)
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
-
         # Generate confusion matrix plot
-        cm = confusion_matrix(y_test, y_pred)
+        cm = _confusion_matrix(y_test, y_pred)
         title = f"Confusion Matrix — {config.model_type} on {dataset_record.name}"
 
-        fig, ax = plt.subplots(figsize=(8, 6))
-        im = ax.imshow(cm, interpolation="nearest", cmap=plt.cm.Blues)
+        with _pooled_figure() as fig:
+            png = self._render(fig, cm, title, dataset_record.target_names)
+
+        plot_path = output_dir / "confusion_matrix.png"
+        plot_path.write_bytes(png)
+        sha = sha256_hash(png)
+
+        record = PlotRecord(
+            path=str(plot_path),
+            sha256=sha,
+            title=title,
+            plot_type="confusion_matrix",
+        )
+        return PlotOutput(record=record)
+
+    @staticmethod
+    def _render(fig: Figure, cm: np.ndarray, title: str, target_names: list[str]) -> bytes:
+        """Draw the confusion matrix onto *fig* and return the encoded PNG."""
+        ax = fig.add_subplot()
+        im = ax.imshow(cm, interpolation="nearest", cmap=matplotlib.colormaps["Blues"])
         ax.set_title(title)
         fig.colorbar(im, ax=ax)
 
-        classes = dataset_record.target_names or [str(i) for i in range(len(cm))]
+        classes = target_names or [str(i) for i in range(len(cm))]
         tick_marks = np.arange(len(classes))
         ax.set_xticks(tick_marks)
         ax.set_xticklabels(classes, rotation=45, ha="right")
         ax.set_yticks(tick_marks)
         ax.set_yticklabels(classes)
 
-        # Add text annotations
+        # Add text annotations (labels and colours computed array-wise)
         thresh = cm.max() / 2.0
-        for i in range(cm.shape[0]):
-            for j in range(cm.shape[1]):
-                ax.text(
-                    j, i, str(cm[i, j]),
-                    ha="center", va="center",
-                    color="white" if cm[i, j] > thresh else "black",
-                )
+        labels = cm.astype(str)
+        colors = np.where(cm > thresh, "white", "black")
+        for i, j in np.ndindex(cm.shape):
+            ax.text(j, i, labels[i, j], ha="center", va="center", color=colors[i, j])
 
         ax.set_ylabel("True label")
         ax.set_xlabel("Predicted label")
         fig.tight_layout()
 
-        plot_path = output_dir / "confusion_matrix.png"
-        fig.savefig(str(plot_path), dpi=100)
-        plt.close(fig)
-
-        sha = hash_file(plot_path)
-
-        record = PlotRecord(
-            path=str(plot_path),
-            sha256=sha,
-            title=title,
-            plot_type="confusion_matrix",
-        )
-        return PlotOutput(record=record)
+        # Encode in memory so the caller writes and hashes the same bytes
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+        return buf.getvalue()
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import os
 import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
 
+import numpy as np
+import sklearn
 from pydantic import BaseModel
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 from sklearn.model_selection import train_test_split
 
+from agentos.integrity.hashing import hash_dict
 from agentos.tools.base import BaseTool, SideEffect
 
-from labos.domain.schemas import PythonRunnerInput, PythonRunnerOutput, TrainingResult
+from labos.domain.schemas import (
+    ExperimentConfig,
+    PythonRunnerInput,
+    PythonRunnerOutput,
+    TrainingResult,
+)
+from labos.tools._base import _coerce
 from labos.tools.dataset import DatasetTool
 
 # Supported model types
@@ -21,7 +34,25 @@ MODEL_REGISTRY: dict[str, type] = {
 
 
 class PythonRunnerTool(BaseTool):
-    """Train an sklearn model on a cached dataset and evaluate accuracy."""
+    """Train an sklearn model on a cached dataset and evaluate accuracy.
+
+    Fitted models and their test-set predictions are kept in a small
+    class-level LRU keyed by config hash and dataset checksum so downstream
+    tools (e.g. PlotTool) can reuse them instead of retraining.
+
+    If ``memo_dir`` is given, each training result and its test-set
+    predictions are also persisted there, keyed by config hash, dataset
+    checksum and sklearn version, so identical runs skip training across
+    processes while changed data still retrains. A memoized result keeps
+    the duration of the run that actually trained.
+    """
+
+    _MAX_TRAINED = 4
+
+    _trained_cache: OrderedDict[str, tuple[Any, Any, Any, Any]] = OrderedDict()
+
+    def __init__(self, memo_dir: str | Path | None = None) -> None:
+        self._memo_dir = Path(memo_dir) if memo_dir is not None else None
 
     @property
     def name(self) -> str:
@@ -44,8 +75,9 @@ class PythonRunnerTool(BaseTool):
         return SideEffect.PURE
 
     def execute(self, input_data: BaseModel) -> BaseModel:
-        data = input_data if isinstance(input_data, PythonRunnerInput) else PythonRunnerInput.model_validate(input_data.model_dump())
+        data = _coerce(PythonRunnerInput, input_data)
         config = data.config
+        checksum = data.dataset_record.checksum
 
         if config.model_type not in MODEL_REGISTRY:
             raise ValueError(
@@ -53,6 +85,50 @@ class PythonRunnerTool(BaseTool):
                 f"Available: {list(MODEL_REGISTRY.keys())}"
             )
 
+        if self._memo_dir is not None:
+            memoized = self._load_memo(self._memo_dir, config, checksum)
+            if memoized is not None:
+                return PythonRunnerOutput(result=memoized)
+
+        _, X_test, y_test, y_pred, n_train, duration = self._fit(config, checksum)
+
+        metric_value = accuracy_score(y_test, y_pred)
+
+        result = TrainingResult(
+            model_type=config.model_type,
+            model_params=self._model_params(config),
+            metric_name=config.metric_name,
+            metric_value=metric_value,
+            train_samples=n_train,
+            test_samples=len(X_test),
+            seed=config.random_seed,
+            duration_seconds=duration,
+        )
+        if self._memo_dir is not None:
+            self._save_memo(self._memo_dir, config, checksum, result, y_test, y_pred)
+        return PythonRunnerOutput(result=result)
+
+    @staticmethod
+    def _model_params(config: ExperimentConfig) -> dict[str, Any]:
+        model_params = dict(config.model_params)
+        model_params.setdefault("random_state", config.random_seed)
+        model_params.setdefault("max_iter", 200)
+        # Pin the solver so results do not shift with sklearn's default
+        model_params.setdefault("solver", "lbfgs")
+        return model_params
+
+    @staticmethod
+    def _cache_key(config: ExperimentConfig, dataset_checksum: str) -> str:
+        return hash_dict({"config": config.model_dump(), "dataset": dataset_checksum})
+
+    @classmethod
+    def _fit(
+        cls, config: ExperimentConfig, dataset_checksum: str
+    ) -> tuple[Any, Any, Any, Any, int, float]:
+        """Split, fit and predict; cache ``(model, X_test, y_test, y_pred)``.
+
+        The returned duration covers only model fitting and prediction.
+        """
         X, y = DatasetTool.get_cached_data(config.dataset_name)
 
         X_train, X_test, y_train, y_test = train_test_split(
@@ -63,26 +139,79 @@ class PythonRunnerTool(BaseTool):
         )
 
         model_cls = MODEL_REGISTRY[config.model_type]
-        model_params = dict(config.model_params)
-        model_params.setdefault("random_state", config.random_seed)
-        model_params.setdefault("max_iter", 200)
-
         start = time.monotonic()
-        model = model_cls(**model_params)
+        model = model_cls(**cls._model_params(config))
         model.fit(X_train, y_train)
         y_pred = model.predict(X_test)
         duration = time.monotonic() - start
 
-        metric_value = accuracy_score(y_test, y_pred)
-
-        result = TrainingResult(
-            model_type=config.model_type,
-            model_params=model_params,
-            metric_name=config.metric_name,
-            metric_value=metric_value,
-            train_samples=len(X_train),
-            test_samples=len(X_test),
-            seed=config.random_seed,
-            duration_seconds=duration,
+        cls._remember(
+            cls._cache_key(config, dataset_checksum), (model, X_test, y_test, y_pred)
         )
-        return PythonRunnerOutput(result=result)
+        return model, X_test, y_test, y_pred, len(X_train), duration
+
+    @classmethod
+    def _remember(cls, key: str, entry: tuple[Any, Any, Any, Any]) -> None:
+        cls._trained_cache[key] = entry
+        if len(cls._trained_cache) > cls._MAX_TRAINED:
+            cls._trained_cache.popitem(last=False)
+
+    @classmethod
+    def _memo_paths(
+        cls, memo_dir: Path, config: ExperimentConfig, dataset_checksum: str
+    ) -> tuple[Path, Path]:
+        stem = f"{cls._cache_key(config, dataset_checksum)}-sklearn{sklearn.__version__}"
+        return memo_dir / f"{stem}.json", memo_dir / f"{stem}.npz"
+
+    @classmethod
+    def _load_memo(
+        cls, memo_dir: Path, config: ExperimentConfig, dataset_checksum: str
+    ) -> TrainingResult | None:
+        """Load a persisted result, seeding the prediction cache for PlotTool."""
+        result_path, preds_path = cls._memo_paths(memo_dir, config, dataset_checksum)
+        if not (result_path.exists() and preds_path.exists()):
+            return None
+        with np.load(preds_path) as preds:
+            y_test, y_pred = preds["y_test"], preds["y_pred"]
+        cls._remember(cls._cache_key(config, dataset_checksum), (None, None, y_test, y_pred))
+        return TrainingResult.model_validate_json(result_path.read_text())
+
+    @classmethod
+    def _save_memo(
+        cls,
+        memo_dir: Path,
+        config: ExperimentConfig,
+        dataset_checksum: str,
+        result: TrainingResult,
+        y_test: Any,
+        y_pred: Any,
+    ) -> None:
+        """Persist *result* and its predictions via temp files and atomic renames."""
+        memo_dir.mkdir(parents=True, exist_ok=True)
+        result_path, preds_path = cls._memo_paths(memo_dir, config, dataset_checksum)
+        tmp = preds_path.with_suffix(".tmp.npz")
+        with open(tmp, "wb") as f:
+            np.savez(f, y_test=np.asarray(y_test), y_pred=np.asarray(y_pred))
+        os.replace(tmp, preds_path)
+        tmp = result_path.with_suffix(".tmp.json")
+        tmp.write_text(result.model_dump_json())
+        os.replace(tmp, result_path)
+
+    @classmethod
+    def get_predictions(
+        cls, config: ExperimentConfig, dataset_checksum: str
+    ) -> tuple[Any, Any]:
+        """Return ``(y_test, y_pred)`` for *config*, training only on a cache miss."""
+        key = cls._cache_key(config, dataset_checksum)
+        cached = cls._trained_cache.get(key)
+        if cached is not None:
+            cls._trained_cache.move_to_end(key)
+            _, _, y_test, y_pred = cached
+            return y_test, y_pred
+        _, _, y_test, y_pred, _, _ = cls._fit(config, dataset_checksum)
+        return y_test, y_pred
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear all cached fitted models."""
+        cls._trained_cache.clear()
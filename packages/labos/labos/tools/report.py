@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 from pydantic import BaseModel
 
-from agentos.integrity.hashing import hash_file
+from agentos.integrity.hashing import sha256_hash
 from agentos.tools.base import BaseTool, SideEffect
 
 from labos.domain.schemas import ReportInput, ReportOutput, ReportRecord
+from labos.tools._base import _coerce
 
 
 class ReportTool(BaseTool):
@@ -36,7 +38,7 @@ class ReportTool(BaseTool):
         return SideEffect.WRITE
 
     def execute(self, input_data: BaseModel) -> BaseModel:
-        data = input_data if isinstance(input_data, ReportInput) else ReportInput.model_validate(input_data.model_dump())
+        data = _coerce(ReportInput, input_data)
         config = data.config
         ds = data.dataset_record
         tr = data.training_result
@@ -45,59 +47,59 @@ class ReportTool(BaseTool):
         output_dir.mkdir(parents=True, exist_ok=True)
 
         sections = ["Summary", "Dataset", "Model Configuration", "Results", "Reproducibility"]
-
-        lines: list[str] = []
         title = f"ML Replication Report — {config.model_type} on {ds.name}"
-        lines.append(f"# {title}\n")
-
-        # Summary
-        lines.append("## Summary\n")
-        lines.append(f"Replicated **{config.model_type}** on the **{ds.name}** dataset.")
-        lines.append(f"Achieved **{tr.metric_value:.4f}** {tr.metric_name}.\n")
-
-        # Dataset
-        lines.append("## Dataset\n")
-        lines.append(f"- **Name**: {ds.name}")
-        lines.append(f"- **Samples**: {ds.n_samples}")
-        lines.append(f"- **Features**: {ds.n_features}")
-        lines.append(f"- **Classes**: {ds.n_classes}")
-        lines.append(f"- **Checksum**: `{ds.checksum[:16]}...`\n")
-
-        # Model Configuration
-        lines.append("## Model Configuration\n")
-        lines.append(f"- **Type**: {config.model_type}")
-        lines.append(f"- **Random seed**: {config.random_seed}")
-        lines.append(f"- **Test size**: {config.test_size}")
+        # Show 16 hex digits of the digest, without the "<algorithm>:" prefix
+        checksum = ds.checksum.rpartition(":")[2][:16]
+
+        buf = io.StringIO()
+        buf.write(
+            f"# {title}\n\n"
+            "## Summary\n\n"
+            f"Replicated **{config.model_type}** on the **{ds.name}** dataset.\n"
+            f"Achieved **{tr.metric_value:.4f}** {tr.metric_name}.\n\n"
+            "## Dataset\n\n"
+            f"- **Name**: {ds.name}\n"
+            f"- **Samples**: {ds.n_samples}\n"
+            f"- **Features**: {ds.n_features}\n"
+            f"- **Classes**: {ds.n_classes}\n"
+            f"- **Checksum**: `{checksum}...`\n\n"
+            "## Model Configuration\n\n"
+            f"- **Type**: {config.model_type}\n"
+            f"- **Random seed**: {config.random_seed}\n"
+            f"- **Test size**: {config.test_size}\n"
+        )
         if tr.model_params:
-            lines.append("- **Parameters**:")
-            for k, v in sorted(tr.model_params.items()):
-                lines.append(f"  - `{k}`: {v}")
-        lines.append("")
-
-        # Results
-        lines.append("## Results\n")
-        lines.append(f"- **{tr.metric_name}**: {tr.metric_value:.4f}")
-        lines.append(f"- **Train samples**: {tr.train_samples}")
-        lines.append(f"- **Test samples**: {tr.test_samples}")
-        lines.append(f"- **Training duration**: {tr.duration_seconds:.4f}s\n")
-
-        # Reproducibility
-        lines.append("## Reproducibility\n")
-        lines.append(f"- **Seed**: {config.random_seed}")
-        lines.append(f"- **Dataset checksum**: `{ds.checksum[:16]}...`\n")
+            buf.write("- **Parameters**:\n")
+            buf.write("".join(
+                f"  - `{k}`: {v}\n" for k, v in sorted(tr.model_params.items())
+            ))
+        buf.write(
+            "\n"
+            "## Results\n\n"
+            f"- **{tr.metric_name}**: {tr.metric_value:.4f}\n"
+            f"- **Train samples**: {tr.train_samples}\n"
+            f"- **Test samples**: {tr.test_samples}\n"
+            f"- **Training duration**: {tr.duration_seconds:.4f}s\n\n"
+            "## Reproducibility\n\n"
+            f"- **Seed**: {config.random_seed}\n"
+            f"- **Dataset checksum**: `{checksum}...`\n"
+        )
 
         # Visualizations (optional)
         if plot:
             sections.append("Visualizations")
-            lines.append("## Visualizations\n")
-            lines.append(f"![{plot.title}]({plot.path})\n")
-            lines.append(f"- **Plot hash**: `{plot.sha256[:16]}...`\n")
-
+            buf.write(
+                "\n"
+                "## Visualizations\n\n"
+                f"![{plot.title}]({plot.path})\n\n"
+                f"- **Plot hash**: `{plot.sha256[:16]}...`\n"
+            )
+
+        # Encode once, write those bytes, and hash them (no file re-read)
+        content = buf.getvalue().encode("utf-8")
         report_path = output_dir / "report.md"
-        content = "\n".join(lines)
-        report_path.write_text(content)
-
-        sha = hash_file(report_path)
+        report_path.write_bytes(content)
+        sha = sha256_hash(content)
 
         record = ReportRecord(
             path=str(report_path),
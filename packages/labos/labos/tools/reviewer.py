@@ -2,11 +2,46 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from pydantic import BaseModel
 
 from agentos.tools.base import BaseTool, SideEffect
 
-from labos.domain.schemas import ReviewerInput, ReviewerOutput, ReviewResult
+from labos.domain.schemas import (
+    ReproducibilityRecord,
+    ReviewerInput,
+    ReviewerOutput,
+    ReviewResult,
+)
+from labos.tools._base import _coerce
+
+_Check = tuple[Callable[[ReproducibilityRecord], object], str]
+
+# Required field checks: (predicate that must be truthy, missing-field label)
+_REQUIRED: tuple[_Check, ...] = (
+    (lambda r: r.dataset_checksum, "dataset_checksum"),
+    (lambda r: r.config_hash, "config_hash"),
+    (lambda r: r.environment_spec.python_version, "environment_spec.python_version"),
+    (
+        lambda r: not (r.dataset_record and r.dataset_record.n_samples <= 0),
+        "dataset_record.n_samples > 0",
+    ),
+)
+
+# Warning checks: (predicate that should be truthy, warning message)
+_WARNINGS: tuple[_Check, ...] = (
+    (
+        lambda r: r.environment_spec.sklearn_version,
+        "sklearn_version is empty — version pinning recommended",
+    ),
+    (lambda r: r.code_version, "code_version is empty — consider tagging the commit"),
+    (lambda r: r.plot_record is not None, "No plot record — visualizations aid review"),
+    (
+        lambda r: r.report_record is not None,
+        "No report record — documentation aids reproducibility",
+    ),
+)
 
 
 class ReviewerTool(BaseTool):
@@ -33,31 +68,11 @@ class ReviewerTool(BaseTool):
         return SideEffect.PURE
 
     def execute(self, input_data: BaseModel) -> BaseModel:
-        data = input_data if isinstance(input_data, ReviewerInput) else ReviewerInput.model_validate(input_data.model_dump())
+        data = _coerce(ReviewerInput, input_data)
         rec = data.reproducibility_record
 
-        missing: list[str] = []
-        warnings: list[str] = []
-
-        # Required field checks
-        if not rec.dataset_checksum:
-            missing.append("dataset_checksum")
-        if not rec.config_hash:
-            missing.append("config_hash")
-        if not rec.environment_spec.python_version:
-            missing.append("environment_spec.python_version")
-        if rec.dataset_record and rec.dataset_record.n_samples <= 0:
-            missing.append("dataset_record.n_samples > 0")
-
-        # Warning checks
-        if not rec.environment_spec.sklearn_version:
-            warnings.append("sklearn_version is empty — version pinning recommended")
-        if not rec.code_version:
-            warnings.append("code_version is empty — consider tagging the commit")
-        if rec.plot_record is None:
-            warnings.append("No plot record — visualizations aid review")
-        if rec.report_record is None:
-            warnings.append("No report record — documentation aids reproducibility")
+        missing = [label for check, label in _REQUIRED if not check(rec)]
+        warnings = [message for check, message in _WARNINGS if not check(rec)]
 
         passed = len(missing) == 0
 
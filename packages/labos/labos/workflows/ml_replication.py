@@ -2,50 +2,76 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import json
 import platform
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-import matplotlib
-import sklearn
+from pydantic import BaseModel, TypeAdapter
 
 from agentos.core.identifiers import RunId, generate_run_id
 from agentos.integrity.hashing import hash_dict
 from agentos.lm.provider import BaseLMProvider
 from agentos.lm.recursive_executor import RLMConfig, RecursiveExecutor
-from agentos.runtime.dag import DAGWorkflow
+from agentos.runtime.dag import DAGExecutor, DAGWorkflow
 from agentos.runtime.event_log import EventLog, SQLiteEventLog
 from agentos.runtime.task import TaskNode
 from agentos.schemas.budget import BudgetSpec
 
 from labos.domain.schemas import (
     DatasetInput,
+    DatasetRecord,
     EnvironmentSpec,
     ExperimentConfig,
     PlotInput,
+    PlotRecord,
     PythonRunnerInput,
     ReportInput,
+    ReportRecord,
     ReproducibilityRecord,
     ReviewerInput,
+    TrainingResult,
 )
-from labos.tools._base import _SeqCounter, execute_with_events
-from labos.tools.dataset import DatasetTool
-from labos.tools.plot import PlotTool
-from labos.tools.python_runner import PythonRunnerTool
-from labos.tools.report import ReportTool
-from labos.tools.reviewer import ReviewerTool
+
+
+@functools.cache
+def _static_env() -> tuple[str, str, str, str]:
+    """Return the process-invariant environment fields (computed once)."""
+    import matplotlib
+    import sklearn
+
+    return (
+        sys.version,
+        platform.platform(),
+        sklearn.__version__,
+        matplotlib.__version__,
+    )
+
+
+def _config_hash(config: ExperimentConfig) -> str:
+    """Return ``hash_dict(config.model_dump())``, memoized on the config's JSON."""
+    return _hash_config_json(config.model_dump_json())
+
+
+@functools.lru_cache(maxsize=32)
+def _hash_config_json(config_json: str) -> str:
+    return hash_dict(json.loads(config_json))
 
 
 def _get_environment_spec() -> EnvironmentSpec:
     """Capture the current runtime environment."""
     from datetime import UTC, datetime
 
+    python_version, platform_name, sklearn_version, matplotlib_version = _static_env()
     return EnvironmentSpec(
-        python_version=sys.version,
-        platform=platform.platform(),
-        sklearn_version=sklearn.__version__,
-        matplotlib_version=matplotlib.__version__,
+        python_version=python_version,
+        platform=platform_name,
+        sklearn_version=sklearn_version,
+        matplotlib_version=matplotlib_version,
         timestamp=datetime.now(UTC).isoformat(),
     )
 
@@ -57,18 +83,29 @@ def build_dag_workflow(
     config: ExperimentConfig,
     event_log: EventLog,
     run_id: RunId,
-    seq_counter: _SeqCounter,
+    seq_counter: Callable[[], int],
     output_dir: str = ".",
+    memo_dir: str | None = None,
 ) -> DAGWorkflow:
     """Build the 6-step ML replication DAG.
 
     Uses closure-captured shared state to pass data between task callables
-    (since ``TaskNode.callable()`` takes zero args).
+    (since ``TaskNode.callable()`` takes zero args). ``memo_dir`` is passed
+    to ``PythonRunnerTool`` to persist training results across runs.
     """
     state: dict[str, Any] = {}
 
+    from labos.tools import (
+        DatasetTool,
+        PlotTool,
+        PythonRunnerTool,
+        ReportTool,
+        ReviewerTool,
+        execute_with_events,
+    )
+
     dataset_tool = DatasetTool()
-    runner_tool = PythonRunnerTool()
+    runner_tool = PythonRunnerTool(memo_dir=memo_dir)
     plot_tool = PlotTool()
     report_tool = ReportTool()
     reviewer_tool = ReviewerTool()
@@ -81,7 +118,7 @@ def build_dag_workflow(
         return state["question"]
 
     def design_experiment() -> dict[str, Any]:
-        state["config_hash"] = hash_dict(config.model_dump())
+        state["config_hash"] = _config_hash(config)
         state["env_spec"] = _get_environment_spec()
         state["code_version"] = ""
         return {"config_hash": state["config_hash"]}
@@ -152,6 +189,8 @@ def build_dag_workflow(
     t2 = TaskNode(name="DesignExperiment", callable=design_experiment, depends_on=[t1])
     t3 = TaskNode(name="RunExperiment", callable=run_experiment, depends_on=[t2])
     t4 = TaskNode(name="AnalyzeResults", callable=analyze_results, depends_on=[t3])
+    # WriteReport embeds the plot path and hash, so it cannot overlap with
+    # AnalyzeResults; use execute_batch_with_events only for independent tools.
     t5 = TaskNode(name="WriteReport", callable=write_report, depends_on=[t4])
     t6 = TaskNode(name="ReviewerCheck", callable=reviewer_check, depends_on=[t5])
 
@@ -165,70 +204,52 @@ def run_dag_pipeline(
     event_log: EventLog | None = None,
     output_dir: str | None = None,
     run_id: RunId | None = None,
+    memo_dir: str | None = None,
 ) -> RunId:
-    """Run the full ML replication pipeline as a sequential DAG.
+    """Run the full ML replication pipeline through ``DAGExecutor``.
 
-    Builds the DAG for validation and topological ordering, then executes
-    tasks sequentially with a single shared sequence counter so that
-    RunStarted/TaskStarted/ToolCallStarted events all use non-conflicting
-    sequence numbers.
+    Tasks are dispatched as soon as their dependencies finish, with as many
+    workers as the DAG's widest level. The executor and the tool wrappers
+    share one sequence counter so that RunStarted/TaskStarted/ToolCallStarted
+    events all use non-conflicting sequence numbers, and each task's events
+    are committed to the log together. If ``memo_dir`` is given, training
+    results are memoized there by config hash.
 
-    Returns the run ID.
+    Returns the run ID. Raises TaskExecutionError if any task fails.
     """
-    from agentos.schemas.events import RunFinished, RunStarted, TaskFinished, TaskStarted
-
     el = event_log or SQLiteEventLog()
     rid = run_id or generate_run_id()
     out = output_dir or "."
     Path(out).mkdir(parents=True, exist_ok=True)
 
-    seq = _SeqCounter(0)
-    dag = build_dag_workflow(config, el, rid, seq, output_dir=out)
-    dag.validate()
-    ordered = dag.topological_order()
-
-    el.append(RunStarted(
-        run_id=rid, seq=seq.next(),
-        payload={"workflow": dag.name},
-    ))
-
-    for task in ordered:
-        el.append(TaskStarted(
-            run_id=rid, seq=seq.next(),
-            payload={"task_id": task.id, "task_name": task.name},
-        ))
-        try:
-            task.callable()
-            state_str = "SUCCEEDED"
-        except Exception as exc:
-            state_str = "FAILED"
-            el.append(TaskFinished(
-                run_id=rid, seq=seq.next(),
-                payload={"task_id": task.id, "task_name": task.name,
-                         "state": state_str, "error": str(exc)},
-            ))
-            el.append(RunFinished(
-                run_id=rid, seq=seq.next(),
-                payload={"workflow": dag.name, "outcome": "FAILED",
-                         "failed_tasks": [task.name]},
-            ))
-            raise
-        el.append(TaskFinished(
-            run_id=rid, seq=seq.next(),
-            payload={"task_id": task.id, "task_name": task.name,
-                     "state": state_str},
-        ))
-
-    el.append(RunFinished(
-        run_id=rid, seq=seq.next(),
-        payload={"workflow": dag.name, "outcome": "SUCCEEDED"},
-    ))
-    return rid
+    # itertools.count.__next__ is atomic, so tool wrappers on worker
+    # threads can draw from it alongside the executor.
+    seq = itertools.count(0).__next__
+    dag = build_dag_workflow(config, el, rid, seq, output_dir=out, memo_dir=memo_dir)
+    executor = DAGExecutor(el, max_parallel=dag.max_parallelism(), batch_events=True)
+    return executor.run(dag, run_id=rid, seq_counter=seq)
 
 
 # ── RLM path ────────────────────────────────────────────────────────
 
 
+_M = TypeVar("_M", bound=BaseModel)
+
+# Prebuilt adapters for the records the RLM wrappers exchange with REPL code;
+# validate_python skips model_validate's per-call classmethod dispatch.
+_RECORD_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {
+    cls: TypeAdapter(cls) for cls in (DatasetRecord, TrainingResult, PlotRecord, ReportRecord)
+}
+
+
+def _validate_record(model_cls: type[_M], data: dict[str, Any]) -> _M:
+    """Validate a record dict coming back from REPL code."""
+    adapter = _RECORD_ADAPTERS.get(model_cls)
+    if adapter is None:
+        return model_cls.model_validate(data)
+    return adapter.validate_python(data)
+
+
 _RLM_SYSTEM_PROMPT = """\
 You are an RLM (Recursive Language Model) agent replicating an ML experiment.
 The user's prompt is in variable P. The experiment config is in CONFIG (a dict).
@@ -277,13 +298,21 @@ def run_rlm_pipeline(
     Path(out).mkdir(parents=True, exist_ok=True)
 
     # Instantiate tools
+    from labos.tools import (
+        DatasetTool,
+        PlotTool,
+        PythonRunnerTool,
+        ReportTool,
+        ReviewerTool,
+    )
+
     dataset_tool = DatasetTool()
     runner_tool = PythonRunnerTool()
     plot_tool = PlotTool()
     report_tool = ReportTool()
     reviewer_tool = ReviewerTool()
 
-    config_hash = hash_dict(config.model_dump())
+    config_hash = _config_hash(config)
     env_spec = _get_environment_spec()
 
     # Build wrapper functions that the LLM-generated code can call
@@ -292,9 +321,7 @@ def run_rlm_pipeline(
         return output.record.model_dump()
 
     def train_model(dataset_record: dict[str, Any]) -> dict[str, Any]:
-        from labos.domain.schemas import DatasetRecord
-
-        dr = DatasetRecord.model_validate(dataset_record)
+        dr = _validate_record(DatasetRecord, dataset_record)
         output = runner_tool.execute(PythonRunnerInput(config=config, dataset_record=dr))
         return output.result.model_dump()
 
@@ -302,10 +329,8 @@ def run_rlm_pipeline(
         dataset_record: dict[str, Any],
         training_result: dict[str, Any],
     ) -> dict[str, Any]:
-        from labos.domain.schemas import DatasetRecord, TrainingResult
-
-        dr = DatasetRecord.model_validate(dataset_record)
-        tr = TrainingResult.model_validate(training_result)
+        dr = _validate_record(DatasetRecord, dataset_record)
+        tr = _validate_record(TrainingResult, training_result)
         output = plot_tool.execute(
             PlotInput(config=config, dataset_record=dr, training_result=tr, output_dir=out)
         )
@@ -316,11 +341,9 @@ def run_rlm_pipeline(
         training_result: dict[str, Any],
         plot_record: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        from labos.domain.schemas import DatasetRecord, PlotRecord, TrainingResult
-
-        dr = DatasetRecord.model_validate(dataset_record)
-        tr = TrainingResult.model_validate(training_result)
-        pr = PlotRecord.model_validate(plot_record) if plot_record else None
+        dr = _validate_record(DatasetRecord, dataset_record)
+        tr = _validate_record(TrainingResult, training_result)
+        pr = _validate_record(PlotRecord, plot_record) if plot_record else None
         output = report_tool.execute(
             ReportInput(config=config, dataset_record=dr, training_result=tr, plot_record=pr, output_dir=out)
         )
@@ -332,17 +355,10 @@ def run_rlm_pipeline(
         plot_record: dict[str, Any] | None = None,
         report_record: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        from labos.domain.schemas import (
-            DatasetRecord,
-            PlotRecord,
-            ReportRecord,
-            TrainingResult,
-        )
-
-        dr = DatasetRecord.model_validate(dataset_record)
-        tr = TrainingResult.model_validate(training_result)
-        pr = PlotRecord.model_validate(plot_record) if plot_record else None
-        rr = ReportRecord.model_validate(report_record) if report_record else None
+        dr = _validate_record(DatasetRecord, dataset_record)
+        tr = _validate_record(TrainingResult, training_result)
+        pr = _validate_record(PlotRecord, plot_record) if plot_record else None
+        rr = _validate_record(ReportRecord, report_record) if report_record else None
 
         repro = ReproducibilityRecord(
             seed=config.random_seed,
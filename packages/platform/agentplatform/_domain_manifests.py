@@ -1,4 +1,9 @@
-"""Built-in domain pack manifests for LabOS and CodeOS."""
+"""Built-in domain pack manifests for LabOS and CodeOS.
+
+Each manifest is validated once, at import time;
+``register_builtin_packs`` only hands the shared instances to a registry,
+so callers must not mutate them.
+"""
 
 from __future__ import annotations
 
@@ -12,7 +17,7 @@ from agentos.schemas.budget import BudgetSpec
 
 # ── Platform-Wide Tools (available to all packs) ──────────────────
 
-PLATFORM_TOOLS = [
+PLATFORM_TOOLS = (
     ToolManifestEntry(
         name="web_search",
         description="Search the web using Brave Search or Google Custom Search API",
@@ -97,12 +102,12 @@ PLATFORM_TOOLS = [
         side_effect="READ",
         factory="agentplatform.tools.slack:SlackReadTool",
     ),
-]
+)
 
 
 # ── LabOS Manifest ──────────────────────────────────────────────────
 
-_LABOS_TOOLS = [
+_LABOS_TOOLS = (
     ToolManifestEntry(
         name="dataset_loader",
         description="Load a dataset and compute a reproducibility checksum",
@@ -127,9 +132,9 @@ _LABOS_TOOLS = [
         side_effect="PURE",
         factory="labos.tools.reviewer:ReviewerTool",
     ),
-]
+)
 
-_LABOS_ROLES = [
+_LABOS_ROLES = (
     RoleTemplate(
         name="planner",
         display_name="Planning Agent",
@@ -210,9 +215,9 @@ _LABOS_ROLES = [
         ),
         max_steps=10,
     ),
-]
+)
 
-_LABOS_WORKFLOWS = [
+_LABOS_WORKFLOWS = (
     WorkflowManifestEntry(
         name="ml_replication",
         description="Single-pass ML experiment replication (DAG pipeline)",
@@ -224,8 +229,15 @@ _LABOS_WORKFLOWS = [
         description="5-phase multi-agent research pipeline (planning → data → analysis → writing → review)",
         factory="labos.workflows.multi_agent_research:build_research_dag",
         default_roles=["planner", "data_experimenter", "analyst", "writer", "reviewer"],
+        role_dependencies={
+            "planner": [],
+            "data_experimenter": ["planner"],
+            "analyst": ["data_experimenter"],
+            "writer": ["analyst"],
+            "reviewer": ["writer"],
+        },
     ),
-]
+)
 
 LABOS_MANIFEST = DomainPackManifest(
     name="labos",
@@ -239,7 +251,7 @@ LABOS_MANIFEST = DomainPackManifest(
 
 # ── CodeOS Manifest ─────────────────────────────────────────────────
 
-_CODEOS_TOOLS = [
+_CODEOS_TOOLS = (
     ToolManifestEntry(
         name="file_read",
         description="Read the contents of a file within the workspace",
@@ -282,9 +294,9 @@ _CODEOS_TOOLS = [
         side_effect="WRITE",
         factory="codeos.tools.git_commit:GitCommitTool",
     ),
-]
+)
 
-_CODEOS_ROLES = [
+_CODEOS_ROLES = (
     RoleTemplate(
         name="coder",
         display_name="Coding Agent",
@@ -334,16 +346,16 @@ _CODEOS_ROLES = [
         ),
         max_steps=20,
     ),
-]
+)
 
-_CODEOS_WORKFLOWS = [
+_CODEOS_WORKFLOWS = (
     WorkflowManifestEntry(
         name="agent_coding",
         description="Single coding agent with file, shell, and git tools",
         factory="codeos.workflows.agent_coding:run_coding_agent",
         default_roles=["coder"],
     ),
-]
+)
 
 CODEOS_MANIFEST = DomainPackManifest(
     name="codeos",
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from agentos.runtime.domain_registry import ToolManifestEntry, WorkflowManifestEntry
 from agentos.runtime.role_template import RoleTemplate
 from agentos.schemas.session import AgentSlotConfig
 
+# Values of agentplatform.orchestrator.SessionState, as they appear on the wire
+SessionStateName = Literal["CREATED", "RUNNING", "SUCCEEDED", "FAILED", "STOPPED"]
+
 
 # ── Requests ────────────────────────────────────────────────────────
 
@@ -30,7 +35,7 @@ class SessionSummaryResponse(BaseModel):
     """Summary for session listings."""
 
     session_id: str
-    state: str
+    state: SessionStateName
     domain_pack: str
     workflow: str
     created_at: str
@@ -41,7 +46,7 @@ class SessionDetailResponse(BaseModel):
     """Detailed session info."""
 
     session_id: str
-    state: str
+    state: SessionStateName
     domain_pack: str
     workflow: str
     created_at: str
@@ -178,7 +183,7 @@ class RunWorkflowResponse(BaseModel):
     """Response for POST /api/workflows/:id/run."""
 
     session_id: str
-    state: str
+    state: SessionStateName
 
 
 class WorkflowValidationResponse(BaseModel):
@@ -231,6 +236,13 @@ class GenerateWorkflowRequest(BaseModel):
     model: str = "gpt-4o-mini"
 
 
+class GenerateWorkflowBatchRequest(BaseModel):
+    """Request body for POST /api/workflows/generate_batch."""
+
+    descriptions: list[str] = Field(min_length=1, max_length=16)
+    model: str = "gpt-4o-mini"
+
+
 class GenerateWorkflowResponse(BaseModel):
     """Response for POST /api/workflows/generate."""
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 from typing import TYPE_CHECKING
 
 from fastapi import WebSocket
@@ -11,16 +11,23 @@ from fastapi import WebSocket
 if TYPE_CHECKING:
     from agentplatform.orchestrator import SessionOrchestrator, SessionState
 
+_TERMINAL_STATES = frozenset({"SUCCEEDED", "FAILED", "STOPPED"})
+
 
 class EventStreamer:
     """Streams events from an EventLog to WebSocket clients.
 
-    Polls the event log at a configurable interval and pushes any new
-    events (after the client's last-seen sequence number) as JSON.
+    Waits for the orchestrator to signal a new event (or for
+    ``poll_interval`` to pass, so terminal states are still noticed) and
+    pushes any new events (after the client's last-seen sequence number)
+    as JSON. At most ``max_batch`` events are sent per read; a larger
+    backlog is drained in further reads without waiting, so terminal-state
+    checks keep running during a burst.
     """
 
-    def __init__(self, *, poll_interval: float = 0.1) -> None:
+    def __init__(self, *, poll_interval: float = 0.1, max_batch: int = 256) -> None:
         self._poll_interval = poll_interval
+        self._max_batch = max_batch
 
     async def stream(
         self,
@@ -34,40 +41,54 @@ class EventStreamer:
         are available, or until the client disconnects.
         """
         last_seq = -1
-        terminal_states = {"SUCCEEDED", "FAILED", "STOPPED"}
         idle_count = 0
         max_idle = 50  # Stop after ~5 seconds of no new events in terminal state
 
-        while True:
-            try:
-                events = orchestrator.get_session_events(
-                    session_id, after_seq=last_seq + 1
-                )
-            except KeyError:
-                break
-
-            if events:
-                idle_count = 0
-                for event in events:
-                    payload = {
-                        "run_id": event.run_id,
-                        "seq": event.seq,
-                        "timestamp": event.timestamp.isoformat(),
-                        "event_type": event.event_type.value,
-                        "payload": event.payload,
-                    }
-                    await websocket.send_text(json.dumps(payload))
-                    if event.seq > last_seq:
-                        last_seq = event.seq
-            else:
-                idle_count += 1
-
-            # Check if session is done
-            try:
-                state = orchestrator.get_session_state(session_id)
-                if state.value in terminal_states and idle_count >= max_idle:
+        try:
+            wakeup = orchestrator.subscribe_events(session_id)
+        except KeyError:
+            return
+
+        try:
+            while True:
+                # Clear before reading so an append during the read re-arms it
+                wakeup.clear()
+                try:
+                    # Usually an in-memory slice, but a client that has fallen
+                    # behind the window is served from SQLite, which blocks
+                    events = await asyncio.to_thread(
+                        orchestrator.get_session_events_json,
+                        session_id,
+                        after_seq=last_seq + 1,
+                        limit=self._max_batch + 1,
+                    )
+                except KeyError:
+                    break
+
+                more = len(events) > self._max_batch
+                if more:
+                    events = events[: self._max_batch]
+
+                if events:
+                    idle_count = 0
+                    for _, data in events:
+                        await websocket.send_text(data.decode())
+                    # Replay is ordered by seq, so the last event is the newest
+                    last_seq = events[-1][0]
+                else:
+                    idle_count += 1
+
+                # Check if session is done
+                try:
+                    state = orchestrator.get_session_state(session_id)
+                    if state.value in _TERMINAL_STATES and idle_count >= max_idle:
+                        break
+                except KeyError:
                     break
-            except KeyError:
-                break
 
-            await asyncio.sleep(self._poll_interval)
+                if more:
+                    continue  # drain the backlog before waiting again
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout=self._poll_interval)
+        finally:
+            orchestrator.unsubscribe_events(session_id, wakeup)
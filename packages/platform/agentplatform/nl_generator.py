@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+import threading
+import weakref
 from datetime import UTC, datetime
 from typing import Any, Callable
 
 from agentos.core.identifiers import generate_run_id
 from agentos.lm.provider import BaseLMProvider, LMMessage
-from agentos.runtime.domain_registry import DomainRegistry
+from agentos.runtime.domain_registry import DomainRegistry, ToolManifestEntry
 from agentos.schemas.workflow import WorkflowDefinition
 
 logger = logging.getLogger(__name__)
@@ -85,17 +89,44 @@ Return **only** the JSON object.  No markdown fences, no extra text.
 """
 
 
+# Opening fence with an optional language tag, body, optional closing fence.
+_FENCE_RE = re.compile(r"```[\w+-]*\n?(.*?)(?:```)?", re.DOTALL)
+
+
 def _format_tool_list(registry: DomainRegistry) -> str:
     """Build a concise tool catalogue from all registered packs."""
-    lines: list[str] = []
-    seen: set[str] = set()
+    # First registration of a tool name wins; dicts keep insertion order.
+    tools: dict[str, ToolManifestEntry] = {}
     for pack in registry.list_packs():
         for tool in pack.tools:
-            if tool.name in seen:
-                continue
-            seen.add(tool.name)
-            lines.append(f"- **{tool.name}** ({tool.side_effect}): {tool.description}")
-    return "\n".join(lines) if lines else "(no tools registered)"
+            tools.setdefault(tool.name, tool)
+    return "\n".join(
+        f"- **{t.name}** ({t.side_effect}): {t.description}" for t in tools.values()
+    ) or "(no tools registered)"
+
+
+# Rendered system prompt per registry, keyed by (pack identity, tool count)
+# for each registered pack. Generators are short-lived (one per API request),
+# so the cache lives here rather than on the instance; it holds registries
+# weakly so discarded ones are not kept alive.
+_PromptKey = tuple[tuple[int, int], ...]
+_prompt_cache: weakref.WeakKeyDictionary[DomainRegistry, tuple[_PromptKey, str]] = (
+    weakref.WeakKeyDictionary()
+)
+_prompt_lock = threading.Lock()
+
+
+def _system_prompt_for(registry: DomainRegistry) -> str:
+    """Return the system prompt for *registry*, rebuilt only when its packs change."""
+    key = tuple((id(p), len(p.tools)) for p in registry.list_packs())
+    with _prompt_lock:
+        cached = _prompt_cache.get(registry)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    prompt = _SYSTEM_PROMPT.format(tool_list=_format_tool_list(registry))
+    with _prompt_lock:
+        _prompt_cache[registry] = (key, prompt)
+    return prompt
 
 
 class WorkflowGenerator:
@@ -113,6 +144,9 @@ class WorkflowGenerator:
         self._factory = provider_factory
         self._registry = registry
 
+    def _system_prompt(self) -> str:
+        return _system_prompt_for(self._registry)
+
     def generate(
         self,
         description: str,
@@ -128,24 +162,54 @@ class WorkflowGenerator:
             RuntimeError: If the LLM provider is unavailable.
         """
         provider = self._factory(model)
+        response = provider.complete(self._messages(description))
+        return self._parse(response.content)
+
+    async def generate_async(
+        self,
+        description: str,
+        model: str = "gpt-4o-mini",
+    ) -> tuple[WorkflowDefinition, str]:
+        """Async variant of ``generate`` that awaits ``provider.acomplete``."""
+        provider = self._factory(model)
+        response = await provider.acomplete(self._messages(description))
+        return self._parse(response.content)
+
+    async def generate_batch(
+        self,
+        descriptions: list[str],
+        model: str = "gpt-4o-mini",
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[WorkflowDefinition, str]]:
+        """Generate one workflow per description with bounded concurrency.
+
+        Results are returned in input order. The first failure propagates
+        to the caller.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(description: str) -> tuple[WorkflowDefinition, str]:
+            async with semaphore:
+                return await self.generate_async(description, model)
 
-        tool_list = _format_tool_list(self._registry)
-        system = _SYSTEM_PROMPT.format(tool_list=tool_list)
+        return await asyncio.gather(*(_one(d) for d in descriptions))
 
-        messages = [
-            LMMessage(role="system", content=system),
+    def _messages(self, description: str) -> list[LMMessage]:
+        return [
+            LMMessage(role="system", content=self._system_prompt(), cacheable=True),
             LMMessage(role="user", content=description),
         ]
 
-        response = provider.complete(messages)
-        raw = response.content.strip()
+    @staticmethod
+    def _parse(content: str) -> tuple[WorkflowDefinition, str]:
+        """Turn raw LLM output into a validated workflow and its explanation."""
+        raw = content.strip()
 
         # Strip markdown code fences if the model wraps them
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-            if raw.endswith("```"):
-                raw = raw[:-3]
-            raw = raw.strip()
+        fenced = _FENCE_RE.fullmatch(raw)
+        if fenced:
+            raw = fenced.group(1).strip()
 
         try:
             parsed = json.loads(raw)
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+import os
 import threading
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from enum import StrEnum
+from graphlib import TopologicalSorter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from agentos.core.errors import TaskExecutionError
 from agentos.core.identifiers import RunId, generate_run_id
 from agentos.governance.budget_manager import BudgetManager
@@ -16,18 +25,35 @@ from agentos.lm.agent_config import AgentConfig
 from agentos.lm.agent_runner import AgentRunner
 from agentos.lm.provider import BaseLMProvider
 from agentos.runtime.dag import DAGExecutor, DAGWorkflow
-from agentos.runtime.domain_registry import DomainRegistry
+from agentos.runtime.domain_registry import DomainRegistry, ToolManifestEntry
 from agentos.runtime.event_log import EventLog, SQLiteEventLog
 from agentos.runtime.role_template import RoleTemplate
 from agentos.runtime.task import TaskNode
 from agentos.runtime.workspace import Workspace, WorkspaceConfig
 from agentos.schemas.budget import BudgetSpec
-from agentos.schemas.events import BaseEvent, EventType, SessionFinished, SessionStarted
+from agentos.schemas.events import BaseEvent, SessionFinished, SessionStarted
 from agentos.schemas.session import AgentSlotConfig, SessionConfig
 from agentos.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+_EVENT_JSON: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+# Most recent encoded events kept in memory per run; enough for live
+# WebSocket tailing, while full replays page through SQLite.
+_ENCODED_WINDOW = 1024
+
+
+def _encode_event(event: BaseEvent) -> bytes:
+    """Encode an event in the shape served by the events API and WebSocket."""
+    return _EVENT_JSON.dump_json({
+        "run_id": event.run_id,
+        "seq": event.seq,
+        "timestamp": event.timestamp.isoformat(),
+        "event_type": event.event_type.value,
+        "payload": event.payload,
+    })
+
 
 class SessionState(StrEnum):
     """Lifecycle states for a multi-agent session."""
@@ -39,6 +65,108 @@ class SessionState(StrEnum):
     STOPPED = "STOPPED"
 
 
+class _EventNotifier:
+    """Wakes asyncio waiters (e.g. WebSocket streamers) from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[asyncio.Event, asyncio.AbstractEventLoop] = {}
+
+    def subscribe(self) -> asyncio.Event:
+        """Return an event that is set after each append. Call from a running loop."""
+        wakeup = asyncio.Event()
+        with self._lock:
+            self._waiters[wakeup] = asyncio.get_running_loop()
+        return wakeup
+
+    def unsubscribe(self, wakeup: asyncio.Event) -> None:
+        with self._lock:
+            self._waiters.pop(wakeup, None)
+
+    def notify(self) -> None:
+        with self._lock:
+            waiters = list(self._waiters.items())
+        for wakeup, loop in waiters:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:  # loop already closed
+                self.unsubscribe(wakeup)
+
+
+class _NotifyingEventLog(SQLiteEventLog):
+    """SQLiteEventLog that calls ``on_append`` after every append.
+
+    Also tracks the highest sequence number and event count per run, so
+    callers can allocate the next seq or report a count without replaying
+    the log. The JSON encodings of each run's most recent events
+    (``_ENCODED_WINDOW``, ordered by seq) are kept so live tailing by API
+    clients is a slice; older pages are read back from SQLite.
+    """
+
+    def __init__(self, db_path: str, on_append: Callable[[], None]) -> None:
+        super().__init__(db_path)
+        self._on_append = on_append
+        self._seq_lock = threading.Lock()
+        self._last_seq: dict[str, int] = {}
+        self._counts: dict[str, int] = {}
+        self._encoded: dict[str, list[tuple[int, bytes]]] = {}
+        # Seqs below this may have left the window and are served from SQLite
+        self._window_start: dict[str, int] = {}
+
+    def append(self, event: BaseEvent) -> None:
+        super().append(event)
+        self._track([event])
+        self._on_append()
+
+    def append_many(self, events: Sequence[BaseEvent]) -> None:
+        super().append_many(events)
+        self._track(events)
+        self._on_append()
+
+    def last_seq(self, run_id: RunId) -> int:
+        """Return the highest seq appended for ``run_id``, or -1 if none."""
+        with self._seq_lock:
+            return self._last_seq.get(run_id, -1)
+
+    def event_count(self, run_id: RunId) -> int:
+        """Return the number of events appended for ``run_id``."""
+        with self._seq_lock:
+            return self._counts.get(run_id, 0)
+
+    def encoded_from_seq(
+        self, run_id: RunId, from_seq: int, limit: int | None = None
+    ) -> list[tuple[int, bytes]]:
+        """Return ``(seq, json)`` pairs for ``run_id`` with seq >= ``from_seq``."""
+        with self._seq_lock:
+            if from_seq >= self._window_start.get(run_id, 0):
+                encoded = self._encoded.get(run_id, [])
+                start = bisect.bisect_left(encoded, from_seq, key=lambda item: item[0])
+                stop = None if limit is None else start + limit
+                return encoded[start:stop]
+        events = self.query_from_seq(run_id, from_seq, limit)
+        return [(event.seq, _encode_event(event)) for event in events]
+
+    def _track(self, events: Sequence[BaseEvent]) -> None:
+        entries = [(event.seq, _encode_event(event)) for event in events]
+        with self._seq_lock:
+            for event, entry in zip(events, entries):
+                run_id = event.run_id
+                self._counts[run_id] = self._counts.get(run_id, 0) + 1
+                if event.seq > self._last_seq.get(run_id, -1):
+                    self._last_seq[run_id] = event.seq
+                if event.seq < self._window_start.get(run_id, 0):
+                    continue  # already behind the window; SQLite serves it
+                encoded = self._encoded.setdefault(run_id, [])
+                # Parallel agents may append slightly out of seq order
+                if not encoded or event.seq > encoded[-1][0]:
+                    encoded.append(entry)
+                else:
+                    bisect.insort(encoded, entry, key=lambda item: item[0])
+                if len(encoded) > _ENCODED_WINDOW:
+                    dropped_seq, _ = encoded.pop(0)
+                    self._window_start[run_id] = dropped_seq + 1
+
+
 class _SessionRecord:
     """Internal bookkeeping for a session."""
 
@@ -48,21 +176,34 @@ class _SessionRecord:
         "event_log",
         "run_id",
         "created_at",
-        "thread",
+        "future",
         "stop_event",
         "error",
+        "notifier",
+        "finished_emitted",
+        "agent_count",
         "_workflow",
     )
 
-    def __init__(self, config: SessionConfig, event_log: EventLog, run_id: RunId) -> None:
+    def __init__(
+        self,
+        config: SessionConfig,
+        event_log: _NotifyingEventLog,
+        run_id: RunId,
+        notifier: _EventNotifier | None = None,
+    ) -> None:
         self.config = config
         self.state = SessionState.CREATED
         self.event_log = event_log
         self.run_id = run_id
         self.created_at = datetime.now(UTC).isoformat()
-        self.thread: threading.Thread | None = None
+        self.future: Future[None] | None = None
         self.stop_event = threading.Event()
         self.error: str | None = None
+        self.notifier = notifier or _EventNotifier()
+        self.finished_emitted = False
+        # Polled by list_sessions; the config does not change after creation
+        self.agent_count = config.total_agent_count
         self._workflow: Any = None
 
 
@@ -72,9 +213,14 @@ class SessionOrchestrator:
     Each session is a DAG of agents. The orchestrator handles:
     - Session creation and validation
     - Building agent DAGs from workflow + role configs
-    - Background execution in threads
+    - Background execution on a bounded thread pool
     - Lifecycle management (start, stop, query)
     - Event log access for monitoring
+
+    Pool workers are not daemon threads: the interpreter joins them at
+    exit, so a process exits only once in-flight sessions return. Call
+    ``shutdown`` first so running sessions stop at their next step and
+    queued ones are cancelled.
     """
 
     def __init__(
@@ -82,21 +228,62 @@ class SessionOrchestrator:
         domain_registry: DomainRegistry,
         *,
         lm_provider_factory: LMProviderFactory | None = None,
+        max_sessions: int | None = None,
     ) -> None:
         self._registry = domain_registry
-        self._sessions: dict[str, _SessionRecord] = {}
+        # Copy-on-write: writers replace the mapping under _lock, readers
+        # use whatever mapping they load without locking.
+        self._sessions: Mapping[str, _SessionRecord] = MappingProxyType({})
         self._lock = threading.Lock()
         # Factory: model_name → BaseLMProvider instance
+        self._factory_lock = threading.Lock()
         self._lm_provider_factory = lm_provider_factory
+        # Sessions started beyond max_sessions queue until a worker frees up.
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_sessions or (os.cpu_count() or 1) * 2,
+            thread_name_prefix="session",
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Signal running sessions to stop and release the worker pool.
+
+        Sessions that were started but have not begun executing are
+        cancelled and finish as STOPPED. Running sessions stop at their
+        next step; a blocking LM call in progress still runs to completion,
+        and with ``wait=False`` the interpreter joins those workers at exit.
+        No session can be started afterwards.
+        """
+        with self._lock:
+            self._closed = True
+        for record in self._sessions.values():
+            record.stop_event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        for record in self._sessions.values():
+            if record.future is not None and record.future.cancelled():
+                record.state = SessionState.STOPPED
+                self._emit_session_finished(record, "STOPPED")
+
+    def set_provider_factory(self, factory: LMProviderFactory | None) -> None:
+        """Swap the LM provider factory used by sessions started from now on.
+
+        Each session captures the factory once when it starts, so running
+        sessions keep resolving models against the factory they began with.
+        """
+        with self._factory_lock:
+            self._lm_provider_factory = factory
+
+    def _current_provider_factory(self) -> LMProviderFactory | None:
+        with self._factory_lock:
+            return self._lm_provider_factory
 
     def create_session(self, config: SessionConfig) -> str:
         """Validate config and prepare a new session. Returns session_id."""
         # Validate domain pack exists
-        if not self._registry.has_pack(config.domain_pack):
+        pack = self._registry.find_pack(config.domain_pack)
+        if pack is None:
             raise ValueError(f"Unknown domain pack: '{config.domain_pack}'")
 
-        pack = self._registry.get_pack(config.domain_pack)
-
         # Validate workflow exists
         workflow_names = {w.name for w in pack.workflows}
         if config.workflow not in workflow_names:
@@ -116,15 +303,15 @@ class SessionOrchestrator:
 
         # Create event log and workspace directory
         Path(config.workspace_root).mkdir(parents=True, exist_ok=True)
-        event_log = SQLiteEventLog(
-            str(Path(config.workspace_root) / "events.db")
+        notifier = _EventNotifier()
+        event_log = _NotifyingEventLog(
+            str(Path(config.workspace_root) / "events.db"), notifier.notify
         )
         run_id = generate_run_id()
 
-        record = _SessionRecord(config, event_log, run_id)
+        record = _SessionRecord(config, event_log, run_id, notifier)
 
-        with self._lock:
-            self._sessions[config.session_id] = record
+        self._add_record(config.session_id, record)
 
         return config.session_id
 
@@ -134,16 +321,9 @@ class SessionOrchestrator:
         *,
         lm_provider: BaseLMProvider | None = None,
     ) -> None:
-        """Begin session execution in a background thread."""
+        """Begin session execution on the session worker pool."""
         record = self._get_record(session_id)
-
-        if record.state != SessionState.CREATED:
-            raise RuntimeError(
-                f"Session '{session_id}' is in state {record.state}, expected CREATED"
-            )
-
-        record.state = SessionState.RUNNING
-        factory = self._lm_provider_factory
+        factory = self._current_provider_factory()
 
         def _run() -> None:
             try:
@@ -154,14 +334,15 @@ class SessionOrchestrator:
                 record.state = SessionState.FAILED
                 self._emit_session_finished(record, "FAILED")
 
-        record.thread = threading.Thread(target=_run, daemon=True)
-        record.thread.start()
+        self._submit(record, _run)
 
     def stop_session(self, session_id: str) -> None:
         """Request graceful stop of a running session."""
         record = self._get_record(session_id)
         if record.state == SessionState.RUNNING:
             record.stop_event.set()
+            if record.future is not None:
+                record.future.cancel()  # only succeeds while still queued
             record.state = SessionState.STOPPED
             self._emit_session_finished(record, "STOPPED")
 
@@ -170,34 +351,62 @@ class SessionOrchestrator:
         return self._get_record(session_id).state
 
     def get_session_events(
-        self, session_id: str, *, after_seq: int = 0
+        self, session_id: str, *, after_seq: int = 0, limit: int | None = None
     ) -> list[BaseEvent]:
-        """Return events for the session, optionally after a sequence number."""
+        """Return events for the session, optionally after a sequence number.
+
+        ``limit`` caps the number of events returned, for paging.
+        """
         record = self._get_record(session_id)
-        all_events = record.event_log.replay(record.run_id)
-        if after_seq > 0:
-            return [e for e in all_events if e.seq >= after_seq]
-        return all_events
+        if after_seq > 0 or limit is not None:
+            return record.event_log.query_from_seq(record.run_id, after_seq, limit)
+        return record.event_log.replay(record.run_id)
+
+    def get_session_events_json(
+        self, session_id: str, *, after_seq: int = 0, limit: int | None = None
+    ) -> list[tuple[int, bytes]]:
+        """Like ``get_session_events`` but return pre-encoded ``(seq, json)`` pairs.
+
+        Recent events are sliced from encodings produced at append time;
+        pages older than the in-memory window are read back from SQLite,
+        so callers on an event loop should run this in a worker thread.
+        """
+        record = self._get_record(session_id)
+        return record.event_log.encoded_from_seq(record.run_id, after_seq, limit)
+
+    def subscribe_events(self, session_id: str) -> asyncio.Event:
+        """Return an asyncio event that is set whenever the session logs an event.
+
+        Must be called from the event loop that will await it. The caller
+        clears it before each read and must release it with
+        ``unsubscribe_events``.
+        """
+        return self._get_record(session_id).notifier.subscribe()
+
+    def unsubscribe_events(self, session_id: str, wakeup: asyncio.Event) -> None:
+        """Release an event obtained from ``subscribe_events``."""
+        try:
+            self._get_record(session_id).notifier.unsubscribe(wakeup)
+        except KeyError:
+            pass
 
     def list_sessions(self) -> list[dict[str, Any]]:
         """Return summary of all sessions."""
-        with self._lock:
-            results = []
-            for sid, record in self._sessions.items():
-                results.append({
-                    "session_id": sid,
-                    "state": record.state.value,
-                    "domain_pack": record.config.domain_pack,
-                    "workflow": record.config.workflow,
-                    "created_at": record.created_at,
-                    "agent_count": sum(s.count for s in record.config.agents),
-                })
-            return results
+        return [
+            {
+                "session_id": sid,
+                "state": record.state.value,
+                "domain_pack": record.config.domain_pack,
+                "workflow": record.config.workflow,
+                "created_at": record.created_at,
+                "agent_count": record.agent_count,
+            }
+            for sid, record in self._sessions.items()
+        ]
 
     def get_session_info(self, session_id: str) -> dict[str, Any]:
         """Return detailed info for a session."""
         record = self._get_record(session_id)
-        events = record.event_log.replay(record.run_id)
         return {
             "session_id": session_id,
             "state": record.state.value,
@@ -205,7 +414,7 @@ class SessionOrchestrator:
             "workflow": record.config.workflow,
             "created_at": record.created_at,
             "agents": [s.model_dump() for s in record.config.agents],
-            "event_count": len(events),
+            "event_count": record.event_log.event_count(record.run_id),
             "error": record.error,
         }
 
@@ -227,7 +436,10 @@ class SessionOrchestrator:
         # Create event log and workspace
         workspace_root = self._resolve_workspace(workflow.id)
         Path(workspace_root).mkdir(parents=True, exist_ok=True)
-        event_log = SQLiteEventLog(str(Path(workspace_root) / "events.db"))
+        notifier = _EventNotifier()
+        event_log = _NotifyingEventLog(
+            str(Path(workspace_root) / "events.db"), notifier.notify
+        )
         run_id = generate_run_id()
 
         # Build a lightweight SessionConfig for record-keeping
@@ -246,12 +458,11 @@ class SessionOrchestrator:
             task_description=task_description,
         )
 
-        record = _SessionRecord(config, event_log, run_id)
+        record = _SessionRecord(config, event_log, run_id, notifier)
         # Store the workflow on the record for compilation during start
         record._workflow = workflow
 
-        with self._lock:
-            self._sessions[config.session_id] = record
+        self._add_record(config.session_id, record)
 
         return config.session_id
 
@@ -259,7 +470,7 @@ class SessionOrchestrator:
         self,
         session_id: str,
     ) -> None:
-        """Start a workflow-based session in a background thread."""
+        """Start a workflow-based session on the session worker pool."""
         record = self._get_record(session_id)
         if record.state != SessionState.CREATED:
             raise RuntimeError(
@@ -272,8 +483,7 @@ class SessionOrchestrator:
                 f"Session '{session_id}' was not created from a workflow"
             )
 
-        record.state = SessionState.RUNNING
-        factory = self._lm_provider_factory
+        factory = self._current_provider_factory()
 
         def _run() -> None:
             try:
@@ -284,8 +494,29 @@ class SessionOrchestrator:
                 record.state = SessionState.FAILED
                 self._emit_session_finished(record, "FAILED")
 
-        record.thread = threading.Thread(target=_run, daemon=True)
-        record.thread.start()
+        self._submit(record, _run)
+
+    def _submit(self, record: _SessionRecord, run: Callable[[], None]) -> None:
+        """Move a CREATED session to RUNNING and queue ``run`` on the pool.
+
+        The state is claimed before submitting (a fast worker may finish
+        before ``submit`` returns) and rolled back if the submit fails, so
+        a session is never left RUNNING without a worker.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Orchestrator has been shut down")
+            if record.state != SessionState.CREATED:
+                raise RuntimeError(
+                    f"Session '{record.config.session_id}' is in state "
+                    f"{record.state}, expected CREATED"
+                )
+            record.state = SessionState.RUNNING
+            try:
+                record.future = self._executor.submit(run)
+            except BaseException:
+                record.state = SessionState.CREATED
+                raise
 
     def _execute_workflow_session(
         self,
@@ -351,10 +582,14 @@ class SessionOrchestrator:
     # ── Private ──────────────────────────────────────────────────────
 
     def _get_record(self, session_id: str) -> _SessionRecord:
+        record = self._sessions.get(session_id)
+        if record is None:
+            raise KeyError(f"Session '{session_id}' not found")
+        return record
+
+    def _add_record(self, session_id: str, record: _SessionRecord) -> None:
         with self._lock:
-            if session_id not in self._sessions:
-                raise KeyError(f"Session '{session_id}' not found")
-            return self._sessions[session_id]
+            self._sessions = MappingProxyType({**self._sessions, session_id: record})
 
     def _execute_session(
         self,
@@ -377,40 +612,87 @@ class SessionOrchestrator:
                     "session_id": config.session_id,
                     "domain_pack": config.domain_pack,
                     "workflow": config.workflow,
-                    "agent_count": sum(s.count for s in config.agents),
+                    "agent_count": record.agent_count,
                 },
             )
         )
 
         pack = self._registry.get_pack(config.domain_pack)
         role_map = {r.name: r for r in pack.role_templates}
+        tool_map = {t.name: t for t in pack.tools}
         workspace = Workspace(
             WorkspaceConfig(root=config.workspace_root, allowed_patterns=["**"])
         )
 
+        workflow = next(w for w in pack.workflows if w.name == config.workflow)
+        role_deps = workflow.role_dependencies
+        slots = config.agents
+        if role_deps is not None:
+            # Predecessor roles must be built first so their tasks can be
+            # referenced; roles outside the map keep their order and go last.
+            order = {
+                name: i
+                for i, name in enumerate(
+                    TopologicalSorter(role_deps).static_order()
+                )
+            }
+            slots = sorted(slots, key=lambda s: order.get(s.role, len(order)))
+
         # Build one TaskNode per agent slot
         tasks: list[TaskNode] = []
+        tasks_by_role: dict[str, list[TaskNode]] = {}
         prev_task: TaskNode | None = None
 
-        for slot in config.agents:
+        def upstream_tasks(role_name: str) -> list[TaskNode]:
+            """Tasks of the nearest ancestor roles that have slots.
+
+            Walks through prerequisite roles with no slots in this session,
+            so skipping a pipeline phase does not break the chain.
+            """
+            found: list[TaskNode] = []
+            seen: set[str] = set()
+            pending = list(role_deps.get(role_name, [])) if role_deps else []
+            while pending:
+                dep = pending.pop()
+                if dep in seen:
+                    continue
+                seen.add(dep)
+                if dep in tasks_by_role:
+                    found.extend(tasks_by_role[dep])
+                else:
+                    pending.extend(role_deps.get(dep, []) if role_deps else [])
+            return found
+
+        # Slots sharing a model share one provider (and its HTTP client)
+        providers_by_model: dict[str, BaseLMProvider] = {}
+
+        for slot in slots:
             role = role_map[slot.role]
+            if role_deps is None or slot.role not in role_deps:
+                depends_on = [prev_task] if prev_task is not None else []
+            else:
+                depends_on = upstream_tasks(slot.role)
             # Resolve provider: factory(model) > explicit provider > error
             agent_provider = None
             if lm_provider_factory is not None:
-                agent_provider = lm_provider_factory(slot.model)
+                agent_provider = providers_by_model.get(slot.model)
+                if agent_provider is None:
+                    agent_provider = lm_provider_factory(slot.model)
+                    providers_by_model[slot.model] = agent_provider
             elif lm_provider is not None:
                 agent_provider = lm_provider
             task = self._build_agent_task(
                 slot=slot,
                 role=role,
-                pack=pack,
+                tool_map=tool_map,
                 event_log=event_log,
                 workspace=workspace,
                 lm_provider=agent_provider,
                 stop_event=record.stop_event,
-                depends_on=[prev_task] if prev_task is not None else [],
+                depends_on=depends_on,
             )
             tasks.append(task)
+            tasks_by_role.setdefault(slot.role, []).append(task)
             prev_task = task
 
         dag = DAGWorkflow(name=f"session-{config.session_id}", tasks=tasks)
@@ -442,7 +724,7 @@ class SessionOrchestrator:
         *,
         slot: AgentSlotConfig,
         role: RoleTemplate,
-        pack: Any,
+        tool_map: dict[str, ToolManifestEntry],
         event_log: EventLog,
         workspace: Workspace,
         lm_provider: BaseLMProvider | None,
@@ -460,8 +742,6 @@ class SessionOrchestrator:
 
             # Build tool registry for this agent
             registry = ToolRegistry()
-            tool_map = {t.name: t for t in pack.tools}
-
             for tool_name in role.tool_names:
                 if tool_name in tool_map:
                     entry = tool_map[tool_name]
@@ -512,12 +792,11 @@ class SessionOrchestrator:
 
     def _emit_session_finished(self, record: _SessionRecord, outcome: str) -> None:
         """Emit a SessionFinished event. Safe to call multiple times (idempotent)."""
-        events = record.event_log.replay(record.run_id)
-        # Check if SessionFinished already emitted
-        for e in events:
-            if e.event_type == EventType.SESSION_FINISHED:
+        with self._lock:
+            if record.finished_emitted:
                 return
-        next_seq = max((e.seq for e in events), default=-1) + 1
+            record.finished_emitted = True
+        next_seq = record.event_log.last_seq(record.run_id) + 1
         try:
             record.event_log.append(
                 SessionFinished(
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+import cProfile
+import functools
+import hashlib
+import io
 import json
 import logging
-import urllib.request
+import pstats
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from typing import Any, Callable
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import httpx
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from agentos.lm import model_registry
 from agentos.lm.provider import BaseLMProvider, ModelCapabilities
-from agentos.runtime.domain_registry import DomainRegistry
+from agentos.runtime.domain_registry import DomainPackManifest, DomainRegistry
 from agentos.schemas.session import AgentSlotConfig, SessionConfig
 from agentos.schemas.workflow import WorkflowDefinition
 
@@ -24,6 +43,7 @@ from agentplatform.api_schemas import (
     DomainPackDetailResponse,
     DomainPackSummaryResponse,
     EventResponse,
+    GenerateWorkflowBatchRequest,
     GenerateWorkflowRequest,
     GenerateWorkflowResponse,
     IntegrationStatusResponse,
@@ -47,6 +67,55 @@ from agentplatform.workflow_store import WorkflowStore
 
 logger = logging.getLogger(__name__)
 
+# Polled list endpoints validate and encode through cached adapters in one
+# pydantic-core pass. FastAPI skips its own response_model handling when a
+# Response is returned, and still uses response_model for the OpenAPI schema.
+_SESSION_SUMMARIES = TypeAdapter(list[SessionSummaryResponse])
+_SETTINGS = TypeAdapter(SettingsResponse)
+_MODEL_ENTRIES = TypeAdapter(list[ModelListEntry])
+_PACK_SUMMARIES = TypeAdapter(list[DomainPackSummaryResponse])
+
+# Events per page when streaming GET /api/sessions/{id}/events.
+_EVENT_PAGE_SIZE = 500
+
+
+def _workflow_summary(wf: WorkflowDefinition) -> dict[str, Any]:
+    """Summary fields returned by the workflow create/update/clone endpoints."""
+    return {
+        "id": wf.id,
+        "name": wf.name,
+        "description": wf.description,
+        "version": wf.version,
+        "node_count": len(wf.nodes),
+        "edge_count": len(wf.edges),
+        "domain_pack": wf.domain_pack,
+        "created_at": wf.created_at,
+        "updated_at": wf.updated_at,
+        "template_source": wf.template_source,
+    }
+
+
+def _json_response(adapter: TypeAdapter[Any], data: Any) -> Response:
+    """Validate ``data`` against ``adapter`` and return it as a JSON response."""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(data)),
+        media_type="application/json",
+    )
+
+
+def _etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _conditional_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return ``body`` with its ETag, or 304 when the client already has it."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 
 def _make_provider_factory(
     settings: PlatformSettings,
@@ -58,8 +127,12 @@ def _make_provider_factory(
     - ``claude-*`` → Anthropic (requires API key)
     - Managed proxy URL configured → ManagedProxyProvider (fallback)
     - Everything else → Ollama (local)
+
+    Providers are cached per model name for the lifetime of the factory, so
+    sessions reuse HTTP clients. A settings update builds a new factory.
     """
 
+    @functools.lru_cache(maxsize=None)
     def factory(model_name: str) -> BaseLMProvider:
         # OpenAI models
         if model_name.startswith(("gpt-", "o1", "o3")):
@@ -107,12 +180,22 @@ def _make_provider_factory(
     return factory
 
 
-def _fetch_ollama_models(base_url: str) -> list[dict[str, str]]:
-    """Fetch available models from a local Ollama instance."""
+async def _fetch_ollama_models(
+    base_url: str, client: httpx.AsyncClient | None = None
+) -> list[dict[str, str]]:
+    """Fetch available models from a local Ollama instance.
+
+    Uses ``client`` when given so connections are pooled across requests;
+    otherwise opens a one-off client.
+    """
+    url = f"{base_url.rstrip('/')}/api/tags"
     try:
-        url = f"{base_url.rstrip('/')}/api/tags"
-        with urllib.request.urlopen(url, timeout=5) as resp:
-            data = json.loads(resp.read())
+        if client is None:
+            async with httpx.AsyncClient(timeout=5.0) as one_off:
+                resp = await one_off.get(url)
+        else:
+            resp = await client.get(url)
+        data = resp.raise_for_status().json()
         return [
             {"name": m["name"], "size": str(m.get("size", ""))}
             for m in data.get("models", [])
@@ -121,12 +204,49 @@ def _fetch_ollama_models(base_url: str) -> list[dict[str, str]]:
         return []
 
 
+class _OllamaModelCache:
+    """TTL cache for ``_fetch_ollama_models`` keyed by base URL.
+
+    Concurrent misses for the same URL share one in-flight fetch. Empty
+    results (usually Ollama being unreachable) are not cached, so a server
+    that comes up is seen on the next request.
+    """
+
+    def __init__(self, ttl: float = 15.0) -> None:
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, list[dict[str, str]]]] = {}
+        self._inflight: dict[str, asyncio.Task[list[dict[str, str]]]] = {}
+
+    async def get(
+        self, base_url: str, client: httpx.AsyncClient | None = None
+    ) -> list[dict[str, str]]:
+        entry = self._entries.get(base_url)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        task = self._inflight.get(base_url)
+        if task is None:
+            task = asyncio.create_task(_fetch_ollama_models(base_url, client))
+            self._inflight[base_url] = task
+            task.add_done_callback(lambda t: self._store(base_url, t))
+        # Shield so one cancelled request does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, base_url: str, task: asyncio.Task[list[dict[str, str]]]) -> None:
+        self._inflight.pop(base_url, None)
+        if not task.cancelled() and (models := task.result()):
+            self._entries[base_url] = (time.monotonic() + self._ttl, models)
+
+
 def create_app(
     *,
     lm_provider: BaseLMProvider | None = None,
     lm_provider_factory: Callable[[str], BaseLMProvider] | None = None,
     domain_registry: DomainRegistry | None = None,
     settings_manager: SettingsManager | None = None,
+    enable_profiling: bool = False,
 ) -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -136,8 +256,21 @@ def create_app(
             If neither is given, builds a settings-based routing factory.
         domain_registry: Pre-configured registry (builtins registered if None).
         settings_manager: Settings manager instance (uses default if None).
+        enable_profiling: Allow ``?profile=1`` on any HTTP request to return
+            a cProfile report instead of the response. Development only.
     """
-    app = FastAPI(title="AgentOS Platform", version="0.1.0")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        app.state.http_client = httpx.AsyncClient(timeout=5.0)
+        # Read templates off the loop before the first request needs them
+        await asyncio.to_thread(tpl_store.preload)
+        try:
+            yield
+        finally:
+            await app.state.http_client.aclose()
+            app.state.orchestrator.shutdown(wait=False)
+
+    app = FastAPI(title="AgentOS Platform", version="0.1.0", lifespan=lifespan)
 
     # Allow CORS for local development (Vite dev server on :5173)
     app.add_middleware(
@@ -147,6 +280,32 @@ def create_app(
         allow_headers=["*"],
     )
 
+    if enable_profiling:
+        profile_lock = asyncio.Lock()
+
+        @app.middleware("http")
+        async def profile_request(
+            request: Request, call_next: Callable[[Request], Awaitable[Response]]
+        ) -> Response:
+            """Profile the request on the event-loop thread and return the stats.
+
+            Handlers that FastAPI runs in its threadpool are not traced.
+            """
+            if request.query_params.get("profile") != "1":
+                return await call_next(request)
+            async with profile_lock:
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    response = await call_next(request)
+                    async for _ in response.body_iterator:  # type: ignore[attr-defined]
+                        pass
+                finally:
+                    profiler.disable()
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(50)
+            return PlainTextResponse(report.getvalue())
+
     # Initialize settings
     sm = settings_manager or SettingsManager()
     settings = sm.load()
@@ -174,13 +333,30 @@ def create_app(
     app.state.streamer = streamer
     app.state.settings_manager = sm
     app.state.settings = settings
+    # Shared outbound HTTP client, created by the lifespan handler
+    app.state.http_client = None
+    ollama_models_cache = _OllamaModelCache()
+
+    # Handlers that only read in-memory state or await async I/O are
+    # ``async def`` so they run on the event loop; handlers that touch disk,
+    # SQLite or blocking clients stay plain ``def`` and run in FastAPI's
+    # threadpool.
 
     # ── Settings Endpoints ────────────────────────────────────────────
 
+    # (settings, encoded masked body, etag)
+    masked_settings: tuple[PlatformSettings, bytes, str] | None = None
+
     @app.get("/api/settings", response_model=SettingsResponse)
-    def get_settings() -> dict[str, Any]:
+    async def get_settings(request: Request) -> Response:
         """Return current platform settings (API keys masked)."""
-        return app.state.settings.mask_keys()
+        nonlocal masked_settings
+        current: PlatformSettings = app.state.settings
+        # Every change swaps in a new settings object, so identity is the key
+        if masked_settings is None or masked_settings[0] is not current:
+            body = _SETTINGS.dump_json(_SETTINGS.validate_python(current.mask_keys()))
+            masked_settings = (current, body, _etag(body))
+        return _conditional_response(request, masked_settings[1], masked_settings[2])
 
     @app.put("/api/settings", response_model=SettingsResponse)
     def update_settings(request: UpdateSettingsRequest) -> dict[str, Any]:
@@ -195,41 +371,53 @@ def create_app(
         # Rebuild the provider factory with new settings
         nonlocal lm_provider_factory
         lm_provider_factory = _make_provider_factory(updated)
-        orchestrator._lm_provider_factory = lm_provider_factory
+        orchestrator.set_provider_factory(lm_provider_factory)
+        ollama_models_cache.clear()
 
         return updated.mask_keys()
 
     # ── Models Endpoints ──────────────────────────────────────────────
 
+    # Ready-to-return cloud model entries, rebuilt only when the registry changes
+    cloud_models: tuple[int, dict[str, list[dict[str, Any]]]] | None = None
+
+    def cloud_model_entries() -> dict[str, list[dict[str, Any]]]:
+        nonlocal cloud_models
+        version = model_registry.registry_version()
+        if cloud_models is None or cloud_models[0] != version:
+            cloud_models = (version, {
+                provider: [
+                    {
+                        "name": name,
+                        "provider": provider,
+                        "display_name": model_registry.get_capabilities(name).display_name,
+                        "available": True,
+                    }
+                    for name in model_registry.list_models_by_provider(provider)
+                ]
+                for provider in ("openai", "anthropic")
+            })
+        return cloud_models[1]
+
+    cloud_model_entries()
+
     @app.get("/api/models", response_model=list[ModelListEntry])
-    def list_models() -> list[dict[str, Any]]:
+    async def list_models(request: Request) -> Response:
         """List available models from all configured providers."""
         models: list[dict[str, Any]] = []
         current_settings: PlatformSettings = app.state.settings
 
         # Cloud models from registry (available if API key configured)
+        cloud = cloud_model_entries()
         if current_settings.has_openai():
-            for name in model_registry.list_models_by_provider("openai"):
-                caps = model_registry.get_capabilities(name)
-                models.append({
-                    "name": name,
-                    "provider": "openai",
-                    "display_name": caps.display_name,
-                    "available": True,
-                })
-
+            models.extend(cloud["openai"])
         if current_settings.has_anthropic():
-            for name in model_registry.list_models_by_provider("anthropic"):
-                caps = model_registry.get_capabilities(name)
-                models.append({
-                    "name": name,
-                    "provider": "anthropic",
-                    "display_name": caps.display_name,
-                    "available": True,
-                })
+            models.extend(cloud["anthropic"])
 
         # Ollama models (live-fetched)
-        ollama_models = _fetch_ollama_models(current_settings.ollama_base_url)
+        ollama_models = await ollama_models_cache.get(
+            current_settings.ollama_base_url, app.state.http_client
+        )
         for m in ollama_models:
             caps = model_registry.get_capabilities_or_none(m["name"])
             models.append({
@@ -248,10 +436,11 @@ def create_app(
                 "available": True,
             })
 
-        return models
+        body = _MODEL_ENTRIES.dump_json(_MODEL_ENTRIES.validate_python(models))
+        return _conditional_response(request, body, _etag(body))
 
     @app.get("/api/models/{model_name}/capabilities", response_model=ModelCapabilitiesResponse)
-    def get_model_capabilities(model_name: str) -> dict[str, Any]:
+    async def get_model_capabilities(model_name: str) -> dict[str, Any]:
         """Return capabilities for a specific model."""
         caps = model_registry.get_capabilities_or_none(model_name)
         if caps is None:
@@ -266,21 +455,8 @@ def create_app(
     @app.post("/api/workflows", response_model=WorkflowSummaryResponse, status_code=201)
     def save_workflow(workflow: WorkflowDefinition) -> dict[str, Any]:
         """Save a workflow definition."""
-        from agentos.schemas.workflow import WorkflowDefinition as _WD
-
         wf_store.save(workflow)
-        return {
-            "id": workflow.id,
-            "name": workflow.name,
-            "description": workflow.description,
-            "version": workflow.version,
-            "node_count": len(workflow.nodes),
-            "edge_count": len(workflow.edges),
-            "domain_pack": workflow.domain_pack,
-            "created_at": workflow.created_at,
-            "updated_at": workflow.updated_at,
-            "template_source": workflow.template_source,
-        }
+        return _workflow_summary(workflow)
 
     @app.get("/api/workflows", response_model=list[WorkflowSummaryResponse])
     def list_workflows() -> list[dict[str, Any]]:
@@ -300,8 +476,6 @@ def create_app(
     @app.put("/api/workflows/{workflow_id}", response_model=WorkflowSummaryResponse)
     def update_workflow(workflow_id: str, workflow: WorkflowDefinition) -> dict[str, Any]:
         """Update an existing workflow."""
-        from agentos.schemas.workflow import WorkflowDefinition as _WD
-
         if not wf_store.exists(workflow_id):
             raise HTTPException(
                 status_code=404, detail=f"Workflow '{workflow_id}' not found"
@@ -309,18 +483,7 @@ def create_app(
         # Ensure the ID matches the URL
         updated = workflow.model_copy(update={"id": workflow_id})
         wf_store.save(updated)
-        return {
-            "id": updated.id,
-            "name": updated.name,
-            "description": updated.description,
-            "version": updated.version,
-            "node_count": len(updated.nodes),
-            "edge_count": len(updated.edges),
-            "domain_pack": updated.domain_pack,
-            "created_at": updated.created_at,
-            "updated_at": updated.updated_at,
-            "template_source": updated.template_source,
-        }
+        return _workflow_summary(updated)
 
     @app.delete("/api/workflows/{workflow_id}", status_code=204)
     def delete_workflow(workflow_id: str) -> None:
@@ -341,18 +504,7 @@ def create_app(
             raise HTTPException(
                 status_code=404, detail=f"Workflow '{workflow_id}' not found"
             )
-        return {
-            "id": cloned.id,
-            "name": cloned.name,
-            "description": cloned.description,
-            "version": cloned.version,
-            "node_count": len(cloned.nodes),
-            "edge_count": len(cloned.edges),
-            "domain_pack": cloned.domain_pack,
-            "created_at": cloned.created_at,
-            "updated_at": cloned.updated_at,
-            "template_source": cloned.template_source,
-        }
+        return _workflow_summary(cloned)
 
     @app.post("/api/workflows/{workflow_id}/validate", response_model=WorkflowValidationResponse)
     def validate_workflow_endpoint(workflow_id: str) -> dict[str, Any]:
@@ -368,8 +520,8 @@ def create_app(
 
         # Gather available tools and models
         available_tools: set[str] = set()
-        if workflow.domain_pack and registry.has_pack(workflow.domain_pack):
-            pack = registry.get_pack(workflow.domain_pack)
+        pack = registry.find_pack(workflow.domain_pack) if workflow.domain_pack else None
+        if pack is not None:
             available_tools = {t.name for t in pack.tools}
 
         issues = validate_workflow(
@@ -441,18 +593,7 @@ def create_app(
             "template_source": template_id,
         })
         wf_store.save(cloned)
-        return {
-            "id": cloned.id,
-            "name": cloned.name,
-            "description": cloned.description,
-            "version": cloned.version,
-            "node_count": len(cloned.nodes),
-            "edge_count": len(cloned.edges),
-            "domain_pack": cloned.domain_pack,
-            "created_at": cloned.created_at,
-            "updated_at": cloned.updated_at,
-            "template_source": cloned.template_source,
-        }
+        return _workflow_summary(cloned)
 
     # ── NL Workflow Generation ─────────────────────────────────────
 
@@ -481,12 +622,44 @@ def create_app(
             logger.exception("NL generation failed")
             raise HTTPException(status_code=500, detail=str(exc))
 
+    @app.post(
+        "/api/workflows/generate_batch", response_model=list[GenerateWorkflowResponse]
+    )
+    async def generate_workflow_batch(
+        request: GenerateWorkflowBatchRequest,
+    ) -> list[dict[str, Any]]:
+        """Generate one workflow per description, running the LLM calls concurrently."""
+        from agentplatform.nl_generator import WorkflowGenerator
+
+        try:
+            assert lm_provider_factory is not None, (
+                "No LLM provider configured. Set an API key in Settings."
+            )
+            generator = WorkflowGenerator(
+                provider_factory=lm_provider_factory,
+                registry=registry,
+            )
+            results = await generator.generate_batch(
+                request.descriptions, model=request.model
+            )
+            return [
+                {"workflow": json.loads(wf.model_dump_json()), "explanation": explanation}
+                for wf, explanation in results
+            ]
+        except Exception as exc:
+            logger.exception("NL batch generation failed")
+            raise HTTPException(status_code=500, detail=str(exc))
+
     # ── Domain Pack Endpoints ────────────────────────────────────────
 
+    # Packs are not frozen after registration, so the cheap summary dicts are
+    # rebuilt per call; only validation, encoding and hashing are reused.
+    pack_summaries: tuple[list[dict[str, Any]], bytes, str] | None = None
+
     @app.get("/api/packs", response_model=list[DomainPackSummaryResponse])
-    def list_packs() -> list[dict[str, Any]]:
-        packs = registry.list_packs()
-        return [
+    async def list_packs(request: Request) -> Response:
+        nonlocal pack_summaries
+        summaries = [
             {
                 "name": p.name,
                 "display_name": p.display_name,
@@ -496,23 +669,26 @@ def create_app(
                 "role_count": len(p.role_templates),
                 "workflow_count": len(p.workflows),
             }
-            for p in packs
+            for p in registry.list_packs()
         ]
+        if pack_summaries is None or pack_summaries[0] != summaries:
+            body = _PACK_SUMMARIES.dump_json(_PACK_SUMMARIES.validate_python(summaries))
+            pack_summaries = (summaries, body, _etag(body))
+        return _conditional_response(request, pack_summaries[1], pack_summaries[2])
+
+    async def pack_dep(name: str) -> DomainPackManifest:
+        """Resolve the ``{name}`` path parameter to a registered pack or 404."""
+        pack = registry.find_pack(name)
+        if pack is None:
+            raise HTTPException(status_code=404, detail=f"Domain pack '{name}' not found")
+        return pack
 
     @app.get("/api/packs/{name}", response_model=DomainPackDetailResponse)
-    def get_pack(name: str) -> Any:
-        try:
-            pack = registry.get_pack(name)
-        except KeyError:
-            raise HTTPException(status_code=404, detail=f"Domain pack '{name}' not found")
+    async def get_pack(pack: DomainPackManifest = Depends(pack_dep)) -> Any:
         return pack
 
     @app.get("/api/packs/{name}/roles")
-    def get_pack_roles(name: str) -> Any:
-        try:
-            pack = registry.get_pack(name)
-        except KeyError:
-            raise HTTPException(status_code=404, detail=f"Domain pack '{name}' not found")
+    async def get_pack_roles(pack: DomainPackManifest = Depends(pack_dep)) -> Any:
         return pack.role_templates
 
     # ── Session Endpoints ────────────────────────────────────────────
@@ -539,12 +715,12 @@ def create_app(
             "domain_pack": info["domain_pack"],
             "workflow": info["workflow"],
             "created_at": info["created_at"],
-            "agent_count": sum(a.count for a in config.agents),
+            "agent_count": config.total_agent_count,
         }
 
     @app.get("/api/sessions", response_model=list[SessionSummaryResponse])
-    def list_sessions() -> list[dict[str, Any]]:
-        return orchestrator.list_sessions()
+    async def list_sessions() -> Response:
+        return _json_response(_SESSION_SUMMARIES, orchestrator.list_sessions())
 
     @app.get("/api/sessions/{session_id}", response_model=SessionDetailResponse)
     def get_session(session_id: str) -> dict[str, Any]:
@@ -580,30 +756,38 @@ def create_app(
         return {"status": "stopped"}
 
     @app.get("/api/sessions/{session_id}/events", response_model=list[EventResponse])
-    def get_session_events(session_id: str, after_seq: int = 0) -> list[dict[str, Any]]:
+    def get_session_events(session_id: str, after_seq: int = 0) -> Response:
         try:
-            events = orchestrator.get_session_events(
-                session_id, after_seq=after_seq
+            page = orchestrator.get_session_events_json(
+                session_id, after_seq=after_seq, limit=_EVENT_PAGE_SIZE
             )
         except KeyError:
             raise HTTPException(
                 status_code=404, detail=f"Session '{session_id}' not found"
             )
-        return [
-            {
-                "run_id": e.run_id,
-                "seq": e.seq,
-                "timestamp": e.timestamp.isoformat(),
-                "event_type": e.event_type.value,
-                "payload": e.payload,
-            }
-            for e in events
-        ]
+
+        def _pages() -> Iterator[bytes]:
+            # Events are encoded once at append time; each page is joined
+            # from those bytes without re-serialising anything.
+            nonlocal page
+            separator = b""
+            yield b"["
+            while page:
+                yield separator + b",".join(data for _, data in page)
+                separator = b","
+                if len(page) < _EVENT_PAGE_SIZE:
+                    break
+                page = orchestrator.get_session_events_json(
+                    session_id, after_seq=page[-1][0] + 1, limit=_EVENT_PAGE_SIZE
+                )
+            yield b"]"
+
+        return StreamingResponse(_pages(), media_type="application/json")
 
     # ── Integration Endpoints ─────────────────────────────────────────
 
     @app.get("/api/integrations", response_model=list[IntegrationStatusResponse])
-    def list_integrations() -> list[dict[str, Any]]:
+    async def list_integrations() -> list[dict[str, Any]]:
         """List connected integrations and their status."""
         current: PlatformSettings = app.state.settings
         return [
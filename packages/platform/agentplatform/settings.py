@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
 import logging
 import os
+import tempfile
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -79,18 +80,26 @@ class SettingsManager:
         if not self._settings_path.exists():
             return PlatformSettings()
         try:
-            data = json.loads(self._settings_path.read_text())
-            return PlatformSettings.model_validate(data)
+            return PlatformSettings.model_validate_json(self._settings_path.read_bytes())
         except Exception as exc:
             logger.warning("Failed to load settings from %s: %s", self._settings_path, exc)
             return PlatformSettings()
 
     def save(self, settings: PlatformSettings) -> None:
-        """Save settings to disk."""
+        """Save settings to disk via a temp file and atomic rename."""
         self._config_dir.mkdir(parents=True, exist_ok=True)
-        self._settings_path.write_text(
-            settings.model_dump_json(indent=2) + "\n"
+        # A unique temp file per call, so concurrent saves never share one
+        tmp = tempfile.NamedTemporaryFile(
+            dir=self._config_dir, prefix=".settings-", suffix=".tmp", delete=False
         )
+        try:
+            with tmp:
+                tmp.write(settings.model_dump_json(indent=2).encode() + b"\n")
+            os.replace(tmp.name, self._settings_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp.name)
+            raise
 
     def update(self, updates: dict) -> PlatformSettings:
         """Load current settings, apply updates, save, and return."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -84,23 +85,38 @@ class TemplateStore:
         self._ensure_loaded()
         return template_id in self._cache
 
+    def preload(self) -> None:
+        """Load all templates now rather than on first access."""
+        self._ensure_loaded()
+
     def _ensure_loaded(self) -> None:
         """Lazy-load all template files from disk on first access."""
         if self._cache:
             return
         if not self._dir.exists():
             return
-        for path in sorted(self._dir.glob("*.json")):
+        paths = sorted(
+            entry.path
+            for entry in os.scandir(self._dir)
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+        entries: list[tuple[WorkflowDefinition, dict]] = []
+        for path in paths:
             try:
-                raw = json.loads(path.read_text())
+                with open(path, encoding="utf-8") as f:
+                    raw = json.load(f)
                 # Extract metadata fields that sit outside WorkflowDefinition
                 meta = {
                     "category": raw.pop("_category", ""),
                     "tags": raw.pop("_tags", []),
                     "estimated_cost": raw.pop("_estimated_cost", ""),
                 }
-                wf = WorkflowDefinition.model_validate(raw)
-                self._cache[wf.id] = wf
-                self._meta_cache[wf.id] = {**meta, "domain_pack": wf.domain_pack}
+                entries.append((WorkflowDefinition.model_validate(raw), meta))
             except Exception as exc:
                 logger.warning("Failed to load template %s: %s", path, exc)
+        # Publish both caches only once fully built, so a concurrent caller
+        # never sees a partially loaded catalogue.
+        self._meta_cache = {
+            wf.id: {**meta, "domain_pack": wf.domain_pack} for wf, meta in entries
+        }
+        self._cache = {wf.id: wf for wf, _ in entries}
@@ -77,8 +77,10 @@ def compile_workflow(
 
         # Build tool registry for this node
         tool_registry = ToolRegistry()
-        if workflow.domain_pack and domain_registry.has_pack(workflow.domain_pack):
-            pack = domain_registry.get_pack(workflow.domain_pack)
+        pack = (
+            domain_registry.find_pack(workflow.domain_pack) if workflow.domain_pack else None
+        )
+        if pack is not None:
             tool_entries = {t.name: t for t in pack.tools}
             for tool_name in wf_node.config.tools:
                 if tool_name in tool_entries:
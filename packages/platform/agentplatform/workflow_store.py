@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_DIR = os.path.expanduser("~/.agentos/workflows")
 
+# Parsed workflows kept in memory by WorkflowStore.load
+_LOAD_CACHE_SIZE = 64
+
 
 class WorkflowSummary(BaseModel):
     """Lightweight summary for workflow listings."""
@@ -38,10 +43,17 @@ class WorkflowStore:
     """Save/load workflows as JSON files on the local filesystem.
 
     Each workflow is stored as ``{workflow_id}.json`` in the base directory.
+    Loaded workflows are cached in memory (LRU) and reused while the file's
+    mtime and size are unchanged, so edits made outside the store are seen.
     """
 
     def __init__(self, base_dir: str | None = None) -> None:
         self._base_dir = Path(base_dir or _DEFAULT_DIR)
+        self._cache_lock = threading.Lock()
+        # workflow_id → ((mtime_ns, size), workflow)
+        self._cache: OrderedDict[str, tuple[tuple[int, int], WorkflowDefinition]] = (
+            OrderedDict()
+        )
 
     @property
     def base_dir(self) -> Path:
@@ -55,6 +67,7 @@ class WorkflowStore:
         data = json.loads(workflow.model_dump_json())
         data["updated_at"] = datetime.now(UTC).isoformat()
         path.write_text(json.dumps(data, indent=2) + "\n")
+        self._evict(workflow.id)
 
     def load(self, workflow_id: str) -> WorkflowDefinition:
         """Load a workflow definition by ID.
@@ -63,10 +76,23 @@ class WorkflowStore:
             FileNotFoundError: If the workflow doesn't exist.
         """
         path = self._path_for(workflow_id)
-        if not path.exists():
-            raise FileNotFoundError(f"Workflow '{workflow_id}' not found")
-        data = json.loads(path.read_text())
-        return WorkflowDefinition.model_validate(data)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Workflow '{workflow_id}' not found") from None
+        key = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(path.stem)
+            if cached is not None and cached[0] == key:
+                self._cache.move_to_end(path.stem)
+                return cached[1]
+        workflow = WorkflowDefinition.model_validate_json(path.read_bytes())
+        with self._cache_lock:
+            self._cache[path.stem] = (key, workflow)
+            self._cache.move_to_end(path.stem)
+            if len(self._cache) > _LOAD_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return workflow
 
     def list(self) -> list[WorkflowSummary]:
         """List all saved workflows (sorted by updated_at descending)."""
@@ -105,6 +131,7 @@ class WorkflowStore:
         if not path.exists():
             raise FileNotFoundError(f"Workflow '{workflow_id}' not found")
         path.unlink()
+        self._evict(workflow_id)
 
     def clone(self, workflow_id: str) -> WorkflowDefinition:
         """Clone a workflow with a new ID and timestamps.
@@ -128,6 +155,10 @@ class WorkflowStore:
         """Check if a workflow exists."""
         return self._path_for(workflow_id).exists()
 
+    def _evict(self, workflow_id: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(Path(workflow_id).name, None)
+
     def _path_for(self, workflow_id: str) -> Path:
         """Return the file path for a workflow ID."""
         # Sanitize to prevent path traversal
@@ -366,6 +366,37 @@ class TestBuilderSaveLoad:
 class TestNLGenerateToRun:
     """Generate a workflow from NL, validate, and run it."""
 
+    def test_nl_generate_batch(self, client_with_nl_provider: TestClient) -> None:
+        resp = client_with_nl_provider.post("/api/workflows/generate_batch", json={
+            "descriptions": ["Research a topic.", "Write a report."],
+            "model": "gpt-4o-mini",
+        })
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data) == 2
+        assert all(len(item["workflow"]["nodes"]) == 2 for item in data)
+
+    def test_nl_generate_builds_tool_catalogue_once(
+        self, client_with_nl_provider: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from agentplatform import nl_generator
+
+        calls: list[object] = []
+        real_format = nl_generator._format_tool_list
+
+        def _counting_format(registry: DomainRegistry) -> str:
+            calls.append(registry)
+            return real_format(registry)
+
+        monkeypatch.setattr(nl_generator, "_format_tool_list", _counting_format)
+        for _ in range(2):
+            resp = client_with_nl_provider.post("/api/workflows/generate", json={
+                "description": "Research a topic and write a report.",
+                "model": "gpt-4o-mini",
+            })
+            assert resp.status_code == 200
+        assert len(calls) == 1
+
     def test_nl_generate_validate_and_run(self, client_with_nl_provider: TestClient) -> None:
         client = client_with_nl_provider
 
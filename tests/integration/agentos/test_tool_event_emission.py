@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import itertools
+
 import pytest
 from pydantic import BaseModel
 
@@ -22,6 +24,7 @@ pytestmark = pytest.mark.integration
 class _AddInput(BaseModel):
     a: int
     b: int
+    tags: dict[str, int] = {}
 
 
 class _AddOutput(BaseModel):
@@ -82,7 +85,7 @@ class _FailingTool(BaseTool):
 
 
 # Import the bridge
-from labos.tools._base import _SeqCounter, execute_with_events
+from labos.tools._base import execute_batch_with_events, execute_with_events
 
 
 class TestToolEventEmission:
@@ -91,7 +94,7 @@ class TestToolEventEmission:
     def test_pure_tool_emits_started_and_finished(self):
         log = SQLiteEventLog(":memory:")
         rid = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = _AddTool()
         inp = _AddInput(a=2, b=3)
@@ -104,25 +107,27 @@ class TestToolEventEmission:
         assert events[1].payload["success"] is True
         log.close()
 
-    def test_input_hash_matches(self):
+    def test_input_hash_ignores_key_order(self):
         log = SQLiteEventLog(":memory:")
         rid = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = _AddTool()
-        inp = _AddInput(a=10, b=20)
+        inp = _AddInput(a=10, b=20, tags={"x": 1, "y": 2})
+        reordered = _AddInput(a=10, b=20, tags={"y": 2, "x": 1})
         execute_with_events(tool, inp, log, rid, seq)
+        execute_with_events(tool, reordered, log, rid, seq)
 
         events = log.query_by_run(rid)
-        started = events[0]
-        expected_hash = hash_dict(inp.model_dump())
-        assert started.payload["input_hash"] == expected_hash
+        first, second = events[0], events[2]
+        assert first.payload["input_hash"] == second.payload["input_hash"]
+        assert first.payload["input_hash"] == hash_dict(inp.model_dump(mode="json"))
         log.close()
 
     def test_output_hash_matches(self):
         log = SQLiteEventLog(":memory:")
         rid = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = _AddTool()
         inp = _AddInput(a=5, b=7)
@@ -130,14 +135,31 @@ class TestToolEventEmission:
 
         events = log.query_by_run(rid)
         finished = events[1]
-        expected_hash = hash_dict(output.model_dump())
+        expected_hash = hash_dict(output.model_dump(mode="json"))
         assert finished.payload["output_hash"] == expected_hash
         log.close()
 
+    def test_hashing_can_be_disabled(self):
+        log = SQLiteEventLog(":memory:")
+        rid = generate_run_id()
+        seq = itertools.count(0).__next__
+
+        tool = _AddTool()
+        execute_with_events(
+            tool, _AddInput(a=1, b=1), log, rid, seq,
+            hash_inputs=False, hash_outputs=False,
+        )
+
+        started, finished = log.query_by_run(rid)
+        assert "input_hash" not in started.payload
+        assert "output_hash" not in finished.payload
+        assert finished.payload["success"] is True
+        log.close()
+
     def test_failed_tool_emits_error_event(self):
         log = SQLiteEventLog(":memory:")
         rid = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = _FailingTool()
         inp = _AddInput(a=1, b=2)
@@ -151,3 +173,36 @@ class TestToolEventEmission:
         assert finished.payload["success"] is False
         assert "Intentional failure" in finished.payload["error"]
         log.close()
+
+    def test_batch_returns_outputs_in_call_order(self):
+        log = SQLiteEventLog(":memory:")
+        rid = generate_run_id()
+        seq = itertools.count(0).__next__
+
+        tool = _AddTool()
+        calls = [(tool, _AddInput(a=i, b=i)) for i in range(5)]
+        outputs = execute_batch_with_events(calls, log, rid, seq)
+
+        assert [o.result for o in outputs] == [0, 2, 4, 6, 8]
+        events = log.query_by_run(rid)
+        assert [e.seq for e in events] == list(range(10))
+        log.close()
+
+    def test_batch_reraises_after_all_calls_finish(self):
+        log = SQLiteEventLog(":memory:")
+        rid = generate_run_id()
+        seq = itertools.count(0).__next__
+
+        calls = [
+            (_FailingTool(), _AddInput(a=1, b=2)),
+            (_AddTool(), _AddInput(a=1, b=2)),
+        ]
+        with pytest.raises(ValueError, match="Intentional failure"):
+            execute_batch_with_events(calls, log, rid, seq)
+
+        finished = [
+            e for e in log.query_by_run(rid)
+            if e.event_type == EventType.TOOL_CALL_FINISHED
+        ]
+        assert sorted(e.payload["success"] for e in finished) == [False, True]
+        log.close()
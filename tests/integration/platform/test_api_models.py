@@ -0,0 +1,49 @@
+"""Integration tests for the models API endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentos.lm import model_registry
+from agentos.lm.provider import ModelCapabilities
+
+from agentplatform.server import create_app
+from agentplatform.settings import SettingsManager
+
+
+@pytest.fixture()
+def client(tmp_path) -> TestClient:
+    sm = SettingsManager(str(tmp_path / "config"))
+    # Nothing listens on port 9, so the Ollama fetch fails fast and lists nothing
+    sm.update({"anthropic_api_key": "sk-ant-test", "ollama_base_url": "http://127.0.0.1:9"})
+    app = create_app(settings_manager=sm)
+    return TestClient(app)
+
+
+@pytest.fixture()
+def extra_model() -> Iterator[str]:
+    name = "claude-test-extra"
+    yield name
+    model_registry._REGISTRY.pop(name, None)
+
+
+@pytest.mark.integration
+class TestListModels:
+    def test_lists_configured_cloud_provider_only(self, client: TestClient) -> None:
+        models = client.get("/api/models").json()
+        providers = {m["provider"] for m in models}
+        assert "anthropic" in providers
+        assert "openai" not in providers
+
+    def test_registered_model_appears(self, client: TestClient, extra_model: str) -> None:
+        client.get("/api/models")
+        model_registry.register_model(
+            extra_model,
+            ModelCapabilities(provider="anthropic", display_name="Claude Test Extra"),
+        )
+
+        names = {m["name"] for m in client.get("/api/models").json()}
+        assert extra_model in names
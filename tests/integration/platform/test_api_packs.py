@@ -33,6 +33,21 @@ class TestListPacks:
         assert labos["role_count"] == 5
         assert labos["workflow_count"] == 2
 
+    def test_matching_etag_returns_304(self, client: TestClient) -> None:
+        first = client.get("/api/packs")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        resp = client.get("/api/packs", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_stale_etag_returns_body(self, client: TestClient) -> None:
+        resp = client.get("/api/packs", headers={"If-None-Match": 'W/"stale"'})
+        assert resp.status_code == 200
+        assert len(resp.json()) >= 2
+
 
 @pytest.mark.integration
 class TestGetPack:
@@ -72,3 +87,19 @@ class TestGetPackRoles:
     def test_unknown_pack_404(self, client: TestClient) -> None:
         resp = client.get("/api/packs/unknown/roles")
         assert resp.status_code == 404
+
+
+@pytest.mark.integration
+class TestProfilingMiddleware:
+    def test_profile_param_returns_report_when_enabled(self) -> None:
+        client = TestClient(create_app(enable_profiling=True))
+        resp = client.get("/api/packs?profile=1")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert "function calls" in resp.text
+
+        assert client.get("/api/packs").headers["content-type"] == "application/json"
+
+    def test_profile_param_ignored_by_default(self, client: TestClient) -> None:
+        resp = client.get("/api/packs?profile=1")
+        assert resp.headers["content-type"] == "application/json"
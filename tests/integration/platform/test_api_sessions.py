@@ -157,3 +157,27 @@ class TestSessionLifecycle:
         if len(all_events) > 1:
             filtered = client.get(f"/api/sessions/{sid}/events?after_seq=1").json()
             assert len(filtered) < len(all_events)
+
+    def test_events_streamed_across_pages(
+        self, client: TestClient, workspace_root: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        create_resp = client.post("/api/sessions", json={
+            "domain_pack": "labos",
+            "workflow": "multi_agent_research",
+            "agents": [{"role": "planner", "model": "mock"}],
+            "workspace_root": workspace_root,
+        })
+        sid = create_resp.json()["session_id"]
+        client.post(f"/api/sessions/{sid}/start")
+        time.sleep(2.0)
+
+        whole = client.get(f"/api/sessions/{sid}/events").json()
+        monkeypatch.setattr("agentplatform.server._EVENT_PAGE_SIZE", 1)
+        paged = client.get(f"/api/sessions/{sid}/events").json()
+        assert len(whole) > 1
+        assert paged == whole
+        assert client.get(f"/api/sessions/{sid}/events?after_seq=999").json() == []
+
+    def test_events_unknown_session_404(self, client: TestClient) -> None:
+        resp = client.get("/api/sessions/nonexistent-id/events")
+        assert resp.status_code == 404
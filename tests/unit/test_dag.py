@@ -1,5 +1,6 @@
 """Tests for DAG workflow — topological order, parallel execution, cycle detection."""
 
+import itertools
 import threading
 import time
 
@@ -73,6 +74,58 @@ class TestDAGWorkflow:
         assert names.index("b") < names.index("d")
         assert names.index("c") < names.index("d")
 
+    def test_validated_order_cached_until_add_task(self) -> None:
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        dag = DAGWorkflow(name="cached", tasks=[a, b])
+        first = dag.validated_order()
+        assert [t.name for t in first] == ["a", "b"]
+        first.clear()  # callers get a copy
+        assert dag.topological_order() == [a, b]
+
+        c = TaskNode(name="c", callable=_ok, depends_on=[b])
+        dag.add_task(c)
+        assert dag.validated_order() == [a, b, c]
+
+    def test_validated_order_revalidates_after_direct_mutation(self) -> None:
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        dag = DAGWorkflow(name="mutated", tasks=[a, b])
+        assert dag.validated_order() == [a, b]
+
+        c = TaskNode(name="c", callable=_ok)
+        dag.tasks.insert(0, c)
+        a.depends_on.append(c)
+        assert dag.validated_order() == [c, a, b]
+
+        c.depends_on.append(b)
+        with pytest.raises(TaskExecutionError, match="cycle"):
+            dag.validated_order()
+
+    def test_validated_order_rejects_cycle(self) -> None:
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        a.depends_on = [b]
+        dag = DAGWorkflow(name="cycle", tasks=[a, b])
+        with pytest.raises(TaskExecutionError, match="cycle"):
+            dag.validated_order()
+
+    def test_max_parallelism_chain(self) -> None:
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        c = TaskNode(name="c", callable=_ok, depends_on=[b])
+        assert DAGWorkflow(name="chain", tasks=[a, b, c]).max_parallelism() == 1
+
+    def test_max_parallelism_diamond(self) -> None:
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        c = TaskNode(name="c", callable=_ok, depends_on=[a])
+        d = TaskNode(name="d", callable=_ok, depends_on=[b, c])
+        assert DAGWorkflow(name="diamond", tasks=[a, b, c, d]).max_parallelism() == 2
+
+    def test_max_parallelism_empty(self) -> None:
+        assert DAGWorkflow(name="empty").max_parallelism() == 1
+
 
 class TestDAGExecutor:
     def test_linear_execution(self) -> None:
@@ -175,3 +228,37 @@ class TestDAGExecutor:
         assert len(events) == 2
         assert events[0].event_type == EventType.RUN_STARTED
         assert events[1].event_type == EventType.RUN_FINISHED
+
+    def test_shared_seq_counter(self) -> None:
+        log = SQLiteEventLog()
+        executor = DAGExecutor(log)
+        seq = itertools.count(10).__next__
+        a = TaskNode(name="a", callable=_ok)
+        dag = DAGWorkflow(name="seq", tasks=[a])
+
+        run_id = executor.run(dag, seq_counter=seq)
+        events = log.query_by_run(run_id)
+        assert [e.seq for e in events] == [10, 11, 12, 13]
+        assert seq() == 14
+
+    def test_failure_chains_task_error(self) -> None:
+        log = SQLiteEventLog()
+        executor = DAGExecutor(log)
+        dag = DAGWorkflow(name="chain-err", tasks=[TaskNode(name="a", callable=_fail)])
+
+        with pytest.raises(TaskExecutionError) as exc_info:
+            executor.run(dag)
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
+    def test_batch_events(self) -> None:
+        log = SQLiteEventLog()
+        executor = DAGExecutor(log, max_parallel=2, batch_events=True)
+        a = TaskNode(name="a", callable=_ok)
+        b = TaskNode(name="b", callable=_ok, depends_on=[a])
+        c = TaskNode(name="c", callable=_ok, depends_on=[a])
+        dag = DAGWorkflow(name="batched", tasks=[a, b, c])
+
+        run_id = executor.run(dag)
+        events = log.query_by_run(run_id)
+        assert len(events) == 8
+        assert sorted(e.seq for e in events) == list(range(8))
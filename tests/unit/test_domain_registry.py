@@ -105,6 +105,13 @@ class TestDomainRegistry:
         registry = DomainRegistry()
         assert not registry.has_pack("missing")
 
+    def test_find_pack(self) -> None:
+        registry = DomainRegistry()
+        manifest = _make_manifest("found")
+        registry.register(manifest)
+        assert registry.find_pack("found") is manifest
+        assert registry.find_pack("missing") is None
+
     def test_load_tool_dynamic_import(self) -> None:
         # Use an agentos-internal class to avoid sklearn dependency
         registry = DomainRegistry()
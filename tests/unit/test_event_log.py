@@ -86,6 +86,21 @@ class TestSQLiteEventLogInMemory:
         assert events == []
 
 
+    def test_query_from_seq(self) -> None:
+        log = SQLiteEventLog()
+        run_id = generate_run_id()
+        other = generate_run_id()
+
+        for i in range(5):
+            log.append(TaskStarted(run_id=run_id, seq=i))
+        log.append(TaskStarted(run_id=other, seq=3))
+
+        assert [e.seq for e in log.query_from_seq(run_id, 3)] == [3, 4]
+        assert [e.seq for e in log.query_from_seq(run_id, 0)] == [0, 1, 2, 3, 4]
+        assert log.query_from_seq(run_id, 5) == []
+        assert [e.seq for e in log.query_from_seq(run_id, 1, limit=2)] == [1, 2]
+
+
 class TestSQLiteEventLogPersistence:
     def test_data_survives_reopen(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -103,3 +118,57 @@ class TestSQLiteEventLogPersistence:
             assert events[0].event_type == EventType.RUN_STARTED
             assert events[1].event_type == EventType.RUN_FINISHED
             log2.close()
+
+
+class TestSQLiteEventLogPragmas:
+    def test_file_log_uses_wal_and_normal_sync(self, tmp_path: Path) -> None:
+        log = SQLiteEventLog(tmp_path / "pragmas.db")
+        assert log._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert log._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        log.close()
+
+
+class TestSQLiteEventLogBatching:
+    def test_append_many(self) -> None:
+        log = SQLiteEventLog()
+        run_id = generate_run_id()
+        log.append_many([
+            RunStarted(run_id=run_id, seq=0),
+            TaskStarted(run_id=run_id, seq=1),
+            RunFinished(run_id=run_id, seq=2),
+        ])
+        assert [e.seq for e in log.query_by_run(run_id)] == [0, 1, 2]
+
+    def test_batch_commits_on_exit(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "batch.db"
+        run_id = generate_run_id()
+        log = SQLiteEventLog(db_path)
+        reader = SQLiteEventLog(db_path)
+
+        with log.batch():
+            log.append(RunStarted(run_id=run_id, seq=0))
+            with log.batch():
+                log.append(TaskStarted(run_id=run_id, seq=1))
+            # Nested exit does not commit; other connections see nothing yet
+            assert reader.query_by_run(run_id) == []
+
+        assert len(reader.query_by_run(run_id)) == 2
+        log.close()
+        reader.close()
+
+    def test_batch_commits_on_exception(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "batch.db"
+        run_id = generate_run_id()
+        log = SQLiteEventLog(db_path)
+
+        try:
+            with log.batch():
+                log.append(RunStarted(run_id=run_id, seq=0))
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        reader = SQLiteEventLog(db_path)
+        assert len(reader.query_by_run(run_id)) == 1
+        log.close()
+        reader.close()
@@ -0,0 +1,72 @@
+"""Unit tests for EventStreamer batching against in-memory fakes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from agentos.schemas.events import RunStarted
+
+from agentplatform.event_stream import EventStreamer
+from agentplatform.orchestrator import SessionState
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+class _FakeOrchestrator:
+    """Serves a fixed backlog of events for a session that already finished."""
+
+    def __init__(self, n_events: int) -> None:
+        self._events = [
+            RunStarted(run_id="run-1", seq=i, payload={"i": i}) for i in range(n_events)
+        ]
+        self.reads: list[int] = []
+
+    def subscribe_events(self, session_id: str) -> asyncio.Event:
+        return asyncio.Event()
+
+    def unsubscribe_events(self, session_id: str, wakeup: asyncio.Event) -> None:
+        pass
+
+    def get_session_events_json(
+        self, session_id: str, *, after_seq: int = 0, limit: int | None = None
+    ) -> list[tuple[int, bytes]]:
+        self.reads.append(after_seq)
+        matching = [
+            (e.seq, json.dumps({"seq": e.seq, "payload": e.payload}).encode())
+            for e in self._events
+            if e.seq >= after_seq
+        ]
+        return matching[:limit]
+
+    def get_session_state(self, session_id: str) -> SessionState:
+        return SessionState.SUCCEEDED
+
+
+class TestEventStreamerBatching:
+    def test_backlog_drained_in_capped_batches(self) -> None:
+        ws = _FakeWebSocket()
+        orch = _FakeOrchestrator(600)
+        streamer = EventStreamer(poll_interval=0.001, max_batch=256)
+
+        asyncio.run(streamer.stream(ws, orch, "s1"))  # type: ignore[arg-type]
+
+        assert [e["seq"] for e in ws.sent] == list(range(600))
+        assert orch.reads[:4] == [0, 256, 512, 600]
+
+    def test_small_backlog_sent_in_one_read(self) -> None:
+        ws = _FakeWebSocket()
+        orch = _FakeOrchestrator(3)
+        streamer = EventStreamer(poll_interval=0.001)
+
+        asyncio.run(streamer.stream(ws, orch, "s1"))  # type: ignore[arg-type]
+
+        assert [e["seq"] for e in ws.sent] == [0, 1, 2]
+        assert orch.reads[:2] == [0, 3]
@@ -1,10 +1,13 @@
 """Tests for LabOS tools."""
 
+import itertools
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
+from agentos.integrity.hashing import hash_file
 from agentos.runtime.event_log import SQLiteEventLog
 from agentos.schemas.events import EventType
 from agentos.tools.base import SideEffect
@@ -21,7 +24,7 @@ from labos.domain.schemas import (
     ReviewerInput,
     TrainingResult,
 )
-from labos.tools._base import _SeqCounter, execute_with_events
+from labos.tools._base import _coerce, execute_with_events
 from labos.tools.dataset import DatasetTool
 from labos.tools.plot import PlotTool
 from labos.tools.python_runner import PythonRunnerTool
@@ -31,10 +34,12 @@ from labos.tools.reviewer import ReviewerTool
 
 @pytest.fixture(autouse=True)
 def _clear_cache():
-    """Clear DatasetTool cache before and after each test."""
+    """Clear DatasetTool and PythonRunnerTool caches before and after each test."""
     DatasetTool.clear_cache()
+    PythonRunnerTool.clear_cache()
     yield
     DatasetTool.clear_cache()
+    PythonRunnerTool.clear_cache()
 
 
 class TestDatasetTool:
@@ -49,7 +54,21 @@ class TestDatasetTool:
         assert rec.n_samples == 150
         assert rec.n_features == 4
         assert rec.n_classes == 3
-        assert len(rec.checksum) == 64  # SHA-256 hex
+        algo, _, digest = rec.checksum.partition(":")
+        assert algo == "blake2b"
+        assert len(digest) == 64  # 256-bit hex
+
+    def test_iris_loaded_once_and_read_only(self) -> None:
+        tool = DatasetTool()
+        out1 = tool.execute(DatasetInput(config=ExperimentConfig(random_seed=1)))
+        X1, _ = DatasetTool.get_cached_data("iris")
+        out2 = tool.execute(DatasetInput(config=ExperimentConfig(random_seed=2)))
+        X2, _ = DatasetTool.get_cached_data("iris")
+        assert X1 is X2
+        assert not X1.flags.writeable
+        assert out1.record.checksum == out2.record.checksum
+        X, y = DatasetTool.get_cached_data("iris")
+        assert out1.record.checksum == DatasetTool._compute_checksum(X, y)
 
     def test_load_synthetic(self) -> None:
         tool = DatasetTool()
@@ -62,6 +81,27 @@ class TestDatasetTool:
         assert out.record.n_samples == 100
         assert out.record.n_features == 5
 
+    def test_synthetic_deterministic_per_seed(self) -> None:
+        import numpy as np
+
+        from labos.tools.dataset import _make_classification
+
+        X1, y1 = _make_classification(60, 5, 3, seed=7)
+        X2, y2 = _make_classification(60, 5, 3, seed=7)
+        X3, _ = _make_classification(60, 5, 3, seed=8)
+        assert np.array_equal(X1, X2) and np.array_equal(y1, y2)
+        assert not np.array_equal(X1, X3)
+        assert np.bincount(y1).tolist() == [20, 20, 20]
+
+    @pytest.mark.parametrize("n_classes", [0, 11])
+    def test_synthetic_rejects_invalid_n_classes(self, n_classes: int) -> None:
+        cfg = ExperimentConfig(
+            dataset_name="synthetic",
+            model_params={"n_samples": 10, "n_features": 2, "n_classes": n_classes},
+        )
+        with pytest.raises(ValueError, match="n_classes must be between 1 and n_samples"):
+            DatasetTool().execute(DatasetInput(config=cfg))
+
     def test_unknown_dataset(self) -> None:
         tool = DatasetTool()
         with pytest.raises(ValueError, match="Unknown dataset"):
@@ -81,9 +121,73 @@ class TestDatasetTool:
     def test_deterministic_checksum(self) -> None:
         tool = DatasetTool()
         out1 = tool.execute(DatasetInput(config=ExperimentConfig()))
+        DatasetTool.clear_cache()
         out2 = tool.execute(DatasetInput(config=ExperimentConfig()))
         assert out1.record.checksum == out2.record.checksum
 
+    def test_output_cache_hit(self) -> None:
+        tool = DatasetTool()
+        cfg = ExperimentConfig()
+        out1 = tool.execute(DatasetInput(config=cfg))
+        out2 = tool.execute(DatasetInput(config=cfg))
+        assert out2 is out1
+
+    def test_output_cache_restores_arrays(self) -> None:
+        tool = DatasetTool()
+        small = ExperimentConfig(
+            dataset_name="synthetic", model_params={"n_samples": 50, "n_features": 6},
+        )
+        large = ExperimentConfig(
+            dataset_name="synthetic", model_params={"n_samples": 80, "n_features": 6},
+        )
+        tool.execute(DatasetInput(config=small))
+        tool.execute(DatasetInput(config=large))
+        tool.execute(DatasetInput(config=small))  # cache hit
+        X, _ = DatasetTool.get_cached_data("synthetic")
+        assert X.shape == (50, 6)
+
+    def test_mmap_dir_backs_cache_with_memmaps(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        plain = DatasetTool().execute(DatasetInput(config=ExperimentConfig()))
+        DatasetTool.clear_cache()
+
+        out = DatasetTool(mmap_dir=tmp_path).execute(
+            DatasetInput(config=ExperimentConfig())
+        )
+        X, y = DatasetTool.get_cached_data("iris")
+        assert isinstance(X, np.memmap)
+        assert isinstance(y, np.memmap)
+        assert out.record.checksum == plain.record.checksum
+        assert len(list(tmp_path.glob("iris-*.npy"))) == 2
+
+    def test_output_cache_respects_mmap_dir(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        DatasetTool().execute(DatasetInput(config=ExperimentConfig()))
+        DatasetTool(mmap_dir=tmp_path).execute(DatasetInput(config=ExperimentConfig()))
+        X, _ = DatasetTool.get_cached_data("iris")
+        assert isinstance(X, np.memmap)
+
+        DatasetTool().execute(DatasetInput(config=ExperimentConfig()))
+        X, _ = DatasetTool.get_cached_data("iris")
+        assert not isinstance(X, np.memmap)
+
+    def test_output_cache_evicts_lru(self) -> None:
+        tool = DatasetTool()
+        for seed in range(DatasetTool._MAX_OUTPUTS + 1):
+            tool.execute(DatasetInput(config=ExperimentConfig(random_seed=seed)))
+        assert len(DatasetTool._outputs) == DatasetTool._MAX_OUTPUTS
+
+    def test_checksum_independent_of_layout_and_byte_order(self) -> None:
+        import numpy as np
+
+        X = np.arange(12, dtype=np.float64).reshape(3, 4)
+        y = np.array([0, 1, 2])
+        expected = DatasetTool._compute_checksum(X, y)
+        assert DatasetTool._compute_checksum(np.asfortranarray(X), y) == expected
+        assert DatasetTool._compute_checksum(X.astype(">f8"), y) == expected
+
 
 class TestPythonRunnerTool:
     def test_train_iris(self) -> None:
@@ -105,6 +209,7 @@ class TestPythonRunnerTool:
         assert 0.0 <= out.result.metric_value <= 1.0
         assert out.result.seed == 42
         assert out.result.train_samples + out.result.test_samples == 150
+        assert out.result.model_params["solver"] == "lbfgs"
 
     def test_unknown_model(self) -> None:
         DatasetTool().execute(DatasetInput(config=ExperimentConfig()))
@@ -129,6 +234,80 @@ class TestPythonRunnerTool:
         out2 = tool.execute(PythonRunnerInput(config=config, dataset_record=ds_rec))
         assert out1.result.metric_value == out2.result.metric_value
 
+    def test_duration_covers_fit_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        config = ExperimentConfig()
+        DatasetTool().execute(DatasetInput(config=config))
+        real_get = DatasetTool.get_cached_data
+
+        def _slow_get(name: str) -> object:
+            time.sleep(0.5)
+            return real_get(name)
+
+        monkeypatch.setattr(DatasetTool, "get_cached_data", staticmethod(_slow_get))
+        out = PythonRunnerTool().execute(PythonRunnerInput(
+            config=config,
+            dataset_record=DatasetRecord(
+                name="iris", n_samples=150, n_features=4, n_classes=3, checksum="test",
+            ),
+        ))
+        assert out.result.duration_seconds < 0.5
+
+    def test_memo_dir_skips_training(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        config = ExperimentConfig()
+        DatasetTool().execute(DatasetInput(config=config))
+        ds_rec = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="test",
+        )
+        inp = PythonRunnerInput(config=config, dataset_record=ds_rec)
+        first = PythonRunnerTool(memo_dir=tmp_path).execute(inp)
+        y_test, y_pred = PythonRunnerTool.get_predictions(config, ds_rec.checksum)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # A fresh process: nothing cached in memory, and training must not run
+        DatasetTool.clear_cache()
+        PythonRunnerTool.clear_cache()
+
+        def _no_retrain(*args: object) -> None:
+            raise AssertionError("memoized result should skip training")
+
+        monkeypatch.setattr(PythonRunnerTool, "_fit", _no_retrain)
+        second = PythonRunnerTool(memo_dir=tmp_path).execute(inp)
+        assert second.result == first.result
+        assert second.result.duration_seconds == first.result.duration_seconds
+        memo_test, memo_pred = PythonRunnerTool.get_predictions(config, ds_rec.checksum)
+        assert (memo_test == y_test).all()
+        assert (memo_pred == y_pred).all()
+
+    def test_memo_keyed_on_dataset_checksum(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        config = ExperimentConfig()
+        DatasetTool().execute(DatasetInput(config=config))
+        old = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="old",
+        )
+        new = old.model_copy(update={"checksum": "new"})
+        PythonRunnerTool(memo_dir=tmp_path).execute(
+            PythonRunnerInput(config=config, dataset_record=old)
+        )
+        PythonRunnerTool.clear_cache()
+
+        fits: list[str] = []
+        real_fit = PythonRunnerTool._fit
+
+        def _counting_fit(config: ExperimentConfig, checksum: str) -> object:
+            fits.append(checksum)
+            return real_fit(config, checksum)
+
+        monkeypatch.setattr(PythonRunnerTool, "_fit", staticmethod(_counting_fit))
+        PythonRunnerTool(memo_dir=tmp_path).execute(
+            PythonRunnerInput(config=config, dataset_record=new)
+        )
+        assert fits == ["new"]
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
 
 class TestPlotTool:
     def test_generate_plot(self) -> None:
@@ -157,6 +336,65 @@ class TestPlotTool:
             assert out.record.plot_type == "confusion_matrix"
             assert Path(out.record.path).exists()
             assert len(out.record.sha256) == 64
+            assert out.record.sha256 == hash_file(out.record.path)
+
+    def test_confusion_matrix_matches_sklearn(self) -> None:
+        import numpy as np
+        from sklearn.metrics import confusion_matrix
+
+        from labos.tools.plot import _confusion_matrix
+
+        y_true = np.array([0, 2, 2, 1, 5, 0])
+        y_pred = np.array([0, 2, 1, 1, 0, 3])
+        np.testing.assert_array_equal(
+            _confusion_matrix(y_true, y_pred), confusion_matrix(y_true, y_pred),
+        )
+
+    def test_figures_reused_with_identical_output(self, tmp_path: Path) -> None:
+        from labos.tools import plot as plot_module
+
+        DatasetTool().execute(DatasetInput(config=ExperimentConfig()))
+        ds_rec = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="test",
+        )
+        tr = TrainingResult(
+            model_type="LogisticRegression", metric_name="accuracy",
+            metric_value=0.95, train_samples=120, test_samples=30,
+            seed=42, duration_seconds=0.01,
+        )
+        hashes = []
+        for run in ("a", "b"):
+            out = PlotTool().execute(PlotInput(
+                config=ExperimentConfig(), dataset_record=ds_rec,
+                training_result=tr, output_dir=str(tmp_path / run),
+            ))
+            hashes.append(out.record.sha256)
+        assert hashes[0] == hashes[1]
+        assert plot_module._figure_pool.qsize() >= 1
+
+    def test_reuses_runner_predictions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        config = ExperimentConfig()
+        DatasetTool().execute(DatasetInput(config=config))
+        runner_out = PythonRunnerTool().execute(PythonRunnerInput(
+            config=config,
+            dataset_record=DatasetRecord(
+                name="iris", n_samples=150, n_features=4, n_classes=3, checksum="test",
+            ),
+        ))
+
+        def _no_retrain(*args: object) -> None:
+            raise AssertionError("PlotTool should not retrain")
+
+        monkeypatch.setattr(PythonRunnerTool, "_fit", _no_retrain)
+        ds_rec = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="test",
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = PlotTool().execute(PlotInput(
+                config=config, dataset_record=ds_rec,
+                training_result=runner_out.result, output_dir=tmpdir,
+            ))
+            assert Path(out.record.path).exists()
 
 
 class TestReportTool:
@@ -188,6 +426,7 @@ class TestReportTool:
             content = Path(out.record.path).read_text()
             assert "LogisticRegression" in content
             assert "0.9500" in content
+            assert out.record.sha256 == hash_file(out.record.path)
 
     def test_report_with_plot(self) -> None:
         tool = ReportTool()
@@ -211,6 +450,24 @@ class TestReportTool:
             ))
             assert "Visualizations" in out.record.sections
 
+    def test_report_shows_checksum_digest(self) -> None:
+        ds_rec = DatasetTool().execute(DatasetInput(config=ExperimentConfig())).record
+        digest = ds_rec.checksum.partition(":")[2]
+        tr = TrainingResult(
+            model_type="LR", metric_name="acc", metric_value=0.9,
+            train_samples=120, test_samples=30,
+            seed=42, duration_seconds=0.01,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = ReportTool().execute(ReportInput(
+                config=ExperimentConfig(), dataset_record=ds_rec,
+                training_result=tr, output_dir=tmpdir,
+            ))
+            content = Path(out.record.path).read_text()
+        assert f"- **Checksum**: `{digest[:16]}...`" in content
+        assert f"- **Dataset checksum**: `{digest[:16]}...`" in content
+
 
 class TestReviewerTool:
     def test_valid_record(self) -> None:
@@ -265,7 +522,7 @@ class TestExecuteWithEvents:
         from agentos.core.identifiers import generate_run_id
 
         run_id = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = ReviewerTool()
         rec = ReproducibilityRecord(
@@ -292,7 +549,7 @@ class TestExecuteWithEvents:
         from agentos.core.identifiers import generate_run_id
 
         run_id = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
 
         tool = DatasetTool()
         with pytest.raises(ValueError):
@@ -306,3 +563,28 @@ class TestExecuteWithEvents:
         assert len(events) == 2
         assert events[1].event_type == EventType.TOOL_CALL_FINISHED
         assert events[1].payload["success"] is False
+
+
+class TestCoerce:
+    def test_same_type_passes_through(self) -> None:
+        inp = DatasetInput(config=ExperimentConfig())
+        assert _coerce(DatasetInput, inp) is inp
+
+    def test_other_model_validated_from_attributes(self) -> None:
+        from pydantic import BaseModel
+
+        class _Foreign(BaseModel):
+            config: ExperimentConfig
+
+        coerced = _coerce(DatasetInput, _Foreign(config=ExperimentConfig(random_seed=7)))
+        assert isinstance(coerced, DatasetInput)
+        assert coerced.config.random_seed == 7
+
+    def test_invalid_model_rejected(self) -> None:
+        from pydantic import BaseModel, ValidationError
+
+        class _Unrelated(BaseModel):
+            other: int = 0
+
+        with pytest.raises(ValidationError):
+            _coerce(DatasetInput, _Unrelated())
@@ -1,5 +1,9 @@
 """Tests for LabOS ML replication workflows."""
 
+import itertools
+import os
+import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -8,15 +12,18 @@ from agentos.lm.provider import BaseLMProvider, LMMessage, LMResponse
 from agentos.runtime.event_log import SQLiteEventLog
 from agentos.schemas.events import EventType
 
-from labos.domain.schemas import ExperimentConfig
+from labos.domain.schemas import DatasetRecord, ExperimentConfig, TrainingResult
 from labos.tools.dataset import DatasetTool
 from labos.workflows.ml_replication import (
+    _config_hash,
+    _get_environment_spec,
+    _validate_record,
     build_dag_workflow,
     run_dag_pipeline,
     run_rlm_pipeline,
 )
-from labos.tools._base import _SeqCounter
 from agentos.core.identifiers import generate_run_id
+from agentos.integrity.hashing import hash_dict
 
 
 @pytest.fixture(autouse=True)
@@ -26,11 +33,61 @@ def _clear_cache():
     DatasetTool.clear_cache()
 
 
+class TestModuleImport:
+    def test_import_does_not_load_heavy_dependencies(self) -> None:
+        code = (
+            "import sys, labos.workflows.ml_replication; "
+            "print([m for m in ('sklearn', 'matplotlib', 'labos.tools') if m in sys.modules])"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+
+class TestEnvironmentSpec:
+    def test_static_fields_reused_timestamp_fresh(self) -> None:
+        first = _get_environment_spec()
+        second = _get_environment_spec()
+        assert first.platform == second.platform
+        assert first.sklearn_version == second.sklearn_version
+        assert first.timestamp <= second.timestamp
+
+
+class TestConfigHash:
+    def test_matches_hash_dict(self) -> None:
+        config = ExperimentConfig(model_params={"C": 0.5, "max_iter": 300}, test_size=0.3)
+        assert _config_hash(config) == hash_dict(config.model_dump())
+
+    def test_tracks_mutation(self) -> None:
+        config = ExperimentConfig()
+        before = _config_hash(config)
+        config.random_seed = 7
+        assert _config_hash(config) != before
+        assert _config_hash(config) == hash_dict(config.model_dump())
+
+
+class TestValidateRecord:
+    def test_round_trips_exported_dict(self) -> None:
+        model = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="abc"
+        )
+        assert _validate_record(DatasetRecord, model.model_dump()) == model
+
+    def test_wrong_model_class_is_rejected(self) -> None:
+        data = DatasetRecord(
+            name="iris", n_samples=150, n_features=4, n_classes=3, checksum="abc"
+        ).model_dump()
+        with pytest.raises(ValueError):
+            _validate_record(TrainingResult, data)
+
+
 class TestBuildDAGWorkflow:
     def test_dag_has_six_tasks(self) -> None:
         event_log = SQLiteEventLog()
         run_id = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
         config = ExperimentConfig()
 
         dag = build_dag_workflow(config, event_log, run_id, seq)
@@ -48,7 +105,7 @@ class TestBuildDAGWorkflow:
     def test_dag_validates(self) -> None:
         event_log = SQLiteEventLog()
         run_id = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
         config = ExperimentConfig()
 
         dag = build_dag_workflow(config, event_log, run_id, seq)
@@ -57,7 +114,7 @@ class TestBuildDAGWorkflow:
     def test_dag_topological_order(self) -> None:
         event_log = SQLiteEventLog()
         run_id = generate_run_id()
-        seq = _SeqCounter(0)
+        seq = itertools.count(0).__next__
         config = ExperimentConfig()
 
         dag = build_dag_workflow(config, event_log, run_id, seq)
@@ -1,7 +1,8 @@
-"""Tests for LM providers — fallback, managed, and provider factory routing."""
+"""Tests for LM providers — fallback, managed, Ollama, and provider factory routing."""
 
+import asyncio
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from threading import Thread
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -218,6 +219,134 @@ class TestManagedProxyProvider:
             provider.complete(SAMPLE_MESSAGES)
 
 
+# ── OllamaProvider Tests ──────────────────────────────────────────────
+
+class TestOllamaProvider:
+    """Test the OllamaProvider sync and async paths with a local HTTP server."""
+
+    @pytest.fixture()
+    def mock_server(self) -> tuple[HTTPServer, str]:
+        """Start a local HTTP server mimicking the Ollama /api/chat endpoint."""
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                content_len = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(content_len))
+
+                response = {
+                    "message": {"content": f"echo:{body['messages'][-1]['content']}"},
+                    "prompt_eval_count": 7,
+                    "eval_count": 3,
+                }
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(json.dumps(response).encode())
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Suppress logs during tests
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        port = server.server_address[1]
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server, f"http://127.0.0.1:{port}"
+        server.shutdown()
+
+    def test_complete(self, mock_server: tuple[HTTPServer, str]) -> None:
+        from labos.providers.ollama import OllamaProvider
+
+        _, url = mock_server
+        provider = OllamaProvider(model="llama3", base_url=url)
+
+        result = provider.complete(SAMPLE_MESSAGES)
+        assert result.content == "echo:Hello"
+        assert result.tokens_used == 10
+        assert result.prompt_tokens == 7
+        assert result.completion_tokens == 3
+
+    def test_acomplete(self, mock_server: tuple[HTTPServer, str]) -> None:
+        from labos.providers.ollama import OllamaProvider
+
+        _, url = mock_server
+        provider = OllamaProvider(model="llama3", base_url=url)
+
+        result = asyncio.run(provider.acomplete(SAMPLE_MESSAGES))
+        assert result.content == "echo:Hello"
+
+    def test_acomplete_batch_preserves_order(
+        self, mock_server: tuple[HTTPServer, str]
+    ) -> None:
+        from labos.providers.ollama import OllamaProvider
+
+        _, url = mock_server
+        provider = OllamaProvider(model="llama3", base_url=url)
+        batch = [[LMMessage(role="user", content=f"q{i}")] for i in range(5)]
+
+        results = asyncio.run(provider.acomplete_batch(batch))
+        assert [r.content for r in results] == [f"echo:q{i}" for i in range(5)]
+
+    def test_acomplete_batch_propagates_failure(self) -> None:
+        from labos.providers.ollama import OllamaProvider
+
+        provider = OllamaProvider(base_url="http://127.0.0.1:1", timeout=1)
+        with pytest.raises(ExceptionGroup):
+            asyncio.run(provider.acomplete_batch([SAMPLE_MESSAGES, SAMPLE_MESSAGES]))
+
+
+# ── Anthropic Provider Tests ──────────────────────────────────────────
+
+class TestAnthropicPromptCaching:
+    """Request shaping and usage accounting, without the anthropic SDK."""
+
+    @staticmethod
+    def _provider() -> Any:
+        from agentos.lm.providers.anthropic import AnthropicProvider
+
+        provider = AnthropicProvider.__new__(AnthropicProvider)
+        provider._model = "claude-test"
+        provider._max_tokens = 64
+        provider._temperature = 0.0
+        provider._client = MagicMock()
+        return provider
+
+    def test_cacheable_system_sent_with_cache_control(self) -> None:
+        provider = self._provider()
+        system, api_messages = provider._split_system([
+            LMMessage(role="system", content="static prefix", cacheable=True),
+            LMMessage(role="user", content="hi"),
+        ])
+        assert system == [{
+            "type": "text",
+            "text": "static prefix",
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert api_messages == [{"role": "user", "content": "hi"}]
+
+    def test_plain_system_stays_a_string(self) -> None:
+        provider = self._provider()
+        system, _ = provider._split_system([LMMessage(role="system", content="sys")])
+        assert system == "sys"
+
+    def test_cached_tokens_counted_as_prompt_tokens(self) -> None:
+        provider = self._provider()
+        response = MagicMock()
+        response.content = [MagicMock(type="text", text="ok")]
+        response.usage = MagicMock(
+            input_tokens=10,
+            output_tokens=5,
+            cache_read_input_tokens=900,
+            cache_creation_input_tokens=None,
+        )
+        provider._client.messages.create.return_value = response
+
+        result = provider.complete([LMMessage(role="user", content="hi")])
+
+        assert result.content == "ok"
+        assert result.prompt_tokens == 910
+        assert result.tokens_used == 915
+
+
 # ── Provider Factory Routing Tests ────────────────────────────────────
 
 class TestProviderFactoryRouting:
@@ -235,6 +364,19 @@ class TestProviderFactoryRouting:
             provider = factory("gpt-4o")
             mock_cls.assert_called_once_with(model="gpt-4o", api_key="sk-test-key")
 
+    def test_provider_reused_per_model(self) -> None:
+        from agentplatform.settings import PlatformSettings
+        from agentplatform.server import _make_provider_factory
+
+        factory = _make_provider_factory(PlatformSettings(openai_api_key="sk-test-key"))
+
+        with patch("agentos.lm.providers.openai.OpenAIProvider") as mock_cls:
+            mock_cls.side_effect = lambda **kw: _StubProvider(kw["model"])
+            first = factory("gpt-4o")
+            assert factory("gpt-4o") is first
+            assert factory("gpt-4o-mini") is not first
+            assert mock_cls.call_count == 2
+
     def test_anthropic_model_routing(self) -> None:
         from agentplatform.settings import PlatformSettings
         from agentplatform.server import _make_provider_factory
@@ -311,3 +453,78 @@ class TestProviderFactoryRouting:
             mock_cls.return_value = _StubProvider("openai")
             factory("o3-mini")
             mock_cls.assert_called_once_with(model="o3-mini", api_key="sk-test")
+
+
+# ── Ollama Model Listing ──────────────────────────────────────────────
+
+class TestFetchOllamaModels:
+    """Test the async Ollama model fetch and its TTL cache."""
+
+    def test_lists_models_with_shared_client(self) -> None:
+        import httpx
+
+        from agentplatform.server import _fetch_ollama_models
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/tags"
+            return httpx.Response(200, json={"models": [{"name": "llama3", "size": 42}]})
+
+        async def run() -> list[dict[str, str]]:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await _fetch_ollama_models("http://ollama:11434/", client)
+
+        assert asyncio.run(run()) == [{"name": "llama3", "size": "42"}]
+
+    def test_unreachable_returns_empty(self) -> None:
+        import httpx
+
+        from agentplatform.server import _fetch_ollama_models
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        async def run() -> list[dict[str, str]]:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await _fetch_ollama_models("http://ollama:11434", client)
+
+        assert asyncio.run(run()) == []
+
+    def test_cache_coalesces_concurrent_misses(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from agentplatform import server
+
+        calls: list[str] = []
+
+        async def fake_fetch(base_url: str, client: Any = None) -> list[dict[str, str]]:
+            calls.append(base_url)
+            await asyncio.sleep(0.01)
+            return [{"name": "llama3", "size": "1"}]
+
+        monkeypatch.setattr(server, "_fetch_ollama_models", fake_fetch)
+        cache = server._OllamaModelCache(ttl=60)
+
+        async def run() -> None:
+            results = await asyncio.gather(*(cache.get("http://o") for _ in range(5)))
+            assert all(r == [{"name": "llama3", "size": "1"}] for r in results)
+            await cache.get("http://o")
+
+        asyncio.run(run())
+        assert calls == ["http://o"]
+
+        cache.clear()
+        asyncio.run(cache.get("http://o"))
+        assert len(calls) == 2
+
+    def test_cache_skips_empty_results(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from agentplatform import server
+
+        calls: list[str] = []
+
+        async def fake_fetch(base_url: str, client: Any = None) -> list[dict[str, str]]:
+            calls.append(base_url)
+            return []
+
+        monkeypatch.setattr(server, "_fetch_ollama_models", fake_fetch)
+        cache = server._OllamaModelCache(ttl=60)
+        asyncio.run(cache.get("http://o"))
+        asyncio.run(cache.get("http://o"))
+        assert len(calls) == 2
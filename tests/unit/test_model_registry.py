@@ -75,6 +75,13 @@ class TestRegisterModel:
         # Restore
         register_model("gpt-4o", original)
 
+    def test_register_bumps_version(self) -> None:
+        from agentos.lm import model_registry
+
+        before = model_registry.registry_version()
+        register_model("gpt-4o", get_capabilities("gpt-4o"))
+        assert model_registry.registry_version() == before + 1
+
 
 class TestListModels:
     def test_list_known_models(self) -> None:
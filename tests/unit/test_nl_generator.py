@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import MagicMock
@@ -14,7 +15,7 @@ from agentos.runtime.domain_registry import (
     DomainRegistry,
     ToolManifestEntry,
 )
-from agentplatform.nl_generator import WorkflowGenerator, _format_tool_list
+from agentplatform.nl_generator import _FENCE_RE, WorkflowGenerator, _format_tool_list
 
 
 # ── Helpers ────────────────────────────────────────────────────────
@@ -227,6 +228,70 @@ class TestWorkflowGenerator:
         assert positions[0]["x"] != positions[1]["x"]
 
 
+class TestGenerateBatch:
+    def test_results_in_order_with_bounded_concurrency(self) -> None:
+        class SlowNamedProvider(BaseLMProvider):
+            """Names each workflow after its description; tracks peak concurrency."""
+
+            def __init__(self) -> None:
+                self.active = 0
+                self.peak = 0
+
+            @property
+            def name(self) -> str:
+                return "slow"
+
+            def complete(self, messages: list[LMMessage]) -> LMResponse:
+                raise AssertionError("batch generation must use acomplete")
+
+            async def acomplete(self, messages: list[LMMessage]) -> LMResponse:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                wf = json.loads(json.dumps(_VALID_WORKFLOW))
+                wf["workflow"]["name"] = messages[-1].content
+                return LMResponse(content=json.dumps(wf), tokens_used=1)
+
+        provider = SlowNamedProvider()
+        gen = WorkflowGenerator(provider_factory=lambda m: provider, registry=_make_registry())
+        descriptions = [f"wf-{i}" for i in range(6)]
+
+        results = asyncio.run(gen.generate_batch(descriptions, max_concurrency=2))
+
+        assert [wf.name for wf, _ in results] == descriptions
+        assert provider.peak == 2
+
+    def test_generate_async_falls_back_to_complete(self) -> None:
+        gen = WorkflowGenerator(
+            provider_factory=lambda m: MockProvider(_VALID_WORKFLOW),
+            registry=_make_registry(),
+        )
+        wf, explanation = asyncio.run(gen.generate_async("Research X"))
+        assert wf.name == "Test Workflow"
+        assert explanation == "Two agents: one researches, one writes."
+
+
+class TestFenceStripping:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '```json\n{"a": 1}\n```',
+            '```JSON\n{"a": 1}```',
+            '```\n{"a": 1}\n```',
+            '```{"a": 1}```',
+            '```json\n{"a": 1}',
+        ],
+    )
+    def test_fence_variants(self, raw: str) -> None:
+        match = _FENCE_RE.fullmatch(raw)
+        assert match is not None
+        assert json.loads(match.group(1).strip()) == {"a": 1}
+
+    def test_unfenced_text_does_not_match(self) -> None:
+        assert _FENCE_RE.fullmatch('{"a": 1}') is None
+
+
 class TestFormatToolList:
     def test_format_deduplicates(self) -> None:
         """Tools from multiple packs with same name appear once."""
@@ -243,3 +308,28 @@ class TestFormatToolList:
         ))
         result = _format_tool_list(reg)
         assert result.count("tool_a") == 1
+
+
+class TestSystemPromptCache:
+    def test_prompt_reused_until_registry_changes(self) -> None:
+        reg = _make_registry()
+        gen = WorkflowGenerator(lambda m: MockProvider(_VALID_WORKFLOW), reg)
+
+        first = gen._system_prompt()
+        assert "file_read" in first
+        assert gen._system_prompt() is first
+
+        reg.register(DomainPackManifest(
+            name="extra", display_name="Extra", description="", version="0.1.0",
+            tools=[ToolManifestEntry(name="tool_z", description="Z", side_effect="READ", factory="x:X")],
+            role_templates=[], workflows=[],
+        ))
+        updated = gen._system_prompt()
+        assert "tool_z" in updated
+        assert gen._system_prompt() is updated
+
+    def test_prompt_shared_across_generators(self) -> None:
+        reg = _make_registry()
+        first = WorkflowGenerator(lambda m: MockProvider(_VALID_WORKFLOW), reg)
+        second = WorkflowGenerator(lambda m: MockProvider(_VALID_WORKFLOW), reg)
+        assert second._system_prompt() is first._system_prompt()
@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -91,6 +92,36 @@ class TestSettingsManager:
         assert loaded.openai_api_key == "sk-test"
         assert loaded.default_model == "gpt-4o"
 
+    def test_save_leaves_no_temp_file(self, tmp_dir: Path) -> None:
+        sm = SettingsManager(str(tmp_dir))
+        sm.save(PlatformSettings(default_model="gpt-4o"))
+        sm.save(PlatformSettings(default_model="gpt-4o-mini"))
+
+        assert [p.name for p in tmp_dir.iterdir()] == ["settings.json"]
+        assert sm.load().default_model == "gpt-4o-mini"
+
+    def test_concurrent_saves_do_not_collide(self, tmp_dir: Path) -> None:
+        sm = SettingsManager(str(tmp_dir))
+        models = [f"model-{i}" for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda m: sm.save(PlatformSettings(default_model=m)), models))
+
+        assert [p.name for p in tmp_dir.iterdir()] == ["settings.json"]
+        assert sm.load().default_model in models
+
+    def test_failed_save_removes_temp_file(
+        self, tmp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sm = SettingsManager(str(tmp_dir))
+
+        def _fail(src: str, dst: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("agentplatform.settings.os.replace", _fail)
+        with pytest.raises(OSError, match="disk full"):
+            sm.save(PlatformSettings())
+        assert list(tmp_dir.iterdir()) == []
+
     def test_update_partial(self, tmp_dir: Path) -> None:
         sm = SettingsManager(str(tmp_dir))
         # Save initial
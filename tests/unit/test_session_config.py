@@ -99,3 +99,16 @@ class TestSessionConfig:
         assert restored.domain_pack == config.domain_pack
         assert restored.session_id == config.session_id
         assert len(restored.agents) == 1
+
+    def test_total_agent_count(self) -> None:
+        config = SessionConfig(
+            domain_pack="labos",
+            workflow="multi_agent_research",
+            agents=[
+                AgentSlotConfig(role="planner", model="m"),
+                AgentSlotConfig(role="analyst", model="m", count=3),
+            ],
+            workspace_root="/tmp/w",
+        )
+        assert config.total_agent_count == 4
+        assert "total_agent_count" not in config.model_dump()
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
 import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import get_args
 
 import pytest
 
 from agentos.lm.provider import BaseLMProvider, LMMessage, LMResponse
 from agentos.runtime.domain_registry import DomainRegistry
-from agentos.schemas.events import EventType
+from agentos.schemas.events import EventType, RunStarted
 from agentos.schemas.session import AgentSlotConfig, SessionConfig
 
 from agentplatform._domain_manifests import register_builtin_packs
-from agentplatform.orchestrator import SessionOrchestrator, SessionState
+from agentplatform.api_schemas import SessionStateName
+from agentplatform.orchestrator import SessionOrchestrator, SessionState, _NotifyingEventLog
 
 
 class _FinishImmediatelyProvider(BaseLMProvider):
@@ -32,6 +39,24 @@ class _FinishImmediatelyProvider(BaseLMProvider):
         )
 
 
+class _ConcurrencyTrackingProvider(_FinishImmediatelyProvider):
+    """Finishes after a short delay and records the peak number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+
+    def complete(self, messages: list[LMMessage]) -> LMResponse:
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        time.sleep(0.2)
+        with self._lock:
+            self._active -= 1
+        return super().complete(messages)
+
+
 @pytest.fixture()
 def registry() -> DomainRegistry:
     reg = DomainRegistry()
@@ -40,8 +65,10 @@ def registry() -> DomainRegistry:
 
 
 @pytest.fixture()
-def orchestrator(registry: DomainRegistry) -> SessionOrchestrator:
-    return SessionOrchestrator(registry)
+def orchestrator(registry: DomainRegistry) -> Iterator[SessionOrchestrator]:
+    orch = SessionOrchestrator(registry)
+    yield orch
+    orch.shutdown()
 
 
 @pytest.fixture()
@@ -140,6 +167,199 @@ class TestSessionLifecycle:
         # First event should be SessionStarted
         assert events[0].event_type == EventType.SESSION_STARTED
 
+    def test_session_finished_emitted_once_with_next_seq(
+        self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
+    ) -> None:
+        sid = orchestrator.create_session(labos_config)
+        orchestrator.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+        deadline = time.monotonic() + 5.0
+        while (
+            orchestrator.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+        orchestrator.stop_session(sid)  # no-op once finished
+
+        events = orchestrator.get_session_events(sid)
+        finished = [e for e in events if e.event_type == EventType.SESSION_FINISHED]
+        assert len(finished) == 1
+        assert finished[0].seq == max(e.seq for e in events)
+        assert len({e.seq for e in events}) == len(events)
+
+    def test_sessions_beyond_pool_size_queue_and_complete(
+        self, registry: DomainRegistry, labos_config: SessionConfig
+    ) -> None:
+        orch = SessionOrchestrator(registry, max_sessions=1)
+        sids = []
+        for i in range(2):
+            config = labos_config.model_copy(
+                update={
+                    "session_id": f"queued-{i}",
+                    "workspace_root": f"{labos_config.workspace_root}/{i}",
+                }
+            )
+            sid = orch.create_session(config)
+            orch.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+            sids.append(sid)
+        deadline = time.monotonic() + 10.0
+        while (
+            any(orch.get_session_state(s) == SessionState.RUNNING for s in sids)
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+        orch.shutdown()
+        assert [orch.get_session_state(s) for s in sids] == [SessionState.SUCCEEDED] * 2
+
+    def test_shutdown_stops_queued_sessions(
+        self, registry: DomainRegistry, labos_config: SessionConfig
+    ) -> None:
+        orch = SessionOrchestrator(registry, max_sessions=1)
+        sids = []
+        for i in range(2):
+            config = labos_config.model_copy(
+                update={
+                    "session_id": f"shutdown-{i}",
+                    "workspace_root": f"{labos_config.workspace_root}/{i}",
+                }
+            )
+            sid = orch.create_session(config)
+            orch.start_session(sid, lm_provider=_ConcurrencyTrackingProvider())
+            sids.append(sid)
+        orch.shutdown()
+
+        queued = sids[1]
+        assert orch.get_session_state(queued) == SessionState.STOPPED
+        finished = [
+            e for e in orch.get_session_events(queued)
+            if e.event_type == EventType.SESSION_FINISHED
+        ]
+        assert [e.payload["outcome"] for e in finished] == ["STOPPED"]
+
+    def test_start_after_shutdown_leaves_session_created(
+        self, registry: DomainRegistry, labos_config: SessionConfig
+    ) -> None:
+        orch = SessionOrchestrator(registry)
+        sid = orch.create_session(labos_config)
+        orch.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            orch.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+        assert orch.get_session_state(sid) == SessionState.CREATED
+
+    def test_independent_role_slots_run_in_parallel(
+        self, orchestrator: SessionOrchestrator, tmp_path: object
+    ) -> None:
+        config = SessionConfig(
+            domain_pack="labos",
+            workflow="multi_agent_research",
+            agents=[
+                AgentSlotConfig(role="data_experimenter", model="mock"),
+                AgentSlotConfig(role="data_experimenter", model="mock"),
+                AgentSlotConfig(role="planner", model="mock"),
+            ],
+            workspace_root=str(tmp_path),
+            max_parallel=2,
+        )
+        provider = _ConcurrencyTrackingProvider()
+        sid = orchestrator.create_session(config)
+        orchestrator.start_session(sid, lm_provider=provider)
+        deadline = time.monotonic() + 10.0
+        while (
+            orchestrator.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+
+        assert orchestrator.get_session_state(sid) == SessionState.SUCCEEDED
+        # Both data_experimenters depend only on the planner, so they overlap
+        assert provider.peak == 2
+
+    def test_skipped_role_keeps_pipeline_order(
+        self, orchestrator: SessionOrchestrator, tmp_path: object
+    ) -> None:
+        config = SessionConfig(
+            domain_pack="labos",
+            workflow="multi_agent_research",
+            agents=[
+                AgentSlotConfig(role="writer", model="mock"),
+                AgentSlotConfig(role="planner", model="mock"),
+            ],
+            workspace_root=str(tmp_path),
+            max_parallel=2,
+        )
+        provider = _ConcurrencyTrackingProvider()
+        sid = orchestrator.create_session(config)
+        orchestrator.start_session(sid, lm_provider=provider)
+        deadline = time.monotonic() + 10.0
+        while (
+            orchestrator.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+
+        assert orchestrator.get_session_state(sid) == SessionState.SUCCEEDED
+        # The writer waits on the planner through the unstaffed middle phases
+        assert provider.peak == 1
+
+    def test_provider_built_once_per_model(
+        self, registry: DomainRegistry, labos_config: SessionConfig
+    ) -> None:
+        requested: list[str] = []
+
+        def factory(model: str) -> BaseLMProvider:
+            requested.append(model)
+            return _FinishImmediatelyProvider()
+
+        orch = SessionOrchestrator(registry, lm_provider_factory=factory)
+        config = labos_config.model_copy(
+            update={
+                "agents": [
+                    AgentSlotConfig(role="planner", model="mock"),
+                    AgentSlotConfig(role="data_experimenter", model="mock"),
+                    AgentSlotConfig(role="analyst", model="other"),
+                ]
+            }
+        )
+        sid = orch.create_session(config)
+        orch.start_session(sid)
+        deadline = time.monotonic() + 10.0
+        while (
+            orch.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+        orch.shutdown()
+
+        assert orch.get_session_state(sid) == SessionState.SUCCEEDED
+        assert sorted(requested) == ["mock", "other"]
+
+    def test_set_provider_factory_applies_to_next_session(
+        self, registry: DomainRegistry, labos_config: SessionConfig
+    ) -> None:
+        used: list[str] = []
+
+        def make_factory(tag: str) -> Callable[[str], BaseLMProvider]:
+            def factory(model: str) -> BaseLMProvider:
+                used.append(tag)
+                return _FinishImmediatelyProvider()
+
+            return factory
+
+        orch = SessionOrchestrator(registry, lm_provider_factory=make_factory("old"))
+        orch.set_provider_factory(make_factory("new"))
+        sid = orch.create_session(labos_config)
+        orch.start_session(sid)
+        deadline = time.monotonic() + 10.0
+        while (
+            orch.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+        orch.shutdown()
+
+        assert orch.get_session_state(sid) == SessionState.SUCCEEDED
+        assert used and set(used) == {"new"}
+
     def test_stop_session(
         self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
     ) -> None:
@@ -185,6 +405,22 @@ class TestSessionQueries:
         assert info["state"] == "CREATED"
         assert info["domain_pack"] == "labos"
         assert info["workflow"] == "multi_agent_research"
+        assert info["event_count"] == 0
+
+    def test_session_info_event_count_matches_log(
+        self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
+    ) -> None:
+        sid = orchestrator.create_session(labos_config)
+        orchestrator.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+        deadline = time.monotonic() + 5.0
+        while (
+            orchestrator.get_session_state(sid) == SessionState.RUNNING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.05)
+
+        info = orchestrator.get_session_info(sid)
+        assert info["event_count"] == len(orchestrator.get_session_events(sid))
 
     def test_get_events_after_seq(
         self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
@@ -198,8 +434,81 @@ class TestSessionQueries:
             filtered = orchestrator.get_session_events(sid, after_seq=1)
             assert len(filtered) < len(all_events)
 
+    def test_events_json_matches_event_log(
+        self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
+    ) -> None:
+        sid = orchestrator.create_session(labos_config)
+        orchestrator.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+        time.sleep(2.0)
+
+        events = orchestrator.get_session_events(sid)
+        encoded = orchestrator.get_session_events_json(sid)
+        assert [seq for seq, _ in encoded] == [e.seq for e in events]
+        first = json.loads(encoded[0][1])
+        assert first["event_type"] == events[0].event_type.value
+        assert first["timestamp"] == events[0].timestamp.isoformat()
+
+        page = orchestrator.get_session_events_json(sid, after_seq=1, limit=2)
+        assert [seq for seq, _ in page] == [e.seq for e in events if e.seq >= 1][:2]
+
+    def test_events_json_kept_in_seq_order(self, tmp_path: Path) -> None:
+        log = _NotifyingEventLog(str(tmp_path / "events.db"), lambda: None)
+        for seq in (0, 2, 1, 3):
+            log.append(RunStarted(run_id="run-1", seq=seq, payload={}))
+
+        assert [seq for seq, _ in log.encoded_from_seq("run-1", 0)] == [0, 1, 2, 3]
+        assert [seq for seq, _ in log.encoded_from_seq("run-1", 2)] == [2, 3]
+
+    def test_events_json_window_is_bounded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("agentplatform.orchestrator._ENCODED_WINDOW", 3)
+        log = _NotifyingEventLog(str(tmp_path / "events.db"), lambda: None)
+        for seq in range(6):
+            log.append(RunStarted(run_id="run-1", seq=seq, payload={"i": seq}))
+
+        assert len(log._encoded["run-1"]) == 3
+        assert log.event_count("run-1") == 6
+        # Older pages fall back to SQLite with the same encoding
+        page = log.encoded_from_seq("run-1", 1, limit=3)
+        assert [seq for seq, _ in page] == [1, 2, 3]
+        assert json.loads(page[0][1])["payload"] == {"i": 1}
+        assert [seq for seq, _ in log.encoded_from_seq("run-1", 4)] == [4, 5]
+
     def test_unknown_session_raises(
         self, orchestrator: SessionOrchestrator
     ) -> None:
         with pytest.raises(KeyError, match="not found"):
             orchestrator.get_session_state("nonexistent-session-id")
+
+
+class TestSessionEventNotifications:
+    def test_start_wakes_subscriber(
+        self, orchestrator: SessionOrchestrator, labos_config: SessionConfig
+    ) -> None:
+        sid = orchestrator.create_session(labos_config)
+
+        async def _wait_for_first_event() -> None:
+            wakeup = orchestrator.subscribe_events(sid)
+            try:
+                orchestrator.start_session(sid, lm_provider=_FinishImmediatelyProvider())
+                await asyncio.wait_for(wakeup.wait(), timeout=5.0)
+            finally:
+                orchestrator.unsubscribe_events(sid, wakeup)
+
+        asyncio.run(_wait_for_first_event())
+        assert orchestrator.get_session_events(sid)
+
+    def test_subscribe_unknown_session_raises(
+        self, orchestrator: SessionOrchestrator
+    ) -> None:
+        async def _subscribe() -> None:
+            orchestrator.subscribe_events("nonexistent-session-id")
+
+        with pytest.raises(KeyError, match="not found"):
+            asyncio.run(_subscribe())
+
+
+class TestSessionStateName:
+    def test_literal_matches_enum(self) -> None:
+        assert set(get_args(SessionStateName)) == {s.value for s in SessionState}
@@ -103,6 +103,13 @@ class TestTemplateStore:
         assert alpha.agent_count == 1
         assert alpha.estimated_cost == "~$0.10"
 
+    def test_preload_reads_files_up_front(self, store_dir: Path) -> None:
+        store = TemplateStore(store_dir)
+        store.preload()
+        for path in store_dir.glob("*.json"):
+            path.unlink()
+        assert store.get("tpl_alpha").name == "Alpha"
+
     def test_empty_dir(self, tmp_path: Path) -> None:
         store = TemplateStore(tmp_path)
         assert store.list() == []
@@ -1,5 +1,6 @@
 """Tests for the filesystem-based workflow store."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -107,3 +108,28 @@ class TestWorkflowStore:
         store.save(wf)
         second = store.load(wf.id)
         assert second.updated_at >= first.updated_at
+
+    def test_load_reuses_parsed_workflow(self, store: WorkflowStore) -> None:
+        wf = _make_workflow()
+        store.save(wf)
+        assert store.load(wf.id) is store.load(wf.id)
+
+    def test_load_sees_external_edit(self, store: WorkflowStore) -> None:
+        wf = _make_workflow()
+        store.save(wf)
+        store.load(wf.id)
+
+        path = store.base_dir / f"{wf.id}.json"
+        data = json.loads(path.read_text())
+        data["name"] = "Edited elsewhere"
+        path.write_text(json.dumps(data))
+
+        assert store.load(wf.id).name == "Edited elsewhere"
+
+    def test_load_after_delete_raises(self, store: WorkflowStore) -> None:
+        wf = _make_workflow()
+        store.save(wf)
+        store.load(wf.id)
+        store.delete(wf.id)
+        with pytest.raises(FileNotFoundError, match="not found"):
+            store.load(wf.id)